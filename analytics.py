@@ -0,0 +1,67 @@
+"""Season analytics over saved auctions, without running the bot.
+
+Reads one or more auction folders (JSON or SQLite storage), oldest season
+first, and prints price per OVR point, spend by tier, inflation across the
+queue, manager efficiency and steal rate, the same report as /analytics.
+
+    python analytics.py                          # '.' and every auction under auctions/
+    python analytics.py archive/2024 archive/2025 auctions/1234
+"""
+import argparse
+import os
+import time
+
+import bot as auction_bot
+
+def auction_dirs():
+    """The default folders: the top-level auction (if any) and every auctions/<id>."""
+    dirs = [d for d in ["."] if has_auction(d)]
+    if os.path.isdir(auction_bot.AUCTIONS_DIR):
+        for name in sorted(os.listdir(auction_bot.AUCTIONS_DIR)):
+            path = os.path.join(auction_bot.AUCTIONS_DIR, name)
+            if has_auction(path):
+                dirs.append(path)
+    return dirs
+
+def has_auction(path):
+    return any(os.path.exists(os.path.join(path, f)) for f in (auction_bot.DATA_FILE, auction_bot.SQLITE_FILE))
+
+def load_auction(path):
+    """The auction data saved in a folder, journal replayed and rosters hydrated."""
+    sqlite_file = os.path.join(path, auction_bot.SQLITE_FILE)
+    if os.path.exists(sqlite_file):
+        state = auction_bot.SqliteAuctionState(auction_bot.SqliteStorage(sqlite_file, path))
+    else:
+        state = auction_bot.AuctionState(os.path.join(path, auction_bot.DATA_FILE),
+                                         os.path.join(path, auction_bot.JOURNAL_FILE))
+    return state.data
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="Auction folders, oldest season first")
+    parser.add_argument("--top", type=int, default=10, help="Managers to list in the efficiency table")
+    args = parser.parse_args()
+    if auction_bot.np is None:
+        parser.error("analytics needs NumPy: pip install numpy")
+
+    paths = args.paths or auction_dirs()
+    missing = [path for path in paths if not has_auction(path)]
+    if missing:
+        parser.error(f"no auction data in: {', '.join(missing)}")
+    if not paths:
+        parser.error("no auctions found; pass the folders to analyse")
+
+    started = time.perf_counter()
+    seasons = [load_auction(path) for path in paths]
+    loaded = time.perf_counter()
+    columns, names = auction_bot.roster_columns(seasons)
+    stats = auction_bot.season_analytics(columns, len(names))
+    computed = time.perf_counter()
+
+    print(f"--- {len(seasons)} auction(s), {len(columns['ovr']):,} signings ---")
+    for title, text in auction_bot.analytics_report(stats, names, top=args.top):
+        print(f"\n{title}\n{text}")
+    print(f"\nLoaded in {loaded - started:.2f}s, analysed in {(computed - loaded) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""Headless load generator for the bidding pipeline.
+
+Runs a full auction through the real on_message / call_next_player /
+countdown code against stand-in Discord objects, with no network, and
+reports bid-accept latency, lost or overwritten bids and lots per minute.
+With --virtual the whole season (auction, draft and steals) runs on a
+VirtualClock and finishes in well under a second of countdown waiting.
+
+    python bench.py --managers 8 --players 60 --rate 2
+    python bench.py --virtual --broke 3 --countdown 5 --pause 2
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+import types
+
+import bot as auction_bot
+
+BENCH_CHANNEL_ID = 4242 # Never the AUCTION_CHANNEL_ID, so nothing touches the real data files
+BENCH_GUILD_ID = 1
+
+# --- Stand-in Discord Objects ---
+
+class FakeSentMessage:
+    """What channel.send() returns; the lot embed is edited through it."""
+    def __init__(self, channel, content, embed):
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+
+    async def edit(self, content=None, embed=None):
+        self.channel.edits += 1
+        self.embed = embed or self.embed
+
+class FakeChannel:
+    def __init__(self, id):
+        self.id = id
+        self.sent = []  # Every message the bot posted, in order
+        self.edits = 0
+        self.private = 0 # Ephemeral replies, seen only by the user who asked
+
+    async def send(self, content=None, embed=None, delete_after=None, **kwargs):
+        message = FakeSentMessage(self, content, embed)
+        self.sent.append(message)
+        return message
+
+class FakeUser:
+    def __init__(self, name):
+        self.display_name = name
+        self.name = name
+        self.mention = f"@{name}"
+        self.bot = False
+        self.id = abs(hash(name))
+
+class FakeMessage:
+    def __init__(self, channel, author, content):
+        self.channel = channel
+        self.author = author
+        self.content = content
+        self.guild = types.SimpleNamespace(id=BENCH_GUILD_ID)
+
+class FakeResponse:
+    def __init__(self, channel):
+        self.channel = channel
+        self._done = False
+
+    def is_done(self):
+        return self._done
+
+    async def send_message(self, content=None, **kwargs):
+        self._done = True
+        if kwargs.get("ephemeral"):
+            self.channel.private += 1
+            return
+        await self.channel.send(content, **kwargs)
+
+class FakeInteraction:
+    """Just enough of discord.Interaction to drive a slash command callback."""
+    def __init__(self, channel, user):
+        self.channel = channel
+        self.channel_id = channel.id
+        self.guild_id = BENCH_GUILD_ID
+        self.user = user
+        self.response = FakeResponse(channel)
+        self.followup = types.SimpleNamespace(send=channel.send)
+        self.data = {"name": "bench"}
+
+# --- Setup ---
+
+def make_players(count, rng):
+    """A synthetic pool spread over the same OVR tiers /start sorts by."""
+    players = {}
+    for i in range(count):
+        ovr = rng.randint(75, 91)
+        name = f"Player {i:03d}"
+        players[name.lower()] = {
+            "name": name,
+            "team": f"Club {i % 20}",
+            "ovr": ovr,
+            "base_price": max(1, ovr - 74) * 1_000_000,
+        }
+    return players
+
+async def setup_auction(args, rng):
+    """Creates a fresh auction with M managers and a synthetic player pool."""
+    ctx = await auction_bot.create_context(BENCH_CHANNEL_ID)
+    await ctx.load()
+    data = ctx.auction.data
+    managers = []
+    for i in range(args.managers):
+        name = f"Manager{i}"
+        data["managers"][name.lower()] = {
+            "name": name,
+            "budget": args.budget * 1_000_000,
+            "spent": 0,
+            "players": [],
+            "retained_player": None,
+        }
+        managers.append(FakeUser(name))
+    data["player_cap"] = args.cap
+    ctx.auction.commit("manager", "Benchmark managers")
+    for key, player in make_players(args.players, rng).items():
+        ctx.player_db.put(key, player)
+    return ctx, managers
+
+# --- Measurement ---
+
+class Recorder:
+    """Watches every commit to line accepted bids up with the messages that sent them."""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.sent = []          # [lot, bidder key, amount, sent at, accepted at]
+        self.pending = {}       # (lot, bidder key, amount) -> entries awaiting acceptance
+        self.lot_price = {}     # lot -> last accepted bid
+        self.overwritten = 0    # Accepted bids that lowered the lot's price
+        self.price_changes = 0  # Each one restarts the lot's countdown
+        self.lots_closed = 0
+        self._commit = ctx.auction.commit
+        ctx.auction.commit = self.commit
+
+    def bid_sent(self, lot, bidder_key, amount):
+        entry = [lot, bidder_key, amount, time.perf_counter(), None]
+        self.sent.append(entry)
+        self.pending.setdefault((lot, bidder_key, amount), []).append(entry)
+
+    def commit(self, kind, note="", removed_players=None):
+        data = self.ctx.auction.data
+        if kind in ("bid", "maxbid"):
+            for lot, bid, bidder in live_lots(data):
+                if bidder is None or bid == self.lot_price.get(lot, 0):
+                    continue # This commit didn't touch this lot
+                if bid < self.lot_price.get(lot, 0):
+                    self.overwritten += 1
+                self.price_changes += 1
+                self.lot_price[lot] = bid
+                waiting = self.pending.get((lot, bidder, bid))
+                if waiting:
+                    waiting.pop(0)[4] = time.perf_counter()
+        elif kind == "sale" or (kind == "lot" and note.endswith("unsold (no bids)")):
+            self.lots_closed += 1
+        return self._commit(kind, note, removed_players)
+
+    def report(self, elapsed, wall, channel):
+        latencies = sorted((e[4] - e[3]) * 1000 for e in self.sent if e[4] is not None)
+        # A bid above the price its lot finally went for should have won it
+        lost = sum(1 for e in self.sent if e[4] is None and e[2] > self.lot_price.get(e[0], 0))
+        rejected = sum(1 for m in channel.sent if m.content and m.content.startswith(("🚫", "❌")))
+
+        print(f"Bids sent:        {len(self.sent)}")
+        print(f"Bids accepted:    {len(latencies)}")
+        print(f"Bids rejected:    {rejected}")
+        print(f"Bids lost:        {lost}")
+        print(f"Bids overwritten: {self.overwritten}")
+        if latencies:
+            print(f"Accept latency:   p50 {percentile(latencies, 50):.3f} ms | "
+                  f"p95 {percentile(latencies, 95):.3f} ms | p99 {percentile(latencies, 99):.3f} ms")
+        print(f"Lots closed:      {self.lots_closed} in {elapsed:.1f}s "
+              f"({self.lots_closed / elapsed * 60:.1f} lots/min, {wall:.2f}s wall time)")
+        print(f"Price changes:    {self.price_changes} ({self.price_changes / max(1, self.lots_closed):.1f} per lot)")
+        print(f"Messages sent:    {len(channel.sent)} (+{channel.edits} edits, +{channel.private} private replies)")
+
+def live_lots(data):
+    """(player name, bid, bidder) of every lot open for bids."""
+    if data.get("lots"):
+        return [(lot["player"]["name"], lot["current_bid"], lot["current_bidder"]) for lot in data["lots"].values()]
+    if data["on_the_block"]:
+        return [(data["on_the_block"]["name"], data["current_bid"], data["current_bidder"])]
+    return []
+
+def percentile(values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(values) - 1, round(p / 100 * len(values) + 0.5) - 1))
+    return values[index]
+
+# --- Load Generation ---
+
+async def manager_agent(ctx, recorder, channel, user, args, rng, valuations, all_in, max_bidder):
+    """One manager acting at random (Poisson) intervals until the season ends:
+    bidding on lots, making draft picks and stealing other managers' picks.
+    A max bidder sets one /maxbid per lot instead of typing bids (except on
+    parallel lots, which only take typed bids)."""
+    key = user.display_name.lower()
+    max_bid_lots = set()
+    while True:
+        await auction_bot.bot.clock.sleep(rng.expovariate(args.rate))
+        data = ctx.auction.data
+        manager = data["managers"][key]
+        if auction_bot.get_player_count(manager) >= data["player_cap"]:
+            continue
+
+        if data["auction_state"] == "drafting":
+            await draft_turn(ctx, channel, user, args, rng)
+            continue
+        if data["auction_state"] == "lots" and data["lots"]:
+            # Parallel lots: look at one of them, bid as `lot:amount`
+            number, lot = rng.choice(list(data["lots"].items()))
+            player, current_bid, current_bidder = lot["player"], lot["current_bid"], lot["current_bidder"]
+            prefix = f"{number}:"
+            committed, leading = auction_bot.outstanding_bids(data, key, skip=number)
+        elif data["auction_state"] == "bidding" and data["on_the_block"]:
+            player, current_bid, current_bidder = data["on_the_block"], data["current_bid"], data["current_bidder"]
+            prefix, committed, leading = "", 0, 0
+        else:
+            continue
+        if current_bidder == key:
+            continue
+
+        if all_in and manager["budget"] - committed > current_bid:
+            # Burn the whole budget so draft mode kicks in
+            amount = (manager["budget"] - committed) // 1_000_000
+            recorder.bid_sent(player["name"], key, amount * 1_000_000)
+            await auction_bot.on_message(FakeMessage(channel, user, f"{prefix}{amount}"))
+            continue
+
+        # Spend at most a fair share of what's left on any one player
+        slots_left = data["player_cap"] - auction_bot.get_player_count(manager) - leading
+        if slots_left <= 0:
+            continue
+        limit = valuations.setdefault((key, player["name"]), rng.uniform(1, 4) * player["base_price"])
+        limit = min(limit, (manager["budget"] - committed) // slots_left)
+
+        if max_bidder and not prefix:
+            if player["name"] not in max_bid_lots:
+                max_bid_lots.add(player["name"])
+                await bot_command("maxbid")(FakeInteraction(channel, user), int(limit // 1_000_000))
+            continue
+
+        amount = current_bid // 1_000_000 + rng.randint(1, 3)
+        if amount * 1_000_000 > limit:
+            continue
+
+        recorder.bid_sent(player["name"], key, amount * 1_000_000)
+        await auction_bot.on_message(FakeMessage(channel, user, f"{prefix}{amount}"))
+
+async def draft_turn(ctx, channel, user, args, rng):
+    """Picks a player when it's this manager's turn, or steals someone else's pick."""
+    data = ctx.auction.data
+    key = user.display_name.lower()
+    player = data["on_the_block"]
+    if player is None:
+        if data["draft_order"][data["draft_pick_index"]] == key and ctx.player_db.data:
+            await bot_command("draft")(FakeInteraction(channel, user), rng.choice(list(ctx.player_db.data.values()))["name"])
+    elif (data["managers"][key]["budget"] >= player["base_price"] and rng.random() < args.steal
+          and auction_bot.bot.timers.remaining(ctx.steal_timer) is not None):
+        await bot_command("steal")(FakeInteraction(channel, user))
+
+def auction_over(ctx, recorder, args):
+    data = ctx.auction.data
+    if args.lots and recorder.lots_closed >= args.lots:
+        return True
+    if data["on_the_block"] or data.get("lots"):
+        return False
+    if not ctx.player_db.data:
+        return True # Also ends a draft that ran out of players
+    if data["auction_state"] != "idle":
+        return False
+    queue_done = data["auction_queue"] and data["auction_queue_index"] >= len(data["auction_queue"])
+    teams_full = all(auction_bot.get_player_count(m) >= data["player_cap"] for m in data["managers"].values())
+    return queue_done or teams_full
+
+async def run(args):
+    rng = random.Random(args.seed)
+    random.seed(args.seed) # /start shuffles the tiers with the global RNG
+    auction_bot.BID_COUNTDOWN_SECONDS = args.countdown
+    auction_bot.STEAL_COUNTDOWN_SECONDS = args.steal_window
+    auction_bot.NEXT_PLAYER_PAUSE_SECONDS = args.pause
+    auction_bot.START_PAUSE_SECONDS = 0 if not args.virtual else auction_bot.START_PAUSE_SECONDS
+    clock = auction_bot.bot.clock
+
+    ctx, managers = await setup_auction(args, rng)
+    ctx.auction.data["parallel_lots"] = args.parallel
+    recorder = Recorder(ctx)
+    channel = FakeChannel(BENCH_CHANNEL_ID)
+
+    started, wall_started = clock.now(), time.perf_counter()
+    start = bot_command("start")
+    await start(FakeInteraction(channel, FakeUser("admin")))
+
+    valuations = {}
+    agents = [asyncio.create_task(manager_agent(ctx, recorder, channel, user, args, rng, valuations,
+                                                i < args.broke, args.broke <= i < args.broke + args.maxbid))
+              for i, user in enumerate(managers)]
+    while not auction_over(ctx, recorder, args):
+        await clock.sleep(0.5)
+    elapsed, wall = clock.now() - started, time.perf_counter() - wall_started
+
+    for agent in agents:
+        agent.cancel()
+    ctx.cancel_timers()
+    await ctx.flush()
+
+    print(f"--- {args.managers} managers, {args.players} players, {args.rate} bids/s each, "
+          f"{args.countdown}s countdown, {auction_bot.STORAGE_BACKEND} storage"
+          f"{f', {args.parallel} parallel lots' if args.parallel > 1 else ''}"
+          f"{', virtual clock' if args.virtual else ''} ---")
+    recorder.report(elapsed, wall, channel)
+    drafted = sum(p.how == "draft" for m in ctx.auction.data["managers"].values() for p in m["players"])
+    print(f"Draft picks:      {drafted}")
+
+def bot_command(name):
+    return auction_bot.tree.get_command(name).callback
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--managers", type=int, default=8, help="Number of bidding managers (M)")
+    parser.add_argument("--players", type=int, default=60, help="Size of the synthetic player pool")
+    parser.add_argument("--rate", type=float, default=2.0, help="Bids per second per manager")
+    parser.add_argument("--budget", type=int, default=500, help="Starting budget per manager, in millions")
+    parser.add_argument("--cap", type=int, default=18, help="Team player cap")
+    parser.add_argument("--countdown", type=float, default=0.5, help="Seconds a lot stays open after a bid")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seconds between lots")
+    parser.add_argument("--steal-window", type=float, default=1.0, help="Seconds a draft pick can be stolen")
+    parser.add_argument("--steal", type=float, default=0.2, help="Chance a manager steals when they look at a pick")
+    parser.add_argument("--broke", type=int, default=0, help="Managers who go all-in to trigger draft mode")
+    parser.add_argument("--parallel", type=int, default=1, help="Lower-tier lots open at once, as set by /setlots")
+    parser.add_argument("--maxbid", type=int, default=0, help="Managers who set a /maxbid per lot instead of bidding")
+    parser.add_argument("--lots", type=int, default=0, help="Stop after this many lots (0 = whole season)")
+    parser.add_argument("--virtual", action="store_true", help="Run on a VirtualClock instead of real time")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Everything the run writes goes to a throwaway directory
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        if args.virtual:
+            clock = auction_bot.VirtualClock()
+            auction_bot.use_clock(clock)
+            asyncio.run(clock.run(run(args)))
+        else:
+            asyncio.run(run(args))
+        auction_bot.STORAGE_EXECUTOR.shutdown(wait=True)
+
+if __name__ == "__main__":
+    main()
@@ -2,35 +2,290 @@ import discord
 from discord.ext import commands
 import json
 import os
+import re
 import shutil
+import copy
 from dotenv import load_dotenv
 import asyncio
 import random
+import heapq
+import time
+import sqlite3
+import unicodedata
+import difflib
+import bisect
+import math
+import logging
+from collections import deque
+import contextlib
+import contextvars
+import functools
+import cProfile
+import csv
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import numpy as np
+except ImportError: # Only /analytics and analytics.py need NumPy
+    np = None
 
 # --- Bot Setup ---
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
+# Optional: the channel whose auction keeps using the top-level data files
+AUCTION_CHANNEL_ID = int(os.getenv('AUCTION_CHANNEL_ID') or 0)
+# One auction per 'channel' (default) or per 'guild'
+AUCTION_SCOPE = os.getenv('AUCTION_SCOPE', 'channel')
+# Optional: serve Prometheus metrics on http://METRICS_HOST:METRICS_PORT/metrics
+METRICS_PORT = int(os.getenv('METRICS_PORT') or 0)
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+# Commands and messages slower than this are logged with their phase timings
+SLOW_INTERACTION_SECONDS = float(os.getenv('SLOW_INTERACTION_SECONDS') or 2.0)
+# Set PROFILE_SLOW=1 to also save a cProfile dump of each slow invocation
+PROFILE_SLOW = os.getenv('PROFILE_SLOW') == '1'
 
 intents = discord.Intents.default()
 intents.message_content = True
 intents.guilds = True
 intents.members = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+class ProfiledCommandTree(discord.app_commands.CommandTree):
+    """A CommandTree that times every slash command it registers (see `profiled`)."""
+
+    def command(self, **kwargs):
+        register = super().command(**kwargs)
+        return lambda func: register(profiled(f"/{kwargs.get('name') or func.__name__}")(func))
+
+bot = commands.Bot(command_prefix='!', intents=intents, tree_cls=ProfiledCommandTree)
 tree = bot.tree
 
 # --- Auction Configuration ---
-DATA_FILE = 'auction_data.json'
-BACKUP_FILE = 'auction_data.backup.json'
-PLAYER_DB_FILE = 'player_database.json'
+DATA_FILE = 'auction_data.json'        # Compacted snapshot of the auction
+JOURNAL_FILE = 'auction_data.journal'  # Append-only log of transactions since the snapshot
+PLAYER_DB_FILE = 'player_database.json' # Master pool; each new auction starts from a copy
+PLAYER_HOT_FILE = 'player_database.hot.json' # Derived from the pool: just the fields the auction keeps in memory
+PLAYER_DETAILS_FILE = 'player_details.jsonl' # Derived from the pool: scouting text, read on demand
+AUCTIONS_DIR = 'auctions' # One sub-folder of data files per auction context
 DEFAULT_PLAYER_CAP = 18
 BID_COUNTDOWN_SECONDS = 5  # Time for final countdown
 STEAL_COUNTDOWN_SECONDS = 15 # Time to decide to steal
-
-# --- Global State Variables ---
-bot.current_auction_task = None
-bot.current_steal_task = None
-bot.current_initial_bid_task = None # Tracks the *initial* 5s countdown
+BOARD_EDITS_PER_SECOND = 2 # Max edits of a lot's "on the block" embed
+NEXT_PLAYER_PAUSE_SECONDS = 2 # Breather between one lot closing and the next
+MAX_BID_INCREMENT = 1_000_000 # How far a /maxbid outbids the runner-up
+START_PAUSE_SECONDS = 3 # Dramatic pause before /start calls the first player
+PLAYERS_PER_PAGE = 20 # Players on one page of /listplayers
+TIER_FLOORS = (86, 83) # Lowest OVR in tier 1 and tier 2 of /start; everyone else is tier 3
+PARALLEL_LOT_TIER = 3 # /setlots puts several players of this tier (or lower) on the block at once
+MAX_PARALLEL_LOTS = 10 # Most lots /setlots allows open together
+FLUSH_DEBOUNCE_SECONDS = 1.0 # Max delay before in-memory changes hit the disk
+JOURNAL_COMPACT_RECORDS = 500 # Fold the journal into the snapshot past this many records
+UNDO_HISTORY = 50 # Logical transactions that always survive a compaction
+STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'json') # 'json' or 'sqlite'
+SQLITE_FILE = 'auction.db' # Used instead of the JSON files when STORAGE_BACKEND=sqlite
+PROFILE_DIR = 'profiles' # Where PROFILE_SLOW dumps go
+
+# --- Metrics ---
+
+METRIC_HELP = {
+    "auction_bid_seconds": "Time from a bid message arriving to it being accepted or rejected",
+    "auction_bids_total": "Bids handled, by result",
+    "auction_load_seconds": "Time to read a data file",
+    "auction_load_bytes": "Size of data files read",
+    "auction_save_seconds": "Time to write to disk, by operation",
+    "auction_save_bytes_total": "Bytes written to data files",
+    "auction_countdown_drift_seconds": "How late countdowns fire past their deadline",
+    "auction_discord_requests_total": "Requests sent to the Discord API, by method",
+    "auction_discord_rate_limits_total": "Rate-limit warnings from discord.py",
+    "auction_lots_closed_total": "Lots closed, by result",
+    "auction_lots_per_minute": "Lots closed per minute over the last 10 minutes",
+    "auction_timers_active": "Countdowns waiting on their deadline",
+    "auction_timer_callbacks_running": "Countdowns that fired and are still running",
+    "auction_bid_consumers": "Auctions with a running bid consumer",
+    "auction_bids_queued": "Bids waiting for their auction's consumer",
+    "auction_contexts": "Auctions loaded in this process",
+    "auction_asyncio_tasks": "Tasks on the event loop",
+    "auction_command_seconds": "Time to handle a slash command or message, by command",
+}
+
+class Metrics:
+    """Counters, gauges and timing summaries for the auction hot paths,
+    rendered in the Prometheus text format. Safe to update from the storage
+    thread: every update is a single dict or deque operation."""
+
+    WINDOW = 1024 # Recent observations a summary keeps for its quantiles
+
+    def __init__(self):
+        self.counters = {}  # (name, labels) -> value
+        self.summaries = {} # (name, labels) -> [recent values, count, sum]
+        self.gauges = {}    # name -> function returning the current value
+        self.events = {}    # name -> times of recent marks, for per-minute rates
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def mark(self, name, **labels):
+        """Counts an event and remembers when it happened."""
+        self.inc(name, **labels)
+        self.events.setdefault(name, deque(maxlen=self.WINDOW)).append(time.monotonic())
+
+    def per_minute(self, name, window=600):
+        since = time.monotonic() - window
+        return sum(1 for t in list(self.events.get(name, ())) if t >= since) * 60 / window
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        summary = self.summaries.get(key)
+        if summary is None:
+            summary = self.summaries[key] = [deque(maxlen=self.WINDOW), 0, 0.0]
+        summary[0].append(value)
+        summary[1] += 1
+        summary[2] += value
+
+    def gauge(self, name, func):
+        self.gauges[name] = func
+
+    def quantile(self, name, q, **labels):
+        """The q-quantile of recent observations, or None if there are none."""
+        summary = self.summaries.get((name, tuple(sorted(labels.items()))))
+        if not summary or not summary[0]:
+            return None
+        values = sorted(summary[0])
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    def render(self):
+        lines, described = [], set()
+
+        def header(name, kind):
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        def labelled(name, labels):
+            if not labels:
+                return name
+            return name + "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+        for (name, labels), value in sorted(list(self.counters.items())):
+            header(name, "counter")
+            lines.append(f"{labelled(name, labels)} {value}")
+        for (name, labels), (recent, count, total) in sorted(list(self.summaries.items())):
+            header(name, "summary")
+            values = sorted(list(recent))
+            for q in (0.5, 0.95, 0.99):
+                value = values[min(len(values) - 1, int(q * len(values)))] if values else "NaN"
+                lines.append(f"{labelled(name, labels + (('quantile', q),))} {value}")
+            lines.append(f"{labelled(name + '_sum', labels)} {total}")
+            lines.append(f"{labelled(name + '_count', labels)} {count}")
+        for name, func in sorted(self.gauges.items()):
+            header(name, "gauge")
+            lines.append(f"{name} {func()}")
+        return "\n".join(lines) + "\n"
+
+bot.metrics = Metrics()
+
+class RateLimitCounter(logging.Handler):
+    """Counts the rate-limit warnings discord.py logs."""
+
+    def emit(self, record):
+        if "rate limit" in record.getMessage().lower():
+            bot.metrics.inc("auction_discord_rate_limits_total")
+
+logging.getLogger("discord.http").addHandler(RateLimitCounter(logging.WARNING))
+
+def _count_requests(request):
+    async def counted_request(route, **kwargs):
+        bot.metrics.inc("auction_discord_requests_total", method=route.method)
+        with phase("send"):
+            return await request(route, **kwargs)
+    return counted_request
+
+# Every message, edit and interaction reply goes through here
+bot.http.request = _count_requests(bot.http.request)
+
+# --- Profiling ---
+
+class Profile:
+    """Where the time of one command or message invocation went."""
+
+    PHASES = ("load", "save", "send") # Whatever is left over is "logic"
+
+    def __init__(self, name):
+        self.name = name
+        self.phases = dict.fromkeys(self.PHASES, 0.0)
+
+current_profile = contextvars.ContextVar("current_profile", default=None)
+bot.active_profiler = None # cProfile only supports one profiler at a time
+
+@contextlib.contextmanager
+def phase(name):
+    """Adds the time spent in the block to the current invocation's `name` phase."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile = current_profile.get()
+        if profile is not None:
+            profile.phases[name] += time.perf_counter() - started
+
+def _start_profiler():
+    if not PROFILE_SLOW or bot.active_profiler is not None:
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return None # Some other profiler is already attached
+    bot.active_profiler = profiler
+    return profiler
+
+def profiled(name):
+    """Decorator timing every call of a coroutine: the time goes into the
+    metrics, and slow calls are logged with a phase breakdown (load, logic,
+    save, send)."""
+    def decorate(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            profile = Profile(name)
+            token = current_profile.set(profile)
+            profiler = _start_profiler()
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - started
+                current_profile.reset(token)
+                if profiler is not None:
+                    profiler.disable()
+                    bot.active_profiler = None
+                bot.metrics.observe("auction_command_seconds", total, command=name)
+                if total >= SLOW_INTERACTION_SECONDS:
+                    log_slow_invocation(profile, total, profiler)
+        return wrapper
+    return decorate
+
+def start_background_task(coro):
+    """Starts a task that outlives the invocation starting it. It runs in a
+    fresh context: a task inherits the current ContextVars, and would
+    otherwise keep adding its phases to that invocation's profile."""
+    return contextvars.Context().run(asyncio.create_task, coro)
+
+def log_slow_invocation(profile, total, profiler):
+    phases = profile.phases
+    logic = max(0.0, total - sum(phases.values()))
+    message = (f"Slow {profile.name}: {total:.2f}s (load {phases['load']:.3f}s, logic {logic:.3f}s, "
+               f"save {phases['save']:.3f}s, send {phases['send']:.3f}s)")
+    if profiler is not None:
+        dump_file = os.path.join(PROFILE_DIR, f"{profile.name.strip('/')}-{int(time.time() * 1000)}.prof")
+        STORAGE_EXECUTOR.submit(_dump_profile, profiler, dump_file)
+        message += f", profile saved to {dump_file}"
+    print(message)
+
+def _dump_profile(profiler, dump_file):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    profiler.dump_stats(dump_file)
 
 # --- Data Management Functions ---
 
@@ -39,65 +294,1482 @@ def get_default_data():
     return {
         "managers": {},
         "player_cap": DEFAULT_PLAYER_CAP,
-        "auction_state": "idle", # idle, bidding, drafting, paused
+        "auction_state": "idle", # idle, bidding, lots, drafting, paused
         "auction_queue": [],     # List of player keys to auction
         "auction_queue_index": 0,# Current position in the queue
         "on_the_block": None,    # { "name": "Player", "base_price": 10, "ovr": 88 }
         "current_bid": 0,
         "current_bidder": None,  # Manager key
         "draft_order": [],
-        "draft_pick_index": 0
+        "draft_pick_index": 0,
+        "countdown": None,       # { "kind": "lot"/"steal", "deadline": epoch secs, "channel_id": 1, "drafter": key }
+        "proxies": {},           # { player key: { manager key: max bid } }, oldest first
+        "parallel_lots": 1,      # Lots of PARALLEL_LOT_TIER players open at once
+        "lots": {}               # { "2": { "key", "player", "current_bid", "current_bidder", "deadline" } } while parallel lots are open
     }
 
+class RosterEntry:
+    """One player on a manager's roster: who, for how much, how and when."""
+    __slots__ = ("key", "name", "ovr", "price", "how", "at")
+
+    # Rosters used to be stored as display strings like "Name (88 OVR) - $40M"
+    LEGACY_FORMAT = re.compile(r"^(?P<name>.*) \((?P<ovr>\d+) OVR\)(?: - (?:\$(?P<price>[\d.]+)M|(?P<draft>Draft)))?$")
+
+    def __init__(self, key, name, ovr, price=0, how="auction", at=None):
+        self.key = key
+        self.name = name
+        self.ovr = ovr
+        self.price = price
+        self.how = how # auction, steal, draft or retained
+        self.at = int(time.time()) if at is None else at
+
+    @classmethod
+    def from_player(cls, key, player, how, price=0):
+        return cls(key, player["name"], player["ovr"], price, how)
+
+    @classmethod
+    def from_json(cls, obj):
+        if isinstance(obj, cls):
+            return obj
+        if isinstance(obj, dict):
+            return cls(obj["key"], obj["name"], obj["ovr"], obj.get("price", 0), obj.get("how", "auction"), obj.get("at", 0))
+        match = cls.LEGACY_FORMAT.match(obj)
+        if not match:
+            return cls(normalize_name(obj), obj, 0, 0, "auction", 0)
+        name = match["name"]
+        if match["price"]:
+            price, how = int(float(match["price"]) * 1_000_000), "auction"
+        else:
+            price, how = 0, "draft" if match["draft"] else "retained"
+        return cls(name.lower(), name, int(match["ovr"]), price, how, 0)
+
+    def to_json(self):
+        return {"key": self.key, "name": self.name, "ovr": self.ovr, "price": self.price, "how": self.how, "at": self.at}
+
+    def __eq__(self, other):
+        return isinstance(other, RosterEntry) and self.to_json() == other.to_json()
+
+    def __repr__(self):
+        return f"RosterEntry({self.to_json()!r})"
+
+    def __deepcopy__(self, memo):
+        return self # Entries are never changed in place, so state copies can share them
+
+    def label(self):
+        """The roster line shown in /team, e.g. "Name (88 OVR) - $40M"."""
+        if self.how == "draft":
+            return f"{self.name} ({self.ovr} OVR) - Draft"
+        if self.how == "retained":
+            return f"{self.name} ({self.ovr} OVR)"
+        if self.how == "steal":
+            return f"{self.name} ({self.ovr} OVR) - ${self.price/1_000_000:.0f}M (Stolen)"
+        return f"{self.name} ({self.ovr} OVR) - ${self.price/1_000_000:.0f}M"
+
+def json_default(obj):
+    """Lets json.dumps write RosterEntry records inside the auction data."""
+    if isinstance(obj, RosterEntry):
+        return obj.to_json()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def hydrate_rosters(data):
+    """Turns the roster entries read from disk into RosterEntry records, in place."""
+    for manager in data.get("managers", {}).values():
+        manager["players"] = [RosterEntry.from_json(entry) for entry in manager.get("players", [])]
+        if manager.get("retained_player"):
+            manager["retained_player"] = RosterEntry.from_json(manager["retained_player"])
+
 def load_data(file):
     """Loads a JSON file."""
+    is_auction_file = os.path.basename(file) == DATA_FILE
     if not os.path.exists(file):
-        if file == DATA_FILE:
-            data = get_default_data()
-        elif file == PLAYER_DB_FILE:
-            data = {} 
+        data = get_default_data() if is_auction_file else {}
         save_data(data, file)
         return data
     try:
+        started = time.perf_counter()
         with open(file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            data = json.load(f)
+        bot.metrics.observe("auction_load_seconds", time.perf_counter() - started, file=os.path.basename(file))
+        bot.metrics.observe("auction_load_bytes", os.path.getsize(file), file=os.path.basename(file))
+        return data
     except json.JSONDecodeError:
-        return get_default_data() if file == DATA_FILE else {}
+        return get_default_data() if is_auction_file else {}
+
+def normalize_name(name):
+    """Lowercase, accent-free form of a name ("Mbappé" -> "mbappe") for matching."""
+    decomposed = unicodedata.normalize('NFKD', name)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower().strip()
 
 def save_data(data, file):
     """Saves data to a JSON file."""
-    if file == DATA_FILE:
-        if os.path.exists(DATA_FILE):
-            shutil.copy(DATA_FILE, BACKUP_FILE)
-    
-    with open(file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4)
+    write_file(file, json.dumps(data, indent=4))
+
+def write_file(file, text):
+    """Atomically replaces a file: write a temp file, fsync it, rename over."""
+    started = time.perf_counter()
+    tmp_file = file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, file)
+    bot.metrics.observe("auction_save_seconds", time.perf_counter() - started, op="write")
+    bot.metrics.inc("auction_save_bytes_total", len(text), op="write")
+
+def append_file(file, text):
+    """Appends to a file and waits until it is on disk."""
+    started = time.perf_counter()
+    with open(file, 'a', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    bot.metrics.observe("auction_save_seconds", time.perf_counter() - started, op="append")
+    bot.metrics.inc("auction_save_bytes_total", len(text), op="append")
+
+# All blocking file work runs on this one thread, so it never stalls the event
+# loop and writes land on disk in exactly the order they were issued.
+STORAGE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auction-io")
+
+bot.io_in_flight = set() # Storage thread work not finished yet; a VirtualClock waits for it
+
+def run_io(func, *args):
+    """Runs blocking file work on the storage thread; await the result."""
+    future = asyncio.get_running_loop().run_in_executor(STORAGE_EXECUTOR, func, *args)
+    bot.io_in_flight.add(future)
+    future.add_done_callback(bot.io_in_flight.discard)
+    return future
+
+class JsonStore:
+    """In-memory copy of a JSON file. The memory copy is the source of truth;
+    changes are written back to disk in the background by `save()`."""
+
+    def __init__(self, file):
+        self.file = file
+        self._data = None
+        self._dirty = False
+        self._flush_handle = None
+        self._flush_task = None
+        self._last_write = None # Future of the most recent write handed to the storage thread
+
+    @property
+    def data(self):
+        """The live data. Use `await load()` first to keep the read off the event loop."""
+        if self._data is None:
+            self._install(self._read())
+        return self._data
+
+    async def load(self):
+        """Reads the file on the storage thread (first call only)."""
+        if self._data is None:
+            loaded = await run_io(self._read)
+            if self._data is None: # Nobody loaded it synchronously in the meantime
+                self._install(loaded)
+        return self._data
+
+    def _read(self):
+        return load_data(self.file)
+
+    def _install(self, loaded):
+        self._data = loaded
+
+    def save(self):
+        """Marks the data as changed. The file is written at most
+        FLUSH_DEBOUNCE_SECONDS later, so a burst of changes costs one write."""
+        self._dirty = True
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_sync() # No event loop (e.g. shutdown), write straight away
+            return
+        self._flush_handle = loop.call_later(FLUSH_DEBOUNCE_SECONDS, self._flush_soon, context=contextvars.Context())
+
+    def _flush_soon(self):
+        self._flush_handle = None
+        self._flush_task = asyncio.ensure_future(self.flush())
+
+    async def flush(self):
+        """Writes pending changes now. Returns once they (and every write
+        issued before them) are safely on disk."""
+        self._cancel_flush()
+        if self._dirty and self._data is not None:
+            # Serialise here: the storage thread must never see a dict mid-mutation
+            text = json.dumps(self._data, indent=4)
+            self._dirty = False
+            self._last_write = run_io(self._write, text)
+        if self._last_write is not None:
+            await self._last_write
+
+    def flush_sync(self):
+        """Blocking flush for when there is no event loop (shutdown, scripts)."""
+        self._cancel_flush()
+        if self._dirty and self._data is not None:
+            self._write(json.dumps(self._data, indent=4))
+            self._dirty = False
+
+    def _write(self, text):
+        write_file(self.file, text)
+
+    def _cancel_flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+# Journal records that are bookkeeping rather than something an admin would undo
+INTERNAL_KINDS = {"lot", "state"}
+
+def _get_path(data, path):
+    for key in path:
+        data = data[key]
+    return data
+
+def _apply_changes(data, changes):
+    """Applies journal changes: [path, value] sets a key, [path] deletes it."""
+    for change in changes:
+        parent = _get_path(data, change[0][:-1])
+        if len(change) == 2:
+            parent[change[0][-1]] = copy.deepcopy(change[1])
+        else:
+            parent.pop(change[0][-1], None)
+
+def _diff(old, new, path, sets, undos):
+    """Collects the changes turning `old` into `new`. Managers are diffed one
+    level deeper so a sale only records the one manager it touched."""
+    for key in old.keys() - new.keys():
+        sets.append([path + [key]])
+        undos.append([path + [key], old[key]])
+    for key, value in new.items():
+        if key not in old:
+            sets.append([path + [key], copy.deepcopy(value)])
+            undos.append([path + [key]])
+        elif old[key] != value:
+            if not path and key == "managers":
+                _diff(old[key], value, [key], sets, undos)
+            else:
+                sets.append([path + [key], copy.deepcopy(value)])
+                undos.append([path + [key], old[key]])
+
+class AuctionState(JsonStore):
+    """The live auction (managers, budgets, queue, current lot).
+
+    DATA_FILE holds a snapshot; every `commit()` appends one small record to
+    JOURNAL_FILE with the values it set and the values it replaced. Loading
+    replays the journal over the snapshot, and `undo()` walks it backwards.
+    """
+
+    def __init__(self, file, journal_file):
+        super().__init__(file)
+        self.journal_file = journal_file
+        self._base = None      # Snapshot the journal applies to
+        self._shadow = None    # Data as of the last commit, to diff against
+        self._records = []     # Journal records since the snapshot
+        self._pending = []     # Serialised records not yet appended to the journal
+        self._seq = 0
+        self.version = 0       # Bumped on every change, so renders of the state can be cached
+        self._io_lock = asyncio.Lock() # A journal rewrite must not race an append
+
+    def _read(self):
+        base = load_data(self.file)
+        seq = base.pop("journal_seq", 0)
+        records = []
+        if os.path.exists(self.journal_file):
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break # Torn write from a crash; everything before it is good
+                    if record["seq"] > seq:
+                        records.append(record)
+        return base, seq, records
+
+    def _install(self, loaded):
+        base, seq, records = loaded
+        hydrate_rosters(base)
+        data = copy.deepcopy(base)
+        for record in records:
+            _apply_changes(data, record["set"])
+        hydrate_rosters(data) # Journal records from before RosterEntry hold strings
+        self._base = base
+        self._records = records
+        self._seq = records[-1]["seq"] if records else seq
+        self._data = data
+        self._shadow = copy.deepcopy(data)
+        self.version += 1
+
+    def replace(self, data, kind, note=""):
+        """Swaps in a whole new data object (e.g. a reset) as one transaction."""
+        self.data # Make sure the snapshot is loaded before diffing
+        self._data = data
+        self.commit(kind, note)
+
+    def commit(self, kind, note="", removed_players=None):
+        """Records everything changed since the last commit as one transaction.
+
+        `removed_players` ({key: entry}) are player database entries this
+        transaction took out of the pool; undoing it puts them back.
+        """
+        with phase("save"):
+            self._commit(kind, note, removed_players)
+
+    def _commit(self, kind, note, removed_players):
+        sets, undos = [], []
+        _diff(self._shadow, self.data, [], sets, undos)
+        if not sets and not removed_players:
+            return
+        _apply_changes(self._shadow, sets)
+        self.version += 1
+        self._seq += 1
+        record = {"seq": self._seq, "kind": kind, "note": note, "set": sets, "undo": undos}
+        if removed_players:
+            record["players"] = removed_players
+        self._records.append(record)
+        self._persist(record)
+        self._dirty = True
+        self._schedule_flush()
+
+    def _persist(self, record):
+        self._pending.append(json.dumps(record, default=json_default))
+
+    def save(self):
+        """Commits pending changes as internal bookkeeping."""
+        self.commit("state")
+
+    async def flush(self):
+        """Appends pending journal records, compacting if the journal got long."""
+        self._cancel_flush()
+        async with self._io_lock:
+            if self._pending:
+                text = "\n".join(self._pending) + "\n"
+                self._pending = []
+                self._last_write = run_io(append_file, self.journal_file, text)
+            self._dirty = False
+            if self._last_write is not None:
+                await self._last_write
+            if len(self._records) > JOURNAL_COMPACT_RECORDS:
+                await self._compact()
+
+    def flush_sync(self):
+        self._cancel_flush()
+        if self._pending:
+            append_file(self.journal_file, "\n".join(self._pending) + "\n")
+            self._pending = []
+        self._dirty = False
+
+    async def compact(self):
+        """Folds old records into the snapshot, keeping the last UNDO_HISTORY
+        logical transactions in the journal so they can still be undone."""
+        async with self._io_lock:
+            await self._compact()
+
+    async def _compact(self):
+        keep_from = len(self._records)
+        logical = 0
+        while keep_from > 0 and logical < UNDO_HISTORY:
+            keep_from -= 1
+            if self._records[keep_from]["kind"] not in INTERNAL_KINDS:
+                logical += 1
+        folded = self._records[:keep_from]
+        self._records = self._records[keep_from:]
+        await self._fold(folded)
+
+    async def _fold(self, folded):
+        for record in folded:
+            _apply_changes(self._base, record["set"])
+        await self._write_files()
+
+    async def _write_files(self):
+        """Rewrites the snapshot and the journal from memory."""
+        folded_seq = self._records[0]["seq"] - 1 if self._records else self._seq
+        snapshot = json.dumps(dict(self._base, journal_seq=folded_seq), indent=4, default=json_default)
+        journal = "".join(json.dumps(record, default=json_default) + "\n" for record in self._records)
+        self._pending = []
+        # Snapshot first: if we crash in between, journal_seq makes the old
+        # journal's folded records be skipped on the next load.
+        await run_io(write_file, self.file, snapshot)
+        self._last_write = run_io(write_file, self.journal_file, journal)
+        await self._last_write
+
+    async def undo(self, count=1):
+        """Rolls back the last `count` logical transactions (and any internal
+        bookkeeping recorded after them). Internal records with no logical
+        transaction before them are left alone. Returns the undone records,
+        newest first."""
+        self.data
+        self.commit("state") # Don't lose uncommitted edits inside the undo window
+        stop = len(self._records) # Roll back to here: the oldest logical transaction undone
+        logical = 0
+        for i in range(len(self._records) - 1, -1, -1):
+            if logical == count:
+                break
+            if self._records[i]["kind"] not in INTERNAL_KINDS:
+                logical += 1
+                stop = i
+        undone = []
+        while len(self._records) > stop:
+            record = self._records.pop()
+            _apply_changes(self._data, record["undo"])
+            undone.append(record)
+        if not undone:
+            return undone # Nothing rolled back: no files to rewrite
+        hydrate_rosters(self._data)
+        self._shadow = copy.deepcopy(self._data)
+        self.version += 1
+        self._cancel_flush()
+        self._dirty = False
+        with phase("save"):
+            async with self._io_lock:
+                await self._persist_undo(undone)
+        return undone
+
+    async def _persist_undo(self, undone):
+        await self._write_files()
+
+# --- Player Search ---
+
+def _trigrams(name):
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class PlayerIndex:
+    """Accent-insensitive search over a player pool.
+
+    The full name and each word of it go into a prefix trie, so "mbap" finds
+    "Kylian Mbappé". Typos fall back to trigram matching ranked by
+    difflib. Kept current one player at a time as the pool changes.
+    """
+
+    def __init__(self, players):
+        self._trie = {}      # char -> node; a node's None entry holds the keys ending there
+        self._names = {}     # key -> normalized name
+        self._trigrams = {}  # trigram -> keys
+        for key, entry in players.items():
+            self.add(key, entry)
+
+    def add(self, key, entry):
+        self.discard(key)
+        name = normalize_name(entry["name"])
+        self._names[key] = name
+        for word in set(name.split()) | {name}:
+            node = self._trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node.setdefault(None, set()).add(key)
+        for gram in _trigrams(name):
+            self._trigrams.setdefault(gram, set()).add(key)
+
+    def discard(self, key):
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+        for word in set(name.split()) | {name}:
+            path = [self._trie]
+            for char in word:
+                path.append(path[-1][char])
+            keys = path[-1][None]
+            keys.discard(key)
+            if not keys:
+                del path[-1][None]
+            # Prune the branch back up to the first node still in use
+            for depth in range(len(word), 0, -1):
+                if path[depth]:
+                    break
+                del path[depth - 1][word[depth - 1]]
+        for gram in _trigrams(name):
+            keys = self._trigrams[gram]
+            keys.discard(key)
+            if not keys:
+                del self._trigrams[gram]
+
+    def exact(self, name):
+        """Keys whose whole name matches `name`, ignoring case and accents."""
+        node = self._trie
+        for char in normalize_name(name):
+            if char not in node:
+                return set()
+            node = node[char]
+        return {key for key in node.get(None, ()) if self._names[key] == normalize_name(name)}
+
+    def unique_names(self):
+        """{normalized name: key} for every name only one player has."""
+        keys = {}
+        for key, name in self._names.items():
+            keys[name] = None if name in keys else key
+        return {name: key for name, key in keys.items() if key is not None}
+
+    def search(self, query, limit=25):
+        """Up to `limit` keys: prefix matches first, then the closest fuzzy matches."""
+        query = normalize_name(query)
+        if not query:
+            return []
+        results = self._prefix(query, limit)
+        if len(results) < limit:
+            results += [key for key in self._fuzzy(query, limit) if key not in results][:limit - len(results)]
+        return results
+
+    def _prefix(self, query, limit):
+        node = self._trie
+        for char in query:
+            if char not in node:
+                return []
+            node = node[char]
+        results, seen, stack = [], set(), [node]
+        while stack and len(results) < limit:
+            node = stack.pop()
+            for key in node.get(None, ()):
+                if key not in seen:
+                    seen.add(key)
+                    results.append(key)
+            stack.extend(child for char, child in node.items() if char is not None)
+        return results[:limit]
+
+    def _fuzzy(self, query, limit):
+        shared = {}
+        for gram in _trigrams(query):
+            for key in self._trigrams.get(gram, ()):
+                shared[key] = shared.get(key, 0) + 1
+        # Only the candidates sharing the most trigrams are worth a full comparison
+        candidates = sorted(shared, key=shared.get, reverse=True)[:limit * 4]
+        scored = [(difflib.SequenceMatcher(None, query, self._names[key]).ratio(), key) for key in candidates]
+        return [key for score, key in sorted(scored, reverse=True) if score >= 0.5][:limit]
+
+def player_tier(ovr):
+    """The /start tier a player is auctioned in: 1 (86+ OVR), 2 (83-85) or 3 (<=82)."""
+    if ovr >= TIER_FLOORS[0]:
+        return 1
+    if ovr >= TIER_FLOORS[1]:
+        return 2
+    return 3
+
+class PlayerListing:
+    """The pool sorted best-first (OVR, then name), with secondary indexes by
+    position, team and tier, so listing players never sorts the whole pool."""
+
+    FACETS = ("position", "team", "tier")
+
+    def __init__(self, players):
+        self._sort_keys = {key: self._sort_key(entry) for key, entry in players.items()}
+        self._sorted = sorted((sort_key, key) for key, sort_key in self._sort_keys.items())
+        self._facets = {facet: {} for facet in self.FACETS} # facet -> value -> keys
+        self._values = {} # key -> (position, team, tier)
+        for key, entry in players.items():
+            self._add_facets(key, entry)
+
+    @staticmethod
+    def _sort_key(entry):
+        return (-entry.get("ovr", 0), normalize_name(entry["name"]))
+
+    @staticmethod
+    def facet_values(position=None, team=None, tier=None):
+        """Filter values in the form the indexes store them."""
+        return (position.strip().upper() if position else None,
+                normalize_name(team) if team else None,
+                tier)
+
+    def _add_facets(self, key, entry):
+        values = self.facet_values(entry.get("position"), entry.get("team"), player_tier(entry.get("ovr", 0)))
+        self._values[key] = values
+        for facet, value in zip(self.FACETS, values):
+            self._facets[facet].setdefault(value, set()).add(key)
+
+    def add(self, key, entry):
+        self.discard(key)
+        sort_key = self._sort_keys[key] = self._sort_key(entry)
+        bisect.insort(self._sorted, (sort_key, key))
+        self._add_facets(key, entry)
+
+    def discard(self, key):
+        sort_key = self._sort_keys.pop(key, None)
+        if sort_key is None:
+            return
+        del self._sorted[bisect.bisect_left(self._sorted, (sort_key, key))]
+        for facet, value in zip(self.FACETS, self._values.pop(key)):
+            keys = self._facets[facet][value]
+            keys.discard(key)
+            if not keys:
+                del self._facets[facet][value]
+
+    def query(self, position=None, team=None, tier=None):
+        """Keys of the matching players, best first. Filters take the form
+        facet_values() returns; None means "any"."""
+        wanted = [self._facets[facet].get(value, set())
+                  for facet, value in zip(self.FACETS, (position, team, tier)) if value is not None]
+        if not wanted:
+            return [key for _, key in self._sorted]
+        return sorted(set.intersection(*wanted), key=self._sort_keys.get)
+
+# The fields the auction itself uses. Everything else on a player (specialities,
+# top_stats, why_get_them, ...) is only shown by /playerinfo and lives on disk.
+PLAYER_COLUMNS = ("name", "team", "ovr", "base_price", "position")
+
+def split_player(entry):
+    """(hot fields, cold fields) of a player database entry."""
+    hot = {k: v for k, v in entry.items() if k in PLAYER_COLUMNS}
+    cold = {k: v for k, v in entry.items() if k not in PLAYER_COLUMNS}
+    return hot, cold
+
+class PlayerDetails:
+    """The cold player fields, one `"key"<TAB>{fields}` line per player.
+    Only an offset index is held in memory; a lookup reads a single line.
+    Methods block, so call them on the storage thread."""
+
+    def __init__(self, file):
+        self.file = file
+        self._offsets = None # key -> byte offset of its newest line
+
+    def get(self, key):
+        """The details of one player, or {} if there are none."""
+        if self._offsets is None:
+            self._offsets = self._scan()
+        offset = self._offsets.get(key)
+        if offset is None:
+            return {}
+        with open(self.file, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline().partition(b"\t")[2])
+
+    def get_all(self):
+        """Every player's details; for imports, not for the hot path."""
+        details = {}
+        if os.path.exists(self.file):
+            with open(self.file, 'rb') as f:
+                for line in f:
+                    key, _, fields = line.partition(b"\t")
+                    details[json.loads(key)] = json.loads(fields)
+        return details
+
+    def add(self, details):
+        """Appends {key: fields}; a newer line replaces an older one."""
+        text = self._lines(details)
+        if text:
+            append_file(self.file, text)
+            self._offsets = None
+
+    def rebuild(self, details):
+        """Replaces the whole file with {key: fields}."""
+        write_file(self.file, self._lines(details))
+        self._offsets = None
+
+    @staticmethod
+    def _lines(details):
+        return "".join(f"{json.dumps(key)}\t{json.dumps(fields, ensure_ascii=False)}\n" for key, fields in details.items())
+
+    def _scan(self):
+        offsets = {}
+        if os.path.exists(self.file):
+            with open(self.file, 'rb') as f:
+                offset = 0
+                for line in f:
+                    offsets[json.loads(line.partition(b"\t")[0])] = offset
+                    offset += len(line)
+        return offsets
+
+class PlayerDatabase(JsonStore):
+    """The pool of players still available, keyed by lowercase name.
+
+    Only the hot fields (PLAYER_COLUMNS) are kept in memory. The pool file
+    stays a complete database; PLAYER_HOT_FILE and PLAYER_DETAILS_FILE next
+    to it are derived from it, so loads skip the scouting text.
+    """
+
+    def __init__(self, file):
+        super().__init__(file)
+        self._index = None
+        self._listing = None
+        self.version = 0 # Bumped on every change, so renders of the pool can be cached
+        self.hot_file = os.path.join(os.path.dirname(file), PLAYER_HOT_FILE)
+        self.details = PlayerDetails(os.path.join(os.path.dirname(file), PLAYER_DETAILS_FILE))
+
+    def _read(self):
+        # Index on the storage thread too, so a big pool never blocks the loop
+        players = self._read_players()
+        return players, PlayerIndex(players), PlayerListing(players)
+
+    def _read_players(self):
+        if self._derived_current():
+            return load_data(self.hot_file)
+        # First load, or the pool file changed by hand: split it into the
+        # derived files. The pool file itself is left as it is.
+        split = {key: split_player(entry) for key, entry in load_data(self.file).items()}
+        players = {key: hot for key, (hot, cold) in split.items()}
+        self.details.rebuild({key: cold for key, (hot, cold) in split.items() if cold})
+        write_file(self.hot_file, json.dumps(players)) # Last: it marks the split as done
+        return players
+
+    def _derived_current(self):
+        try:
+            return (os.path.getmtime(self.hot_file) >= os.path.getmtime(self.file)
+                    and os.path.exists(self.details.file))
+        except OSError:
+            return False
+
+    def _write(self, text):
+        # The pool file gets its scouting text back; the hot copy is what we
+        # hold in memory. Written in that order, the hot copy stays current.
+        details = self.details.get_all()
+        players = {key: dict(entry, **details.get(key, {})) for key, entry in json.loads(text).items()}
+        write_file(self.file, json.dumps(players, indent=4))
+        write_file(self.hot_file, text)
+
+    async def read_details(self, key):
+        """A player's scouting text (specialities, top_stats, ...), read from disk."""
+        return await run_io(self.details.get, key)
+
+    def _install(self, loaded):
+        self._data, self._index, self._listing = loaded
+        self.version += 1
+
+    @property
+    def index(self):
+        """The PlayerIndex over the pool, kept in step with every put/remove."""
+        self.data # Loads the pool and its indexes if needed
+        return self._index
+
+    @property
+    def listing(self):
+        """The PlayerListing over the pool, kept in step with every put/remove."""
+        self.data
+        return self._listing
+
+    def find(self, name):
+        """The key of the player called `name` (accents and case don't
+        matter), or None if there isn't exactly one."""
+        if name.lower() in self.data:
+            return name.lower()
+        matches = self.index.exact(name)
+        return matches.pop() if len(matches) == 1 else None
+
+    def suggest(self, name, limit=3):
+        """Names of the closest players, for "did you mean" replies."""
+        return [self.data[key]["name"] for key in self.index.search(name, limit)]
+
+    def remove(self, key, owner=None):
+        """Takes a player out of the pool (sold, drafted or retained to
+        `owner`) and returns their entry."""
+        entry = self.data.pop(key)
+        self._index.discard(key)
+        self._listing.discard(key)
+        self.version += 1
+        self.save()
+        return entry
+
+    def put(self, key, entry):
+        """Adds or replaces a player in the pool."""
+        self.data[key] = entry
+        self._index.add(key, entry)
+        self._listing.add(key, entry)
+        self.version += 1
+        self.save()
+
+    def _put_hot(self, entries):
+        """Puts the hot fields of many players in memory; returns their cold fields."""
+        details = {}
+        for key, entry in entries.items():
+            hot, cold = split_player(entry)
+            self.data[key] = hot
+            self._index.add(key, hot)
+            self._listing.add(key, hot)
+            if cold:
+                details[key] = cold
+        self.version += 1
+        return details
+
+    async def put_many(self, entries):
+        """Adds or replaces many players with a single pool write."""
+        details = self._put_hot(entries)
+        self.save()
+        if details:
+            await run_io(self.details.add, details)
+
+    async def import_players(self, lines, fmt, overwrite=False):
+        """Reads a CSV or JSONL stream of players into the pool as one change
+        and returns the ImportReport. Parsing runs on the storage thread."""
+        report = await run_io(read_player_import, lines, fmt, self._import_keys(), overwrite)
+        if report.entries:
+            await self.put_many(report.entries)
+        return report
+
+    def _import_keys(self):
+        """{normalized key or name: key in the pool}, so imported rows match
+        players the way find() does and update them under their own key."""
+        keys = self.index.unique_names()
+        keys.update((normalize_name(key), key) for key in self.data)
+        return keys
+
+    async def export_players(self, stream, fmt):
+        """Writes every available player, details included, to a text stream.
+        Returns how many were written."""
+        players = list(self.data.items())
+        return await run_io(write_player_export, stream, fmt, self._export_rows(players))
+
+    def _export_rows(self, players):
+        details = self.details.get_all()
+        for key, entry in players:
+            yield key, dict(entry, **details.get(key, {}))
+
+# --- Player Import / Export ---
+
+PLAYER_DETAIL_FIELDS = ("specialities", "top_stats", "why_get_them", "tactical_significance") # CSV columns
+PLAYER_FILE_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+class ImportReport:
+    """The outcome of a player import: the rows going in, and the rows that
+    didn't and why (as (line number, reason))."""
+
+    def __init__(self):
+        self.entries = {} # key -> entry to add or replace
+        self.added = 0
+        self.updated = 0
+        self.conflicts = []
+        self.errors = []
+
+    def summary(self, limit=10):
+        lines = [f"{self.added} added, {self.updated} updated, {len(self.conflicts)} conflict(s), "
+                 f"{len(self.errors)} invalid row(s)"]
+        problems = sorted(self.conflicts + self.errors)
+        lines += [f"line {line}: {reason}" for line, reason in problems[:limit]]
+        if len(problems) > limit:
+            lines.append(f"...and {len(problems) - limit} more")
+        return "\n".join(lines)
+
+def player_file_format(filename):
+    """'csv' or 'jsonl' going by the file name, or None."""
+    return PLAYER_FILE_FORMATS.get(os.path.splitext(filename)[1].lower())
+
+def normalize_player_row(row):
+    """(key, entry) for one imported row; raises ValueError saying what's wrong.
+    Keys are normalized like the rest of the pool: lowercase, accent-free."""
+    name = " ".join(str(row.get("name") or "").split())
+    if not name:
+        raise ValueError("no name")
+    try:
+        ovr = int(row.get("ovr"))
+        base_price = int(row.get("base_price") or 0)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}: OVR and base_price must be whole numbers")
+    if not 1 <= ovr <= 99 or base_price < 0:
+        raise ValueError(f"{name}: OVR must be 1-99 and base_price can't be negative")
+    key = normalize_name(" ".join(str(row.get("key") or name).split()))
+    entry = {"name": name, "team": str(row.get("team") or "").strip(), "ovr": ovr, "base_price": base_price}
+    position = str(row.get("position") or "").strip().upper()
+    if position:
+        entry["position"] = position
+    for field, value in row.items():
+        if field and field != "key" and field not in PLAYER_COLUMNS and value not in (None, ""):
+            entry[field] = value
+    return key, entry
+
+def read_player_import(lines, fmt, existing, overwrite):
+    """Validates a stream of CSV (with a header row) or JSONL player rows
+    against the players already in the pool (`existing` maps normalized keys
+    and names to their keys). Blocking: runs on the storage thread."""
+    report = ImportReport()
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        if "name" not in (reader.fieldnames or []):
+            report.errors.append((1, "the header row has no 'name' column"))
+            return report
+        rows = ((reader.line_num, row) for row in reader)
+    else:
+        rows = ((number, line) for number, line in enumerate(lines, 1) if line.strip())
+    seen = {} # key -> line it was first imported from
+    for number, row in rows:
+        try:
+            if fmt == "jsonl":
+                row = json.loads(row)
+                if not isinstance(row, dict):
+                    raise ValueError("not a JSON object")
+            key, entry = normalize_player_row(row)
+        except ValueError as e:
+            report.errors.append((number, str(e)))
+            continue
+        match = existing.get(key) or existing.get(normalize_name(entry["name"]))
+        key = match or key # Update a matched player under the key it already has
+        if key in seen:
+            report.conflicts.append((number, f"{entry['name']} repeats line {seen[key]}, skipped"))
+            continue
+        seen[key] = number
+        if match:
+            if not overwrite:
+                report.conflicts.append((number, f"{entry['name']} is already in the database, skipped"))
+                continue
+            report.updated += 1
+        else:
+            report.added += 1
+        report.entries[key] = entry
+    return report
+
+def open_player_export(file):
+    """A text stream for write_player_export(). Blocking: use run_io()."""
+    return open(file, 'w', encoding='utf-8', newline='')
+
+def write_player_export(stream, fmt, rows):
+    """Writes (key, entry) rows to a text stream as CSV or JSONL, one at a
+    time, in the same layout read_player_import() reads. Returns the count."""
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=("key",) + PLAYER_COLUMNS + PLAYER_DETAIL_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for key, entry in rows:
+            writer.writerow(dict(entry, key=key))
+            count += 1
+    else:
+        for key, entry in rows:
+            stream.write(json.dumps(dict(entry, key=key), ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+# --- SQLite Storage (optional) ---
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    norm_name TEXT NOT NULL,
+    team TEXT,
+    ovr INTEGER NOT NULL DEFAULT 0,
+    base_price INTEGER NOT NULL DEFAULT 0,
+    position TEXT,
+    details TEXT,  -- JSON of any other fields (specialities, top_stats, ...)
+    owner TEXT     -- Manager key once sold/drafted/retained, NULL while available
+);
+CREATE INDEX IF NOT EXISTS players_norm_name ON players (norm_name);
+CREATE INDEX IF NOT EXISTS players_ovr ON players (ovr);
+CREATE INDEX IF NOT EXISTS players_team ON players (team);
+CREATE INDEX IF NOT EXISTS players_position ON players (position);
+CREATE INDEX IF NOT EXISTS players_owner ON players (owner);
+CREATE TABLE IF NOT EXISTS managers (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    budget INTEGER NOT NULL,
+    spent INTEGER NOT NULL,
+    retained_player TEXT -- JSON
+);
+CREATE TABLE IF NOT EXISTS roster (
+    manager_key TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    entry TEXT NOT NULL, -- JSON
+    PRIMARY KEY (manager_key, slot)
+);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL -- JSON
+);
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    record TEXT NOT NULL -- JSON
+);
+"""
+
+class SqliteStorage:
+    """One SQLite database holding an auction's state and player pool.
+
+    Both stores queue their statements here; `flush()` runs everything
+    queued in a single transaction on the storage thread, so a sale (roster
+    row, budget, player owner, journal record) is committed atomically.
+    """
+
+    def __init__(self, file, json_dir):
+        self.file = file
+        self.json_dir = json_dir # Where to import existing JSON data from on first use
+        self._conn = None
+        self._pending = []       # (sql, params, many)
+        self._last_write = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.file, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SQLITE_SCHEMA)
+        return self._conn
+
+    def queue(self, sql, params=(), many=False, out=None):
+        (self._pending if out is None else out).append((sql, params, many))
+
+    def _execute(self, statements):
+        started = time.perf_counter()
+        with self.conn:
+            for sql, params, many in statements:
+                if many:
+                    self.conn.executemany(sql, params)
+                else:
+                    self.conn.execute(sql, params)
+        bot.metrics.observe("auction_save_seconds", time.perf_counter() - started, op="sqlite")
+
+    async def flush(self):
+        if self._pending:
+            statements, self._pending = self._pending, []
+            self._last_write = run_io(self._execute, statements)
+        if self._last_write is not None:
+            await self._last_write
+
+    def flush_sync(self):
+        if self._pending:
+            statements, self._pending = self._pending, []
+            self._execute(statements)
+
+    # -- Players --
+
+    @staticmethod
+    def player_row(key, entry):
+        details = split_player(entry)[1]
+        return (key, entry["name"], normalize_name(entry["name"]), entry.get("team"),
+                entry.get("ovr", 0), entry.get("base_price", 0), entry.get("position"),
+                json.dumps(details) if details else None)
+
+    # An entry without details (e.g. from /editplayer) keeps the stored ones
+    PLAYER_IMPORT = ("INSERT INTO players (key, name, norm_name, team, ovr, base_price, position, details, owner) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL) ON CONFLICT (key) DO UPDATE SET "
+                     "name = excluded.name, norm_name = excluded.norm_name, team = excluded.team, ovr = excluded.ovr, "
+                     "base_price = excluded.base_price, position = excluded.position, "
+                     "details = COALESCE(excluded.details, details)") # Sold players stay sold
+    PLAYER_UPSERT = PLAYER_IMPORT + ", owner = NULL" # Back in the pool
+
+    def put_player(self, key, entry):
+        self.queue(self.PLAYER_UPSERT, self.player_row(key, entry))
+
+    def put_players(self, entries):
+        self.queue(self.PLAYER_IMPORT, [self.player_row(key, entry) for key, entry in entries.items()], many=True)
+
+    def sold_players(self):
+        """{normalized key or name: key} for every player with an owner."""
+        keys = {}
+        for key, norm_name in self.conn.execute("SELECT key, norm_name FROM players WHERE owner IS NOT NULL"):
+            keys.setdefault(norm_name, key)
+            keys[normalize_name(key)] = key
+        return keys
+
+    def export_players(self):
+        """(key, entry with details) for every available player, streamed from the table."""
+        for key, name, team, ovr, base_price, position, details in self.conn.execute(
+                "SELECT key, name, team, ovr, base_price, position, details FROM players WHERE owner IS NULL ORDER BY key"):
+            entry = {"name": name, "team": team, "base_price": base_price, "ovr": ovr}
+            if position is not None:
+                entry["position"] = position
+            if details:
+                entry.update(json.loads(details))
+            yield key, entry
+
+    def read_players(self):
+        """Available players as {key: entry}. Imports the JSON pool on first use."""
+        if self.conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 0:
+            json_file = os.path.join(self.json_dir, PLAYER_DB_FILE)
+            if os.path.exists(json_file):
+                players = load_data(json_file) # The pool file holds the scouting text too
+                rows = [self.player_row(k, e) for k, e in players.items()]
+                with self.conn:
+                    self.conn.executemany("INSERT INTO players (key, name, norm_name, team, ovr, base_price, position, details) "
+                                          "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        players = {}
+        for key, name, team, ovr, base_price, position in self.conn.execute(
+                "SELECT key, name, team, ovr, base_price, position FROM players WHERE owner IS NULL"):
+            entry = {"name": name, "team": team, "base_price": base_price, "ovr": ovr}
+            if position is not None:
+                entry["position"] = position
+            players[key] = entry
+        return players
+
+    def read_player_details(self, key):
+        """The details column of one player, only fetched for /playerinfo."""
+        row = self.conn.execute("SELECT details FROM players WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else {}
+
+    # -- Auction state --
+
+    def read_auction(self):
+        """Current auction data plus the journal records kept for undo.
+        Imports the JSON snapshot + journal on first use."""
+        json_file = os.path.join(self.json_dir, DATA_FILE)
+        if self.conn.execute("SELECT COUNT(*) FROM state").fetchone()[0] == 0 and os.path.exists(json_file):
+            json_state = AuctionState(json_file, os.path.join(self.json_dir, JOURNAL_FILE))
+            json_state._install(json_state._read())
+            statements = []
+            self.queue_changes([[[key], value] for key, value in json_state.data.items()], out=statements)
+            self._execute(statements)
+
+        data = get_default_data()
+        for key, value in self.conn.execute("SELECT key, value FROM state"):
+            data[key] = json.loads(value)
+        managers = {}
+        for key, name, budget, spent, retained in self.conn.execute(
+                "SELECT key, name, budget, spent, retained_player FROM managers"):
+            managers[key] = {"name": name, "budget": budget, "spent": spent, "players": [],
+                             "retained_player": json.loads(retained) if retained else None}
+        for manager_key, entry in self.conn.execute("SELECT manager_key, entry FROM roster ORDER BY manager_key, slot"):
+            if manager_key in managers:
+                managers[manager_key]["players"].append(json.loads(entry))
+        data["managers"] = managers
+        records = [json.loads(r) for (r,) in self.conn.execute("SELECT record FROM journal ORDER BY seq")]
+        return data, records
+
+    def queue_changes(self, changes, previous=None, out=None):
+        """Turns journal changes ([path, value] / [path]) into row updates.
+        `previous` holds the matching old values, used to append only the new
+        roster rows instead of rewriting a manager's whole squad."""
+        previous = previous or [None] * len(changes)
+        for change, before in zip(changes, previous):
+            path = change[0]
+            value = change[1] if len(change) == 2 else None
+            old = before[1] if before and len(before) == 2 else None
+            if path[0] != "managers":
+                if len(change) == 2:
+                    self.queue("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (path[0], json.dumps(value)), out=out)
+                else:
+                    self.queue("DELETE FROM state WHERE key = ?", (path[0],), out=out)
+            elif len(path) == 1: # The whole managers table
+                self.queue("DELETE FROM managers", out=out)
+                self.queue("DELETE FROM roster", out=out)
+                for key, manager in (value or {}).items():
+                    self._queue_manager(key, manager, None, out)
+            elif len(change) == 2:
+                self._queue_manager(path[1], value, old, out)
+            else:
+                self.queue("DELETE FROM managers WHERE key = ?", (path[1],), out=out)
+                self.queue("DELETE FROM roster WHERE manager_key = ?", (path[1],), out=out)
+
+    def _queue_manager(self, key, manager, old, out):
+        retained = manager.get("retained_player")
+        self.queue("INSERT OR REPLACE INTO managers (key, name, budget, spent, retained_player) VALUES (?, ?, ?, ?, ?)",
+                   (key, manager["name"], manager["budget"], manager["spent"],
+                    json.dumps(retained, default=json_default) if retained is not None else None), out=out)
+        players = manager["players"]
+        old_players = old["players"] if old else None
+        if old_players is not None and players[:len(old_players)] == old_players:
+            start = len(old_players) # Just the new signings
+        elif old_players is not None and old_players[:len(players)] == players:
+            self.queue("DELETE FROM roster WHERE manager_key = ? AND slot >= ?", (key, len(players)), out=out)
+            return
+        else:
+            self.queue("DELETE FROM roster WHERE manager_key = ?", (key,), out=out)
+            start = 0
+        rows = [(key, slot, json.dumps(players[slot], default=json_default)) for slot in range(start, len(players))]
+        if rows:
+            self.queue("INSERT OR REPLACE INTO roster (manager_key, slot, entry) VALUES (?, ?, ?)", rows, many=True, out=out)
+
+class SqliteAuctionState(AuctionState):
+    """AuctionState kept in SQLite tables. The tables always hold the current
+    state, so there is no snapshot: the journal table is only undo history."""
+
+    def __init__(self, storage):
+        super().__init__(storage.file, None)
+        self.storage = storage
+
+    def _read(self):
+        return self.storage.read_auction()
+
+    def _install(self, loaded):
+        data, records = loaded
+        hydrate_rosters(data)
+        self._records = records
+        self._seq = records[-1]["seq"] if records else 0
+        self._data = data
+        self._shadow = copy.deepcopy(data)
+        self.version += 1
+
+    def _persist(self, record):
+        self.storage.queue_changes(record["set"], record["undo"])
+        self.storage.queue("INSERT INTO journal (seq, kind, record) VALUES (?, ?, ?)",
+                           (record["seq"], record["kind"], json.dumps(record, default=json_default)))
+
+    async def flush(self):
+        self._cancel_flush()
+        self._dirty = False
+        await self.storage.flush()
+        if len(self._records) > JOURNAL_COMPACT_RECORDS:
+            await self.compact()
+
+    def flush_sync(self):
+        self._cancel_flush()
+        self._dirty = False
+        self.storage.flush_sync()
+
+    async def _fold(self, folded):
+        if folded:
+            self.storage.queue("DELETE FROM journal WHERE seq <= ?", (folded[-1]["seq"],))
+        await self.storage.flush()
+
+    async def _persist_undo(self, undone):
+        for record in undone: # Newest first
+            self.storage.queue_changes(record["undo"], record["set"])
+        self.storage.queue("DELETE FROM journal WHERE seq >= ?", (undone[-1]["seq"],))
+        await self.storage.flush()
+
+class SqlitePlayerDatabase(PlayerDatabase):
+    """PlayerDatabase kept in SQLite. Sold players keep their row with an
+    owner, so taking one out of the pool is a single UPDATE."""
+
+    def __init__(self, storage):
+        super().__init__(storage.file)
+        self.storage = storage
+
+    def _read_players(self):
+        return self.storage.read_players()
+
+    async def read_details(self, key):
+        return await run_io(self.storage.read_player_details, key)
+
+    def remove(self, key, owner=None):
+        entry = super().remove(key, owner)
+        self.storage.queue("UPDATE players SET owner = ? WHERE key = ?", (owner or "", key))
+        return entry
+
+    def put(self, key, entry):
+        super().put(key, entry)
+        self.storage.put_player(key, entry)
+
+    async def put_many(self, entries):
+        self._put_hot(entries)
+        self.storage.put_players(entries) # Details go in the same rows
+        self.save()
+
+    async def import_players(self, lines, fmt, overwrite=False):
+        """Like PlayerDatabase.import_players(), but a row matching a sold
+        player updates its row and leaves it with its owner."""
+        await self.storage.flush() # Owners in the table must be current
+        sold = await run_io(self.storage.sold_players)
+        report = await run_io(read_player_import, lines, fmt, {**sold, **self._import_keys()}, overwrite)
+        owned = set(sold.values())
+        pool = {key: entry for key, entry in report.entries.items() if key not in owned}
+        if pool:
+            await self.put_many(pool)
+        if len(pool) < len(report.entries):
+            self.storage.put_players({key: entry for key, entry in report.entries.items() if key in owned})
+            self.save()
+        return report
+
+    async def export_players(self, stream, fmt):
+        await self.flush() # Export what the table holds after every queued change
+        return await run_io(write_player_export, stream, fmt, self.storage.export_players())
+
+    async def flush(self):
+        self._cancel_flush()
+        self._dirty = False
+        await self.storage.flush()
+
+    def flush_sync(self):
+        self._cancel_flush()
+        self._dirty = False
+        self.storage.flush_sync()
+
+# --- Auction Contexts ---
+
+class RenderCache:
+    """Rendered output keyed by what it was built from. Everything is thrown
+    away as soon as the version of the underlying data moves on."""
+
+    def __init__(self):
+        self.version = None
+        self._entries = {}
+
+    def get(self, version, key, build):
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+        if key not in self._entries:
+            self._entries[key] = build()
+        return self._entries[key]
+
+class AuctionContext:
+    """One auction: its state, its player pool and its countdown tasks.
+    Contexts are independent, so one bot process can run several leagues."""
+
+    def __init__(self, key, data_dir):
+        self.key = key
+        self.data_dir = data_dir
+        if STORAGE_BACKEND == 'sqlite':
+            self.storage = SqliteStorage(os.path.join(data_dir, SQLITE_FILE), data_dir)
+            self.auction = SqliteAuctionState(self.storage)
+            self.player_db = SqlitePlayerDatabase(self.storage)
+        else:
+            self.auction = AuctionState(os.path.join(data_dir, DATA_FILE), os.path.join(data_dir, JOURNAL_FILE))
+            self.player_db = PlayerDatabase(os.path.join(data_dir, PLAYER_DB_FILE))
+        self.lot_timer = (key, "lot")     # TimerService key of the player on the block
+        self.steal_timer = (key, "steal") # TimerService key of the open steal window
+        self.bid_queue = asyncio.Queue()     # (message, bid, lot name or parallel (number, key)) waiting for the consumer
+        self.bid_consumer = None             # Task running process_bids()
+        self.lot_message = None   # The live "on the block" embed of the current lot
+        self.board_dirty = False  # lot_message is behind the auction state
+        self.board_updater = None # Task applying coalesced edits to lot_message
+        self.player_pages = RenderCache() # /listplayers pages for the current player pool
+        self.board_renders = RenderCache() # /status and /team embeds for the current state
+        self.draft_scheduler = None # DraftScheduler of the running draft, built on first use
+
+    def parallel_timer(self, number):
+        """TimerService key of one of the parallel lots."""
+        return (self.key, "lot", number)
+
+    def cancel_timers(self):
+        """Stops every countdown this auction has running."""
+        bot.timers.cancel(self.lot_timer)
+        bot.timers.cancel(self.steal_timer)
+        for number in range(1, MAX_PARALLEL_LOTS + 1):
+            bot.timers.cancel(self.parallel_timer(str(number)))
+
+    async def load(self):
+        await self.auction.load()
+        await self.player_db.load()
+
+    async def flush(self):
+        """Returns once this auction's state and player pool are on disk."""
+        with phase("save"):
+            await self.auction.flush()
+            await self.player_db.flush()
+
+    def flush_sync(self):
+        self.auction.flush_sync()
+        self.player_db.flush_sync()
+
+# --- Global State Variables ---
+bot.auctions = {} # context key (channel or guild id) -> AuctionContext
+
+def context_key(guild_id, channel_id):
+    """The id an auction is registered under for a message or interaction."""
+    if AUCTION_SCOPE == 'guild' and guild_id:
+        return guild_id
+    return channel_id
+
+def top_level_key():
+    """The context that keeps using the top-level data files: the
+    AUCTION_CHANNEL_ID channel, or None if that can't name a context
+    (unset, or AUCTION_SCOPE=guild where keys are guild ids)."""
+    if AUCTION_CHANNEL_ID and AUCTION_SCOPE != 'guild':
+        return AUCTION_CHANNEL_ID
+    return None
+
+def context_dir(key):
+    if key == top_level_key():
+        return '.' # Single-league setups keep the original file layout
+    return os.path.join(AUCTIONS_DIR, str(key))
+
+def has_unclaimed_auction():
+    """True if the top-level files hold an auction that no context owns:
+    one from before multi-league support, with no AUCTION_CHANNEL_ID to claim it."""
+    return top_level_key() is None and any(os.path.exists(f) for f in (DATA_FILE, SQLITE_FILE))
+
+def claims_unclaimed_auction(interaction, create):
+    """Whether this interaction may take over an unclaimed top-level auction:
+    an administrator setting up an auction here, or anything in the
+    configured AUCTION_CHANNEL_ID (only reachable with AUCTION_SCOPE=guild)."""
+    if AUCTION_CHANNEL_ID and interaction.channel_id == AUCTION_CHANNEL_ID:
+        return True
+    return create and interaction.permissions.administrator
+
+def load_contexts():
+    """Registers every auction that already has data on disk."""
+    key = top_level_key()
+    if key and key not in bot.auctions:
+        bot.auctions[key] = AuctionContext(key, '.')
+    if os.path.isdir(AUCTIONS_DIR):
+        for name in os.listdir(AUCTIONS_DIR):
+            if name.isdecimal() and int(name) not in bot.auctions:
+                bot.auctions[int(name)] = AuctionContext(int(name), context_dir(int(name)))
+
+def get_context(guild_id, channel_id):
+    """Looks up the auction registered for a guild/channel, if any."""
+    return bot.auctions.get(context_key(guild_id, channel_id))
+
+def _prepare_context_dir(data_dir, claim):
+    os.makedirs(data_dir, exist_ok=True)
+    if claim and has_unclaimed_auction():
+        # The first auction used after an upgrade carries on the existing one
+        for name in (DATA_FILE, JOURNAL_FILE, SQLITE_FILE, SQLITE_FILE + '-wal', SQLITE_FILE + '-shm'):
+            if os.path.exists(name):
+                os.replace(name, os.path.join(data_dir, name))
+        print(f"Moved the existing top-level auction into {data_dir}")
+    player_file = os.path.join(data_dir, PLAYER_DB_FILE)
+    if not os.path.exists(player_file) and os.path.exists(PLAYER_DB_FILE):
+        shutil.copy(PLAYER_DB_FILE, player_file)
+
+async def create_context(key, claim=False):
+    """Sets up a new auction, seeding its player pool from the master database.
+    With `claim`, an unclaimed top-level auction becomes this one."""
+    data_dir = context_dir(key)
+    await run_io(_prepare_context_dir, data_dir, claim)
+    if key not in bot.auctions: # Another command may have raced us here
+        bot.auctions[key] = AuctionContext(key, data_dir)
+    return bot.auctions[key]
+
+async def require_context(interaction: discord.Interaction, create=False):
+    """The auction for this interaction, or None after telling the user there isn't one."""
+    ctx = get_context(interaction.guild_id, interaction.channel_id)
+    claim = claims_unclaimed_auction(interaction, create)
+    if ctx is None and (create or claim and await run_io(has_unclaimed_auction)):
+        ctx = await create_context(context_key(interaction.guild_id, interaction.channel_id), claim)
+    if ctx is None:
+        await interaction.response.send_message("❌ There is no auction in this channel. An admin can set one up with `/addmanager`.", ephemeral=True)
+        return None
+    with phase("load"):
+        await ctx.load()
+    return ctx
+
+load_contexts()
 
 # --- Helper Functions ---
 
+def new_manager(name, budget):
+    """A fresh manager entry for the auction data."""
+    return {
+        "name": name,
+        "budget": budget,
+        "spent": 0,
+        "players": [],
+        "retained_player": None
+    }
+
+def split_batch(text):
+    """The items of a batch command's list: one per line, or separated by ';' or ','."""
+    return [item.strip() for item in re.split(r"[;,\n]", text) if item.strip()]
+
+def batch_rejection(errors, limit=15):
+    """The reply for a batch command that was rejected as a whole."""
+    lines = [f"• {error}" for error in errors[:limit]]
+    if len(errors) > limit:
+        lines.append(f"• ...and {len(errors) - limit} more")
+    return ("❌ **Nothing was changed.** Fix these and send the whole list again:\n" + "\n".join(lines))[:2000]
+
 def get_player_count(manager_data):
     """Calculates the total number of players for a manager."""
     return len(manager_data['players']) + (1 if manager_data['retained_player'] else 0)
 
+async def player_autocomplete(interaction: discord.Interaction, current: str):
+    """Suggests players from this auction's pool as the user types."""
+    ctx = get_context(interaction.guild_id, interaction.channel_id)
+    if ctx is None or not current.strip():
+        return []
+    await ctx.player_db.load()
+    players = ctx.player_db.data
+    return [discord.app_commands.Choice(name=f"{players[key]['name']} ({players[key]['ovr']} OVR)"[:100], value=players[key]['name'][:100])
+            for key in ctx.player_db.index.search(current)]
+
+def player_not_found(ctx, name, suffix=""):
+    """The "not found" reply for a player lookup, with the closest names as hints."""
+    message = f"❌ Player **{name}** not found in the database.{suffix}"
+    suggestions = ctx.player_db.suggest(name)
+    if suggestions:
+        message += "\nDid you mean: " + ", ".join(f"**{s}**" for s in suggestions) + "?"
+    return message
+
 def get_managers_with_zero_money(data):
     """Counts managers with $0 budget."""
     return sum(1 for m in data["managers"].values() if m["budget"] == 0)
 
-async def send_status_embed(interaction: discord.Interaction, title_suffix=""):
-    """Sends a formatted embed of the auction status."""
-    data = load_data(DATA_FILE)
+def build_status_embed(ctx, title_suffix):
+    """The manager board part of /status, without the live countdown."""
+    data = ctx.auction.data
     embed = discord.Embed(
         title=f"FIFA Auction - Live Status {title_suffix}",
         color=discord.Color.brand_green()
     )
-    
+
     if not data["managers"]:
         embed.description = "No managers in the auction. Use `/addmanager` to get started."
-        if interaction.response.is_done():
-            await interaction.followup.send(embed=embed, ephemeral=True)
-        else:
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-        return
+        return embed
 
     sorted_managers = sorted(data["managers"].values(), key=lambda m: m['budget'], reverse=True)
     player_cap = data.get("player_cap", DEFAULT_PLAYER_CAP)
@@ -112,7 +1784,43 @@ async def send_status_embed(interaction: discord.Interaction, title_suffix=""):
             f"**Players:** {player_count} / {player_cap}"
         )
         embed.add_field(name=f"Manager: {name}", value=field_value, inline=True)
-    
+    return embed
+
+async def send_status_embed(ctx, interaction: discord.Interaction, title_suffix=""):
+    """Sends a formatted embed of the auction status."""
+    data = ctx.auction.data
+    # Rendered once per state version: repeated /status calls just reuse it
+    embed = ctx.board_renders.get(ctx.auction.version, ("status", title_suffix),
+                                  lambda: build_status_embed(ctx, title_suffix))
+
+    if not data["managers"]:
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=embed, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    # Show the live lot and how long is left on its countdown
+    if data["on_the_block"]:
+        embed = embed.copy() # The countdown changes without a new version
+        timer = ctx.steal_timer if data["auction_state"] == "drafting" else ctx.lot_timer
+        remaining = bot.timers.remaining(timer)
+        value = f"**Current Bid:** ${data['current_bid']:,}"
+        if data["current_bidder"] in data["managers"]:
+            value += f" by {data['managers'][data['current_bidder']]['name']}"
+        if remaining is not None:
+            value += f"\n⏳ **{remaining:.1f}s** remaining"
+        embed.add_field(name=f"On the Block: {data['on_the_block']['name']}", value=value, inline=False)
+    elif data.get("lots"):
+        embed = embed.copy()
+        lines = []
+        for number, lot in data["lots"].items():
+            line = f"**{number}.** {lot['player']['name']}: ${lot['current_bid']:,}"
+            if lot["current_bidder"] in data["managers"]:
+                line += f" by {data['managers'][lot['current_bidder']]['name']}"
+            lines.append(line)
+        embed.add_field(name=f"On the Block: {len(lines)} Lots", value="\n".join(lines), inline=False)
+
     # Send the response
     try:
         if not interaction.response.is_done():
@@ -124,215 +1832,766 @@ async def send_status_embed(interaction: discord.Interaction, title_suffix=""):
 
 # --- NEW: Auto-Auction Functions ---
 
-async def call_next_player(channel: discord.TextChannel):
+def build_lot_embed(ctx):
+    """The "on the block" embed for the current lot, or None if nothing is on the block."""
+    data = ctx.auction.data
+    if data.get("lots"):
+        return build_parallel_lots_embed(ctx)
+    player = data["on_the_block"]
+    if not player:
+        return None
+
+    embed = discord.Embed(
+        title=f"🔔 ON THE BLOCK: {player['name']} ({player['ovr']} OVR) 🔔",
+        description=f"Team: **{player['team']}**\nBidding starts at: **${player['base_price']:,}**",
+        color=discord.Color.blue()
+    )
+
+    bidder = data["managers"].get(data["current_bidder"]) if data["current_bidder"] else None
+    embed.add_field(name="Current Bid", value=f"**${data['current_bid']:,}**", inline=True)
+    embed.add_field(name="High Bidder", value=bidder["name"] if bidder else "No bids yet", inline=True)
+
+    remaining = bot.timers.remaining(ctx.lot_timer)
+    if data["auction_state"] == "paused":
+        embed.add_field(name="Closes", value="⏸️ Paused", inline=True)
+    elif remaining is not None:
+        # Discord counts a relative timestamp down on its own, no edits needed
+        embed.add_field(name="Closes", value=f"⏳ <t:{int(time.time() + remaining) + 1}:R>", inline=True)
+    return embed
+
+def build_parallel_lots_embed(ctx):
+    """One embed for all the open parallel lots, a field per lot."""
+    data = ctx.auction.data
+    embed = discord.Embed(
+        title=f"🔔 ON THE BLOCK: {len(data['lots'])} LOTS AT ONCE 🔔",
+        description="Bid with `lot:amount`, e.g. `2:45` bids **$45M** on lot 2.",
+        color=discord.Color.blue()
+    )
+    for number, lot in data["lots"].items():
+        player = lot["player"]
+        bidder = data["managers"].get(lot["current_bidder"]) if lot["current_bidder"] else None
+        value = f"{player['team']} | **${lot['current_bid']:,}** | {bidder['name'] if bidder else 'No bids yet'}"
+        remaining = bot.timers.remaining(ctx.parallel_timer(number))
+        if data["auction_state"] == "paused":
+            value += " | ⏸️ Paused"
+        elif remaining is not None:
+            value += f" | ⏳ <t:{int(time.time() + remaining) + 1}:R>"
+        embed.add_field(name=f"Lot {number}: {player['name']} ({player['ovr']} OVR)", value=value, inline=False)
+    return embed
+
+async def post_lot_board(ctx, channel: discord.TextChannel):
+    """Sends the embed that this lot's bids will edit in place."""
+    ctx.board_dirty = False
+    ctx.lot_message = await channel.send(embed=build_lot_embed(ctx))
+
+def refresh_lot_board(ctx):
+    """Marks the lot embed stale. Edits are coalesced to BOARD_EDITS_PER_SECOND,
+    so a bidding war costs a handful of API calls instead of one per bid."""
+    if ctx.lot_message is None:
+        return
+    ctx.board_dirty = True
+    if ctx.board_updater is None or ctx.board_updater.done():
+        ctx.board_updater = start_background_task(update_lot_board(ctx))
+
+async def update_lot_board(ctx):
+    """Applies pending edits to the lot embed, at most BOARD_EDITS_PER_SECOND."""
+    while ctx.board_dirty and ctx.lot_message is not None:
+        ctx.board_dirty = False
+        embed = build_lot_embed(ctx)
+        if embed is None:
+            return # The lot closed; its result is announced separately
+        try:
+            await ctx.lot_message.edit(embed=embed)
+        except discord.HTTPException as e:
+            print(f"Failed to update the lot embed: {e}")
+        await bot.clock.sleep(1 / BOARD_EDITS_PER_SECOND)
+
+async def call_next_player(ctx, channel: discord.TextChannel):
     """Puts the next player from the queue on the block."""
-    if bot.current_auction_task:
-        bot.current_auction_task.cancel()
-        bot.current_auction_task = None
+    bot.timers.cancel(ctx.lot_timer)
         
-    data = load_data(DATA_FILE)
+    data = ctx.auction.data
     
     # Check if draft mode should start
-    if await check_and_start_draft(channel):
+    if await check_and_start_draft(ctx, channel):
         return # Draft mode has been initiated, stop auction queue
 
     if data["auction_queue_index"] >= len(data["auction_queue"]):
         await channel.send("🎉 **The auction queue is empty!** 🎉\nAll players have been auctioned. Moving to Draft Mode.")
         data["auction_state"] = "idle" # Set to idle before starting draft
-        save_data(data, DATA_FILE)
-        await check_and_start_draft(channel) # This will now start the draft
+        ctx.auction.commit("lot")
+        await check_and_start_draft(ctx, channel) # This will now start the draft
         return
 
     player_key = data["auction_queue"][data["auction_queue_index"]]
     data["auction_queue_index"] += 1
     
-    player_db = load_data(PLAYER_DB_FILE)
+    player_db = ctx.player_db.data
     
     if player_key not in player_db:
         await channel.send(f"Player key `{player_key}` not in database. Skipping...")
-        save_data(data, DATA_FILE)
-        await call_next_player(channel) # Immediately call the next one
+        ctx.auction.commit("lot")
+        await call_next_player(ctx, channel) # Immediately call the next one
         return
         
     player = player_db[player_key]
+    if data.get("parallel_lots", 1) > 1 and player_tier(player.get("ovr", 0)) >= PARALLEL_LOT_TIER:
+        await open_parallel_lots(ctx, channel, player_key)
+        return
     
     # Set auction state
     data["auction_state"] = "bidding"
     data["on_the_block"] = player
     data["current_bid"] = player["base_price"]
     data["current_bidder"] = None # No bidder yet
-    save_data(data, DATA_FILE)
-    
-    # Announce the new player
-    embed = discord.Embed(
-        title=f"🔔 ON THE BLOCK: {player['name']} ({player['ovr']} OVR) 🔔",
-        description=f"Team: **{player['team']}**\nBidding starts at: **${player['base_price']:,}**",
-        color=discord.Color.blue()
-    )
-    await channel.send(embed=embed)
-    
+    apply_max_bids(ctx) # Max bids set while the player was queued open the bidding
     # NEW: Start the initial 5-second countdown for the first bid
-    bot.current_initial_bid_task = bot.loop.create_task(
-        initial_bid_countdown(channel, player["name"])
-    )
+    start_lot_countdown(ctx, channel, player["name"])
+    ctx.auction.commit("lot", f"{player['name']} on the block")
+
+    # Announce the new player; bids update this embed instead of posting
+    await post_lot_board(ctx, channel)
+
+async def open_parallel_lots(ctx, channel: discord.TextChannel, first_key):
+    """Puts `first_key` and up to parallel_lots - 1 more players of its tier
+    from the queue on the block together, each with its own bids and countdown.
+    As each lot closes, the next player of the tier takes its place."""
+    data = ctx.auction.data
+    tier = player_tier(ctx.player_db.data[first_key].get("ovr", 0))
+    keys = [first_key]
+    while len(keys) < data["parallel_lots"]:
+        player_key = next_parallel_key(ctx, tier)
+        if player_key is None:
+            break
+        keys.append(player_key)
+
+    data["auction_state"] = "lots"
+    data["lots"] = {}
+    for number, player_key in enumerate(keys, 1):
+        put_parallel_lot(ctx, channel, str(number), player_key)
+    ctx.auction.commit("lot", f"{', '.join(ctx.player_db.data[k]['name'] for k in keys)} on the block")
+    await post_lot_board(ctx, channel)
+
+def next_parallel_key(ctx, tier):
+    """Takes the next queued player of `tier` for a parallel lot, or returns
+    None once the queue moves on to another tier or runs out."""
+    data = ctx.auction.data
+    player_db = ctx.player_db.data
+    while data["auction_queue_index"] < len(data["auction_queue"]):
+        player_key = data["auction_queue"][data["auction_queue_index"]]
+        if player_key in player_db and player_tier(player_db[player_key].get("ovr", 0)) != tier:
+            return None # The next tier waits for these lots to finish
+        data["auction_queue_index"] += 1
+        if player_key in player_db:
+            return player_key
+    return None
+
+def put_parallel_lot(ctx, channel: discord.TextChannel, number, player_key):
+    """Opens parallel lot `number` for a player, its countdown running unless the auction is paused."""
+    data = ctx.auction.data
+    player = ctx.player_db.data[player_key]
+    data["lots"][number] = {"key": player_key, "player": player, "current_bid": player["base_price"],
+                            "current_bidder": None, "deadline": None}
+    if data["auction_state"] == "lots":
+        start_parallel_countdown(ctx, channel, number)
+
+# --- Clock ---
+
+class Clock:
+    """Real time. Every countdown and pause in the auction goes through
+    bot.clock, so a simulation can swap in a VirtualClock."""
+
+    def now(self):
+        return time.monotonic()
+
+    def wall_time(self):
+        """Seconds since the epoch, for deadlines that must survive a restart."""
+        return time.time()
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+    async def wait(self, event, timeout):
+        """Waits for `event` to be set, giving up after `timeout` seconds (None = forever)."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+class VirtualClock(Clock):
+    """Simulated time: sleeping costs no wall time at all.
+
+    Time only moves inside run(): whenever every task is parked on a
+    clock sleep and no storage work is in flight, the clock jumps straight
+    to the earliest deadline. A full
+    season of countdowns and pauses replays in a fraction of a second.
+    """
+
+    SETTLE_ROUNDS = 20 # Loop iterations that count as "every task is parked"
+
+    def __init__(self):
+        self._now = 0.0
+        self._epoch = time.time()
+        self._sleepers = [] # (deadline, seq, future)
+        self._seq = 0
+
+    def now(self):
+        return self._now
+
+    def wall_time(self):
+        return self._epoch + self._now
+
+    async def sleep(self, seconds):
+        future = asyncio.get_running_loop().create_future()
+        self._seq += 1
+        heapq.heappush(self._sleepers, (self._now + max(0, seconds), self._seq, future))
+        await future # A cancelled sleeper is skipped when its deadline comes up
+
+    async def wait(self, event, timeout):
+        if timeout is None:
+            await event.wait()
+            return
+        waiters = [asyncio.create_task(event.wait()), asyncio.create_task(self.sleep(timeout))]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def run(self, coro):
+        """Runs `coro` to completion, advancing virtual time whenever it's blocked."""
+        task = asyncio.create_task(coro)
+        while not task.done():
+            for _ in range(self.SETTLE_ROUNDS):
+                await asyncio.sleep(0)
+            while self._sleepers and self._sleepers[0][2].done():
+                heapq.heappop(self._sleepers)
+            if task.done():
+                break
+            if bot.io_in_flight or not self._sleepers:
+                await asyncio.sleep(0.001) # Blocked on real I/O (e.g. the storage thread)
+                continue
+            deadline, _, future = heapq.heappop(self._sleepers)
+            self._now = max(self._now, deadline)
+            future.set_result(None)
+        return task.result()
+
+bot.clock = Clock()
+
+def use_clock(clock):
+    """Switches every countdown and pause over to `clock`."""
+    bot.clock = clock
+    bot.timers.clock = clock
 
 # --- Auction Countdown Logic ---
-async def initial_bid_countdown(channel: discord.TextChannel, player_name: str):
-    """The task that runs the *initial* 5s countdown when a player is nominated."""
-    try:
-        await asyncio.sleep(BID_COUNTDOWN_SECONDS)
-        
-        # --- NO BIDS! ---
-        # If we got here without being cancelled, no one bid.
-        data = load_data(DATA_FILE)
-        
-        # Check if the auction is still active for this player and no bids came in
-        if (data["auction_state"] == "bidding" and 
-            data["on_the_block"] and 
-            data["on_the_block"]["name"] == player_name and 
-            data["current_bidder"] is None):
-            
-            await channel.send(f"⏰ **Time's up!** No bids for **{player_name}**.\n"
-                               f"Marked as **UNSOLD**.")
-            
-            # Reset auction state
-            data["auction_state"] = "idle"
-            data["on_the_block"] = None
-            data["current_bid"] = 0
-            data["current_bidder"] = None
-            save_data(data, DATA_FILE)
-            
-            bot.current_initial_bid_task = None
-            
-            # Automatically call the next player
-            await channel.send("Getting the next player...")
-            await asyncio.sleep(2) # Brief pause
-            await call_next_player(channel)
-
-    except asyncio.CancelledError:
-        # This is expected! It means a bid came in.
-        # The `on_message` function will handle the next step.
-        return
-async def auction_countdown(channel: discord.TextChannel, player_name: str, final_bid: int, bidder_key: str):
-    """The task that runs the live auction countdown."""
-    data = load_data(DATA_FILE)
-    if bidder_key not in data["managers"]:
-        await channel.send(f"Error: Bidder {bidder_key} not found in manager list. Cancelling auction.")
+
+class TimerService:
+    """Every countdown in the process, driven by one scheduler task.
+
+    A timer is just an absolute deadline on its clock plus the coroutine
+    to run when it passes. A new bid moves the deadline in place with
+    `extend()`, so nothing is cancelled or respawned per bid.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self._timers = {}   # key -> (deadline, callback)
+        self._heap = []     # (deadline, seq, key); entries go stale when a timer moves
+        self._seq = 0
+        self._wakeup = None
+        self._task = None
+        self._running = set() # Fired callbacks still in progress
+
+    def set(self, key, seconds, callback):
+        """Starts (or restarts) a timer that awaits `callback()` after `seconds`."""
+        self._timers[key] = (self.clock.now() + seconds, callback)
+        self._schedule(key)
+
+    def extend(self, key, seconds):
+        """Moves a running timer's deadline to `seconds` from now."""
+        if key not in self._timers:
+            return False
+        self._timers[key] = (self.clock.now() + seconds, self._timers[key][1])
+        self._schedule(key)
+        return True
+
+    def cancel(self, key):
+        self._timers.pop(key, None)
+
+    def __len__(self):
+        return len(self._timers)
+
+    def callbacks_running(self):
+        return len(self._running)
+
+    def remaining(self, key):
+        """Seconds left on a timer, or None if it isn't running."""
+        if key not in self._timers:
+            return None
+        return max(0.0, self._timers[key][0] - self.clock.now())
+
+    def _schedule(self, key):
+        self._seq += 1
+        heapq.heappush(self._heap, (self._timers[key][0], self._seq, key))
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = start_background_task(self._run())
+        else:
+            self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            # Drop heap entries for timers that were moved or cancelled
+            while self._heap and self._timers.get(self._heap[0][2], (None,))[0] != self._heap[0][0]:
+                heapq.heappop(self._heap)
+
+            timeout = None
+            if self._heap:
+                deadline, _, key = self._heap[0]
+                timeout = deadline - self.clock.now()
+                if timeout <= 0:
+                    heapq.heappop(self._heap)
+                    _, callback = self._timers.pop(key)
+                    bot.metrics.observe("auction_countdown_drift_seconds", -timeout)
+                    task = start_background_task(callback())
+                    self._running.add(task)
+                    task.add_done_callback(self._callback_done)
+                    continue
+
+            self._wakeup.clear()
+            await self.clock.wait(self._wakeup, timeout)
+
+    def _callback_done(self, task):
+        self._running.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"Countdown callback failed with error: {task.exception()!r}")
+
+bot.timers = TimerService(bot.clock)
+
+bot.metrics.gauge("auction_timers_active", lambda: len(bot.timers))
+bot.metrics.gauge("auction_timer_callbacks_running", lambda: bot.timers.callbacks_running())
+bot.metrics.gauge("auction_bid_consumers", lambda: sum(1 for ctx in bot.auctions.values()
+                                                       if ctx.bid_consumer and not ctx.bid_consumer.done()))
+bot.metrics.gauge("auction_bids_queued", lambda: sum(ctx.bid_queue.qsize() for ctx in bot.auctions.values()))
+bot.metrics.gauge("auction_contexts", lambda: len(bot.auctions))
+bot.metrics.gauge("auction_asyncio_tasks", lambda: len(asyncio.all_tasks()))
+bot.metrics.gauge("auction_lots_per_minute", lambda: bot.metrics.per_minute("auction_lots_closed_total"))
+
+def save_countdown(ctx, kind, channel, seconds, drafter_key=None):
+    """Notes a countdown's wall-clock deadline in the auction data (saved with
+    the caller's next commit) so resume_countdowns() can pick it up after a restart."""
+    ctx.auction.data["countdown"] = {"kind": kind, "deadline": bot.clock.wall_time() + seconds,
+                                     "channel_id": channel.id, "drafter": drafter_key}
+
+def start_lot_countdown(ctx, channel: discord.TextChannel, player_name: str, seconds=None):
+    """Gives the player on the block BID_COUNTDOWN_SECONDS to attract a bid."""
+    seconds = BID_COUNTDOWN_SECONDS if seconds is None else seconds
+    bot.timers.set(ctx.lot_timer, seconds, lambda: close_lot(ctx, channel, player_name))
+    save_countdown(ctx, "lot", channel, seconds)
+
+def extend_lot_countdown(ctx, channel: discord.TextChannel, player_name: str):
+    """Pushes the lot's deadline back after a bid instead of restarting the countdown."""
+    if bot.timers.extend(ctx.lot_timer, BID_COUNTDOWN_SECONDS):
+        save_countdown(ctx, "lot", channel, BID_COUNTDOWN_SECONDS)
+    else:
+        start_lot_countdown(ctx, channel, player_name)
+
+def start_steal_countdown(ctx, channel: discord.TextChannel, player_name: str, drafter_key: str, seconds=None):
+    seconds = STEAL_COUNTDOWN_SECONDS if seconds is None else seconds
+    bot.timers.set(ctx.steal_timer, seconds, lambda: close_steal_window(ctx, channel, player_name, drafter_key))
+    save_countdown(ctx, "steal", channel, seconds, drafter_key)
+
+def start_parallel_countdown(ctx, channel: discord.TextChannel, number, seconds=None):
+    """Gives one parallel lot BID_COUNTDOWN_SECONDS to attract a bid. Each lot
+    keeps its own deadline so resume_countdowns() can restart them all."""
+    seconds = BID_COUNTDOWN_SECONDS if seconds is None else seconds
+    lot = ctx.auction.data["lots"][number]
+    player_key = lot["key"]
+    bot.timers.set(ctx.parallel_timer(number), seconds, lambda: close_parallel_lot(ctx, channel, number, player_key))
+    lot["deadline"] = bot.clock.wall_time() + seconds
+    save_countdown(ctx, "lots", channel, seconds)
+
+def extend_parallel_countdown(ctx, channel: discord.TextChannel, number):
+    if bot.timers.extend(ctx.parallel_timer(number), BID_COUNTDOWN_SECONDS):
+        ctx.auction.data["lots"][number]["deadline"] = bot.clock.wall_time() + BID_COUNTDOWN_SECONDS
+    else:
+        start_parallel_countdown(ctx, channel, number)
+
+async def open_steal_window(ctx, channel: discord.TextChannel, player: dict, drafter_key: str):
+    """Announces a draft pick and gives everyone STEAL_COUNTDOWN_SECONDS to /steal it."""
+    data = ctx.auction.data
+    if drafter_key not in data["managers"]:
+        await channel.send(f"Error: Drafter {drafter_key} not found. Cancelling draft pick.")
         return
-        
-    manager_name = data["managers"][bidder_key]["name"]
-    
-    await channel.send(f"🔥 **New High Bid!** **{manager_name}** bids **${final_bid:,}** for **{player_name}**.\n"
-                       f"Going once... going twice... ⏳ (`{BID_COUNTDOWN_SECONDS}` seconds)")
-    
-    try:
-        await asyncio.sleep(BID_COUNTDOWN_SECONDS)
-        
-        # --- SOLD! ---
-        data = load_data(DATA_FILE)
-        
-        if data["auction_state"] != "bidding" or not data["on_the_block"] or data["on_the_block"]["name"] != player_name:
-            bot.current_auction_task = None
+
+    drafter_name = data["managers"][drafter_key]["name"]
+    await channel.send(f"**{drafter_name}** has drafted **{player['name']}** ({player['ovr']} OVR).\n"
+                       f"The steal price is **${player['base_price']:,}**.\n"
+                       f"Any manager with funds has **{STEAL_COUNTDOWN_SECONDS}** seconds to `/steal`! ⏳")
+
+    start_steal_countdown(ctx, channel, player["name"], drafter_key)
+    ctx.auction.save()
+
+async def resume_countdowns(ctx):
+    """After a restart, restarts the lot or steal countdown that was running
+    when the bot went down, with the time it had left."""
+    data = ctx.auction.data
+    countdown = data.get("countdown")
+    kind = {"bidding": "lot", "lots": "lots", "drafting": "steal"}.get(data["auction_state"])
+    if not countdown or countdown["kind"] != kind or not (data["on_the_block"] or data.get("lots")):
+        return
+    if kind == "lots":
+        await resume_parallel_lots(ctx, countdown["channel_id"])
+        return
+    timer = ctx.lot_timer if kind == "lot" else ctx.steal_timer
+    if bot.timers.remaining(timer) is not None:
+        return # Still running: this is just a reconnect
+    channel = bot.get_channel(countdown["channel_id"])
+    if channel is None:
+        try:
+            channel = await bot.fetch_channel(countdown["channel_id"])
+        except discord.HTTPException as e:
+            print(f"Could not resume the countdown in channel {countdown['channel_id']}: {e}")
             return
 
-        if bidder_key not in data["managers"]:
-             await channel.send(f"Error: Winning bidder {bidder_key} no longer exists. Sale voided.")
-             bot.current_auction_task = None
-             return
-             
-        manager = data["managers"][bidder_key]
-        player = data["on_the_block"] # Get OVR from here
-        
-        # Process Sale
-        manager["budget"] -= final_bid
-        manager["spent"] += final_bid
-        manager["players"].append(f"{player_name} ({player['ovr']} OVR) - ${final_bid/1_000_000:.0f}M")
-        
-        player_db = load_data(PLAYER_DB_FILE)
-        if player_name.lower() in player_db:
-            player_db.pop(player_name.lower())
-            save_data(player_db, PLAYER_DB_FILE)
+    seconds = max(0.0, countdown["deadline"] - bot.clock.wall_time())
+    player_name = data["on_the_block"]["name"]
+    if kind == "lot":
+        start_lot_countdown(ctx, channel, player_name, seconds)
+    else:
+        start_steal_countdown(ctx, channel, player_name, countdown["drafter"], seconds)
+    ctx.auction.save()
+    print(f"Resumed the {kind} countdown for {player_name} in channel {channel.id} ({seconds:.1f}s left)")
+    await channel.send(f"♻️ **Back online!** The countdown for **{player_name}** continues with **{seconds:.0f}** seconds left.")
+    if kind == "lot" and data["on_the_block"] and data["on_the_block"]["name"] == player_name:
+        await post_lot_board(ctx, channel) # Unless the countdown already ran out meanwhile
+
+async def resume_parallel_lots(ctx, channel_id):
+    """resume_countdowns() for parallel lots: every open lot gets the time it had left."""
+    data = ctx.auction.data
+    if any(bot.timers.remaining(ctx.parallel_timer(number)) is not None for number in data["lots"]):
+        return # Still running: this is just a reconnect
+    channel = bot.get_channel(channel_id)
+    if channel is None:
+        try:
+            channel = await bot.fetch_channel(channel_id)
+        except discord.HTTPException as e:
+            print(f"Could not resume the countdowns in channel {channel_id}: {e}")
+            return
+
+    now = bot.clock.wall_time()
+    for number, lot in data["lots"].items():
+        start_parallel_countdown(ctx, channel, number, max(0.0, (lot["deadline"] or now) - now))
+    ctx.auction.save()
+    print(f"Resumed {len(data['lots'])} parallel lot countdowns in channel {channel.id}")
+    await channel.send(f"♻️ **Back online!** The countdowns for the **{len(data['lots'])}** open lots continue where they left off.")
+    await post_lot_board(ctx, channel)
+
+async def close_lot(ctx, channel: discord.TextChannel, player_name: str):
+    """Runs when a lot's countdown runs out: sold to the high bidder, or unsold if nobody bid."""
+    data = ctx.auction.data
+
+    # Check if the auction is still active for this player
+    if data["auction_state"] != "bidding" or not data["on_the_block"] or data["on_the_block"]["name"] != player_name:
+        return
+    ctx.lot_message = None # Bids can no longer touch this lot's embed
+    player_key = block_key(ctx)
+    data.get("proxies", {}).pop(player_key, None) # Max bids only ever apply to one lot
+
+    if data["current_bidder"] is None:
+        # --- NO BIDS! ---
+        await channel.send(f"⏰ **Time's up!** No bids for **{player_name}**.\n"
+                           f"Marked as **UNSOLD**.")
         
-        data["auction_state"] = "idle" # Set to idle temporarily
+        # Reset auction state
+        data["auction_state"] = "idle"
         data["on_the_block"] = None
         data["current_bid"] = 0
         data["current_bidder"] = None
-        save_data(data, DATA_FILE)
-        
-        await channel.send(f"💸 **SOLD! {player_name}** joins **{manager_name}** for **${final_bid:,}**!\n"
-                           f"💰 {manager_name} has ${manager['budget']:,} remaining.")
-        
-        if manager["budget"] == 0:
-            await channel.send(f"🚨 **{manager_name}** has no money left! 🚨")
-        
-        bot.current_auction_task = None
+        ctx.auction.commit("lot", f"{player_name} unsold (no bids)")
+        bot.metrics.mark("auction_lots_closed_total", result="unsold")
         
         # Automatically call the next player
         await channel.send("Getting the next player...")
-        await asyncio.sleep(2) # Brief pause
-        await call_next_player(channel)
+        await bot.clock.sleep(NEXT_PLAYER_PAUSE_SECONDS) # Brief pause
+        await call_next_player(ctx, channel)
+        return
 
-    except asyncio.CancelledError:
-        await channel.send("...Bid interrupted! The auction continues! ⏳")
+    # --- SOLD! ---
+    bidder_key = data["current_bidder"]
+    final_bid = data["current_bid"]
+    if bidder_key not in data["managers"]:
+        await channel.send(f"Error: Winning bidder {bidder_key} no longer exists. Sale voided.")
+        return
+         
+    manager = data["managers"][bidder_key]
+    manager_name = manager["name"]
+    player = data["on_the_block"] # Get OVR from here
+    
+    # Process Sale
+    manager["budget"] -= final_bid
+    manager["spent"] += final_bid
+    how = "steal" if player.get("stolen") else "auction"
+    manager["players"].append(RosterEntry.from_player(player_key, player, how, final_bid))
+    
+    player_db = ctx.player_db.data
+    removed = {}
+    if player_key in player_db:
+        removed[player_key] = ctx.player_db.remove(player_key, bidder_key)
+    
+    data["auction_state"] = "idle" # Set to idle temporarily
+    data["on_the_block"] = None
+    data["current_bid"] = 0
+    data["current_bidder"] = None
+    ctx.auction.commit("sale", f"{player_name} sold to {manager_name} for ${final_bid:,}", removed)
+    bot.metrics.mark("auction_lots_closed_total", result="sold")
+    # A sale is never left in the write-behind buffer: it must be on disk
+    # before the next player is called
+    await ctx.flush()
+    
+    await channel.send(f"💸 **SOLD! {player_name}** joins **{manager_name}** for **${final_bid:,}**!\n"
+                       f"💰 {manager_name} has ${manager['budget']:,} remaining.")
+    
+    if manager["budget"] == 0:
+        await channel.send(f"🚨 **{manager_name}** has no money left! 🚨")
+    
+    # Automatically call the next player
+    await channel.send("Getting the next player...")
+    await bot.clock.sleep(NEXT_PLAYER_PAUSE_SECONDS) # Brief pause
+    await call_next_player(ctx, channel)
+
+async def close_parallel_lot(ctx, channel: discord.TextChannel, number, player_key, unsold=False):
+    """close_lot() for one parallel lot. The next player of the tier takes the
+    lot over in the same commit; once the tier runs out and the last lot
+    closes, the next player is called as usual."""
+    data = ctx.auction.data
+    lot = data.get("lots", {}).get(number)
+    if data["auction_state"] not in ("lots", "paused") or lot is None or lot["key"] != player_key:
+        return
+    if data["auction_state"] == "paused" and not unsold:
         return
+    bot.timers.cancel(ctx.parallel_timer(number))
+    del data["lots"][number]
+    data.get("proxies", {}).pop(player_key, None)
+
+    player = lot["player"]
+    next_key = None
+    if len(data["lots"]) < data.get("parallel_lots", 1):
+        next_key = next_parallel_key(ctx, player_tier(player.get("ovr", 0)))
+    if next_key is not None:
+        put_parallel_lot(ctx, channel, number, next_key)
+        up_next = f"\n🔔 Up next on lot {number}: **{data['lots'][number]['player']['name']}**"
+    else:
+        up_next = ""
+    last = not data["lots"]
+    if last:
+        data["auction_state"] = "idle"
+        ctx.lot_message = None # Bids can no longer touch this batch's embed
+
+    bidder_key, final_bid = lot["current_bidder"], lot["current_bid"]
+    if unsold or bidder_key not in data["managers"]:
+        ctx.auction.commit("unsold" if unsold else "lot", f"{player['name']} {'marked unsold' if unsold else 'unsold (no bids)'}")
+        bot.metrics.mark("auction_lots_closed_total", result="unsold")
+        if not unsold:
+            await channel.send(f"⏰ **Lot {number}:** no bids for **{player['name']}**. Marked as **UNSOLD**.{up_next}")
+    else:
+        manager = data["managers"][bidder_key]
+        manager["budget"] -= final_bid
+        manager["spent"] += final_bid
+        manager["players"].append(RosterEntry.from_player(player_key, player, "auction", final_bid))
+        removed = {}
+        if player_key in ctx.player_db.data:
+            removed[player_key] = ctx.player_db.remove(player_key, bidder_key)
+        ctx.auction.commit("sale", f"{player['name']} sold to {manager['name']} for ${final_bid:,}", removed)
+        bot.metrics.mark("auction_lots_closed_total", result="sold")
+        await ctx.flush() # As in close_lot: a sale is on disk before anything else happens
+        await channel.send(f"💸 **Lot {number} SOLD! {player['name']}** joins **{manager['name']}** for **${final_bid:,}**!\n"
+                           f"💰 {manager['name']} has ${manager['budget']:,} remaining.{up_next}")
+        if manager["budget"] == 0:
+            await channel.send(f"🚨 **{manager['name']}** has no money left! 🚨")
 
-async def steal_countdown(channel: discord.TextChannel, player_name: str, base_price: int, drafter_key: str):
-    """The task that runs the draft steal countdown."""
-    data = load_data(DATA_FILE)
-    if drafter_key not in data["managers"]:
-        await channel.send(f"Error: Drafter {drafter_key} not found. Cancelling draft pick.")
+    if not last:
+        refresh_lot_board(ctx)
+        return
+    await channel.send("Getting the next player...")
+    await bot.clock.sleep(NEXT_PLAYER_PAUSE_SECONDS) # Brief pause
+    await call_next_player(ctx, channel)
+
+async def close_steal_window(ctx, channel: discord.TextChannel, player_name: str, drafter_key: str):
+    """Runs when nobody stole a draft pick in time."""
+    # --- NOT STOLEN! ---
+    data = ctx.auction.data
+    if data["auction_state"] != "drafting" or not data["on_the_block"] or data["on_the_block"]["name"] != player_name:
         return
-        
-    drafter_name = data["managers"][drafter_key]["name"]
 
-    await channel.send(f"**{drafter_name}** has drafted **{player_name}** ({data['on_the_block']['ovr']} OVR).\n"
-                       f"The steal price is **${base_price:,}**.\n"
-                       f"Any manager with funds has **{STEAL_COUNTDOWN_SECONDS}** seconds to `/steal`! ⏳")
+    if drafter_key not in data["managers"]:
+         await channel.send(f"Error: Drafter {drafter_key} no longer exists. Pick voided.")
+         return
+
+    manager = data["managers"][drafter_key]
+    drafter_name = manager["name"]
+    player = data["on_the_block"] # Get OVR from here
+    player_key = ctx.player_db.find(player_name) or player_name.lower()
+    manager["players"].append(RosterEntry.from_player(player_key, player, "draft"))
     
-    try:
-        await asyncio.sleep(STEAL_COUNTDOWN_SECONDS)
-        
-        # --- NOT STOLEN! ---
-        data = load_data(DATA_FILE)
-        if data["auction_state"] != "drafting" or not data["on_the_block"] or data["on_the_block"]["name"] != player_name:
-            bot.current_steal_task = None
-            return
-
-        if drafter_key not in data["managers"]:
-             await channel.send(f"Error: Drafter {drafter_key} no longer exists. Pick voided.")
-             bot.current_steal_task = None
-             return
+    player_db = ctx.player_db.data
+    removed = {}
+    if player_key in player_db:
+        removed[player_key] = ctx.player_db.remove(player_key, drafter_key)
 
-        manager = data["managers"][drafter_key]
-        player = data["on_the_block"] # Get OVR from here
-        manager["players"].append(f"{player['name']} ({player['ovr']} OVR) - Draft")
-        
-        player_db = load_data(PLAYER_DB_FILE)
-        player_key = player_name.lower()
-        if player_key in player_db:
-            player_db.pop(player_key)
-            save_data(player_db, PLAYER_DB_FILE)
+    data["on_the_block"] = None
+    end_draft_turn(ctx, drafter_key)
+    ctx.auction.commit("draft", f"{player_name} drafted by {drafter_name}", removed)
+    
+    await channel.send(f"✅ **NOT STOLEN!** **{player_name}** officially joins **{drafter_name}**'s team!")
+    
+    await advance_draft(ctx, channel)
+
+# --- Season Analytics ---
+
+ACQUISITIONS = ("auction", "steal", "draft", "retained") # RosterEntry.how, coded by position
+
+def roster_columns(seasons):
+    """Flattens the rosters of one or more auctions (data dicts, oldest first)
+    into NumPy columns with one row per signing. Returns (columns, manager names)."""
+    codes = {how: code for code, how in enumerate(ACQUISITIONS)}
+    managers = {} # key -> column code; the same manager across seasons shares one
+    names = []
+    rows = []
+    for season, data in enumerate(seasons):
+        for key, manager in data["managers"].items():
+            if key not in managers:
+                managers[key] = len(names)
+                names.append(manager["name"])
+            code = managers[key]
+            entries = manager["players"] + ([manager["retained_player"]] if manager.get("retained_player") else [])
+            rows.extend((code, e.ovr, e.price, codes[e.how], season, e.at, slot) for slot, e in enumerate(entries))
+    table = np.array(rows, dtype=np.int64).reshape(-1, 7)
+    return dict(zip(("manager", "ovr", "price", "how", "season", "at", "slot"), table.T)), names
+
+def season_analytics(columns, manager_count):
+    """Sale statistics over roster_columns(). Everything is whole-array work,
+    so it stays instant on archives with hundreds of thousands of signings."""
+    ovr, price, how, manager = columns["ovr"], columns["price"], columns["how"], columns["manager"]
+    sold = (how == ACQUISITIONS.index("auction")) | (how == ACQUISITIONS.index("steal"))
+    sold_ovr, sold_price = ovr[sold], price[sold]
+    tier = (sold_ovr < TIER_FLOORS[0]).astype(np.int64) + (sold_ovr < TIER_FLOORS[1]) # 0-based
+    stats = {
+        "sales": int(sold.sum()),
+        "spent": int(sold_price.sum()),
+        "price_per_ovr": sold_price.sum() / sold_ovr.sum() if sold.any() else 0.0,
+        "tier_sales": np.bincount(tier, minlength=3),
+        "tier_spend": np.bincount(tier, weights=sold_price, minlength=3),
+        "steals": int((how == ACQUISITIONS.index("steal")).sum()),
+        "drafts": int((how == ACQUISITIONS.index("draft")).sum()),
+    }
 
-        data["on_the_block"] = None
-        data["draft_pick_index"] = (data["draft_pick_index"] + 1) % len(data["draft_order"])
-        save_data(data, DATA_FILE)
-        
-        await channel.send(f"✅ **NOT STOLEN!** **{player_name}** officially joins **{drafter_name}**'s team!")
-        bot.current_steal_task = None
-        
-        await advance_draft(channel)
+    # Inflation: price per OVR point over the later half of each tier's sales
+    # against the earlier half, in the order the lots were sold
+    order = np.lexsort((columns["slot"][sold], columns["at"][sold], columns["season"][sold], tier))
+    sorted_tier = tier[order]
+    rank = np.arange(len(order)) - np.searchsorted(sorted_tier, np.arange(3))[sorted_tier]
+    half = sorted_tier * 2 + (rank * 2 >= stats["tier_sales"][sorted_tier])
+    half_sales = np.bincount(half, minlength=6)
+    half_ppo = np.bincount(half, weights=sold_price[order] / np.maximum(sold_ovr[order], 1), minlength=6)
+    half_mean = half_ppo / np.maximum(half_sales, 1)
+    early, late = half_mean[0::2], half_mean[1::2]
+    stats["tier_inflation"] = np.where((half_sales[0::2] > 0) & (half_sales[1::2] > 0) & (early > 0),
+                                       late / np.where(early > 0, early, 1) - 1, np.nan)
+
+    # Manager efficiency: OVR points bought per $1M spent
+    spend = np.bincount(manager[sold], weights=sold_price, minlength=manager_count)
+    bought_ovr = np.bincount(manager[sold], weights=sold_ovr, minlength=manager_count)
+    squad = np.bincount(manager, minlength=manager_count)
+    stats["manager_spend"] = spend
+    stats["manager_efficiency"] = np.where(spend > 0, bought_ovr / np.maximum(spend, 1) * 1_000_000, np.nan)
+    stats["manager_players"] = squad
+    stats["manager_avg_ovr"] = np.bincount(manager, weights=ovr, minlength=manager_count) / np.maximum(squad, 1)
+    return stats
+
+def analytics_report(stats, names, top=10):
+    """(title, text) sections of the analytics report, used by /analytics and analytics.py."""
+    if not stats["sales"] and not stats["drafts"]:
+        return [("Analytics", "No sales or draft picks yet.")]
+    tiers = (f"{TIER_FLOORS[0]}+", f"{TIER_FLOORS[1]}-{TIER_FLOORS[0] - 1}", f"<={TIER_FLOORS[1] - 1}")
+    sections = [("Overview", f"Sales: {stats['sales']:,} for ${stats['spent']:,}\n"
+                             f"Price per OVR point: ${stats['price_per_ovr']:,.0f}")]
+
+    lines = []
+    for t, label in enumerate(tiers):
+        count, spend = int(stats["tier_sales"][t]), stats["tier_spend"][t]
+        average = f", ${spend / count:,.0f} avg" if count else ""
+        lines.append(f"Tier {t + 1} ({label} OVR): {count:,} sold, ${spend:,.0f}{average}")
+    sections.append(("Spend by Tier", "\n".join(lines)))
+
+    lines = [f"Tier {t + 1}: {change:+.0%}" if not np.isnan(change) else f"Tier {t + 1}: not enough sales"
+             for t, change in enumerate(stats["tier_inflation"])]
+    sections.append(("Inflation (price per OVR, late vs early lots)", "\n".join(lines)))
+
+    efficiency = stats["manager_efficiency"]
+    ranked = [m for m in np.argsort(-np.nan_to_num(efficiency, nan=-1.0), kind="stable") if not np.isnan(efficiency[m])]
+    lines = [f"{names[m]}: {efficiency[m]:.1f} OVR per $1M ({stats['manager_players'][m]} players, "
+             f"avg {stats['manager_avg_ovr'][m]:.1f} OVR)" for m in ranked[:top]]
+    sections.append(("Manager Efficiency", "\n".join(lines) or "Nobody has bought a player yet."))
+
+    picks = stats["steals"] + stats["drafts"]
+    if picks:
+        sections.append(("Steals", f"{stats['steals']} of {picks} draft picks stolen ({stats['steals'] / picks:.0%})"))
+    return sections
+
+def build_analytics_embed(ctx):
+    """The /analytics embed for one auction."""
+    columns, names = roster_columns([ctx.auction.data])
+    embed = discord.Embed(title="Season Analytics", color=discord.Color.gold())
+    for title, text in analytics_report(season_analytics(columns, len(names)), names):
+        embed.add_field(name=title, value=text[:1024], inline=False)
+    return embed
+
+# --- Metrics Endpoint ---
+
+bot.metrics_server = None
+
+async def serve_metrics(reader, writer):
+    """Answers GET /metrics with the Prometheus text format."""
+    try:
+        request_line = await reader.readline()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass # Headers don't matter
+        parts = request_line.split()
+        if len(parts) > 1 and parts[1] == b"/metrics":
+            status, body = "200 OK", bot.metrics.render().encode()
+        else:
+            status, body = "404 Not Found", b"Not found\n"
+        writer.write(f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
 
-    except asyncio.CancelledError:
-        await channel.send("...Steal initiated! The auction is now live! 💰")
+async def start_metrics_server():
+    """Starts the metrics endpoint if METRICS_PORT is set (once per process)."""
+    if not METRICS_PORT or bot.metrics_server is not None:
         return
+    try:
+        bot.metrics_server = await asyncio.start_server(serve_metrics, METRICS_HOST, METRICS_PORT)
+        print(f"Serving metrics on http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+    except OSError as e:
+        print(f"Failed to start the metrics endpoint: {e}")
 
 # --- Bot Startup ---
 
 @bot.event
 async def on_ready():
     print(f'Logged in as {bot.user.name} ({bot.user.id})')
-    load_data(DATA_FILE)
-    load_data(PLAYER_DB_FILE)
+    load_contexts()
+    for ctx in bot.auctions.values():
+        await ctx.load() # Warm the in-memory state once
+    print(f"Loaded {len(bot.auctions)} auction(s)")
+    # Lots and steal windows that were open when we went down carry on first
+    await asyncio.gather(*(resume_countdowns(ctx) for ctx in bot.auctions.values()))
+    await start_metrics_server()
     
     try:
         synced = await bot.tree.sync()
@@ -346,120 +2605,315 @@ async def on_ready():
 
 @bot.event
 async def on_message(message: discord.Message):
-    if message.author == bot.user:
-        return # Ignore the bot's own messages
-    
-    # This ensures slash commands are still processed
-    await bot.process_commands(message)
+    # --- Fast path: most traffic is chatter, drop it before touching any state ---
+    if message.author.bot:
+        return # Ignore our own (and other bots') messages
+
+    content = message.content.strip()
+    if content.startswith(bot.command_prefix):
+        # This ensures prefix commands are still processed
+        await bot.process_commands(message)
+        return
+
+    number, _, amount = content.rpartition(":")
+    if not amount.isdecimal() or (number and not number.isdecimal()):
+        return # Not a number (or lot:number), ignore
+
+    ctx = bot.auctions.get(context_key(message.guild and message.guild.id, message.channel.id))
+    if ctx is None:
+        return # No auction running here
 
-    data = load_data(DATA_FILE)
-    
     # Only listen for bids if the auction is in "bidding" state
-    if data["auction_state"] != "bidding":
+    data = ctx.auction.data
+    if data["auction_state"] == "bidding" and not number:
+        lot = data["on_the_block"]["name"]
+    elif data["auction_state"] == "lots":
+        if not number and len(data["lots"]) == 1:
+            number = next(iter(data["lots"]))
+        number = number.lstrip("0")
+        lot = (number, data["lots"][number]["key"] if number in data["lots"] else None)
+    else:
         return
 
-    # Try to parse the message as a number
-    try:
-        amount_in_millions = int(message.content)
-    except ValueError:
-        return # Not a number, ignore
+    # --- It's a bid! Only now is the message worth timing ---
+    await queue_bid(ctx, message, int(amount) * 1_000_000, lot)
+
+@profiled("on_message")
+async def queue_bid(ctx, message, amount, lot):
+    """Hands a bid to this auction's bid consumer, starting it if needed."""
+    ctx.bid_queue.put_nowait((message, amount, lot, time.perf_counter()))
+    if ctx.bid_consumer is None or ctx.bid_consumer.done():
+        ctx.bid_consumer = start_background_task(process_bids(ctx))
 
-    # --- It's a bid! ---
-    bidder_key = message.author.display_name.lower()
+def bid_rejection(data, bidder_key, new_bid, current_bid, current_bidder, mention, committed=0, leading=0):
+    """Returns why a bid can't be accepted, or None if it's valid. `committed`
+    and `leading` are the total and count of the bidder's leading bids on
+    other parallel lots, which the bid has to fit alongside."""
     if bidder_key not in data["managers"]:
-        await message.channel.send(f"🚫 {message.author.mention}, you are not a registered manager. Ask an admin to add you.", delete_after=10)
-        return
+        return f"🚫 {mention}, you are not a registered manager. Ask an admin to add you."
 
     manager = data["managers"][bidder_key]
-    player = data["on_the_block"]
-    new_bid = amount_in_millions * 1_000_000
-    
+
     # --- ALARM CHECKS ---
-    if new_bid <= data["current_bid"]:
-        await message.channel.send(f"🚫 **BID NOT VIABLE!** {message.author.mention}, your bid of **${new_bid:,}** must be *higher* than the current bid of **${data['current_bid']:,}**.", delete_after=10)
-        return
-        
-    if new_bid > manager["budget"]:
-        await message.channel.send(f"🚫 **MONEY OVER!** {message.author.mention}, you cannot afford this bid.\n"
-                                   f"Your Budget: **${manager['budget']:,}** | Your Bid: **${new_bid:,}**", delete_after=10)
-        return
+    if new_bid <= current_bid:
+        return (f"🚫 **BID NOT VIABLE!** {mention}, your bid of **${new_bid:,}** must be *higher* "
+                f"than the current bid of **${current_bid:,}**.")
+
+    if new_bid + committed > manager["budget"]:
+        leading_note = f" | Leading on other lots: **${committed:,}**" if committed else ""
+        return (f"🚫 **MONEY OVER!** {mention}, you cannot afford this bid.\n"
+                f"Your Budget: **${manager['budget']:,}**{leading_note} | Your Bid: **${new_bid:,}**")
 
     player_cap = data.get("player_cap", DEFAULT_PLAYER_CAP)
-    player_count = get_player_count(manager)
-    if player_count >= player_cap:
-        await message.channel.send(f"🚫 **TEAM CAP FULL!** {message.author.mention}, you already have {player_cap} players.", delete_after=10)
-        return
-    
-    if data["current_bidder"] == bidder_key:
-        await message.channel.send(f"❌ {message.author.mention}, you are already the highest bidder!", delete_after=10)
+    if get_player_count(manager) + leading >= player_cap:
+        if leading:
+            return f"🚫 **TEAM CAP FULL!** {mention}, your {leading} leading bid(s) on other lots would fill your {player_cap} spots."
+        return f"🚫 **TEAM CAP FULL!** {mention}, you already have {player_cap} players."
+
+    if current_bidder == bidder_key:
+        return f"❌ {mention}, you are already the highest bidder!"
+    return None
+
+def outstanding_bids(data, manager_key, skip=None):
+    """The total and count of a manager's leading bids on the open parallel
+    lots (other than lot `skip`): money and roster spots they may still owe."""
+    bids = [lot["current_bid"] for number, lot in data.get("lots", {}).items()
+            if number != skip and lot["current_bidder"] == manager_key]
+    return sum(bids), len(bids)
+
+def settle_parallel_bids(ctx, burst):
+    """process_bids() for parallel lots. Each lot keeps its own high bid, and
+    the bids are checked in arrival order against the bidder's leading bids
+    on the other lots. One commit for the burst; only lots whose price moved
+    get their countdown extended. Returns the rejections to send."""
+    data = ctx.auction.data
+    rejections, results, raised = [], {}, {}
+    for message, new_bid, lot_id, received in burst:
+        if not isinstance(lot_id, tuple):
+            results[message] = "stale"
+            continue # Sent while a single lot was on the block
+        number, player_key = lot_id
+        lot = data["lots"].get(number)
+        if player_key is None:
+            results[message] = "rejected"
+            rejections.append((message.channel, f"❌ {message.author.mention}, name the lot you're bidding on, "
+                                                f"e.g. `{next(iter(data['lots']))}:{new_bid // 1_000_000}`. "
+                                                f"Open lots: {', '.join(data['lots'])}."))
+            continue
+        if lot is None or lot["key"] != player_key:
+            results[message] = "stale"
+            continue # Meant for a lot that has already closed
+        bidder_key = message.author.display_name.lower()
+        committed, leading = outstanding_bids(data, bidder_key, skip=number)
+        reason = bid_rejection(data, bidder_key, new_bid, lot["current_bid"], lot["current_bidder"],
+                               message.author.mention, committed, leading)
+        if reason:
+            results[message] = "rejected"
+            rejections.append((message.channel, reason))
+        else:
+            results[message] = "outbid" # Unless a higher bid on this lot follows in this burst
+            lot["current_bid"], lot["current_bidder"] = new_bid, bidder_key
+            raised[number] = message
+
+    if raised:
+        notes = []
+        for number, message in raised.items():
+            results[message] = "accepted"
+            extend_parallel_countdown(ctx, message.channel, number)
+            lot = data["lots"][number]
+            notes.append(f"{data['managers'][lot['current_bidder']]['name']} bids ${lot['current_bid']:,} for {lot['player']['name']}")
+        ctx.auction.commit("bid", "; ".join(notes))
+        refresh_lot_board(ctx)
+
+    for message, _, _, received in burst:
+        bot.metrics.observe("auction_bid_seconds", time.perf_counter() - received)
+        bot.metrics.inc("auction_bids_total", result=results[message])
+    return rejections
+
+def block_key(ctx):
+    """The player pool key of the player on the block."""
+    name = ctx.auction.data["on_the_block"]["name"]
+    return ctx.player_db.find(name) or name.lower()
+
+def max_bid_reach(data, manager_key, max_bid):
+    """How far a max bid can actually go: no further than the manager's
+    budget, and nowhere once they are gone or their team is full."""
+    manager = data["managers"].get(manager_key)
+    if manager is None or get_player_count(manager) >= data.get("player_cap", DEFAULT_PLAYER_CAP):
+        return 0
+    return min(max_bid, manager["budget"])
+
+def resolve_max_bids(data, max_bids, current_bid, current_bidder):
+    """Settles a lot's max bids against its price, second-price style: the
+    highest max bid leads at MAX_BID_INCREMENT over the runner-up, or at its
+    own limit if that is lower. Ties go to the high bidder, then to whoever
+    set theirs first. Returns the new (bid, bidder)."""
+    reach = {key: max_bid_reach(data, key, max_bid) for key, max_bid in max_bids.items()}
+    ranked = [key for key in reach if reach[key] > current_bid and key != current_bidder]
+    if not ranked:
+        return current_bid, current_bidder
+    if current_bidder is not None:
+        reach[current_bidder] = max(current_bid, reach.get(current_bidder, 0))
+        ranked.insert(0, current_bidder)
+    ranked.sort(key=lambda key: -reach[key]) # Stable, so ties keep their order
+    leader = ranked[0]
+    if len(ranked) == 1:
+        return min(reach[leader], current_bid + MAX_BID_INCREMENT), leader
+    return min(reach[leader], reach[ranked[1]] + MAX_BID_INCREMENT), leader
+
+def apply_max_bids(ctx):
+    """Lets the max bids on the player on the block answer its current price.
+    Returns True if the price or the high bidder changed."""
+    data = ctx.auction.data
+    max_bids = data.get("proxies", {}).get(block_key(ctx))
+    if not max_bids:
+        return False
+    bid, bidder = resolve_max_bids(data, max_bids, data["current_bid"], data["current_bidder"])
+    if (bid, bidder) == (data["current_bid"], data["current_bidder"]):
+        return False
+    data["current_bid"], data["current_bidder"] = bid, bidder
+    return True
+
+async def process_bids(ctx):
+    """The single consumer of an auction's bid queue.
+
+    Takes a whole burst of queued bids at once and checks them in arrival
+    order, so near-simultaneous bids can't overwrite each other. Only the
+    highest valid bid of the burst is applied: one commit, one countdown
+    restart. Max bids then answer it in the same commit, so a bidding war
+    against a /maxbid is one round instead of one per step. Rejections are
+    sent afterwards, off the critical path.
+    """
+    while True:
+        burst = [await ctx.bid_queue.get()]
+        while not ctx.bid_queue.empty():
+            burst.append(ctx.bid_queue.get_nowait())
+
+        try:
+            await settle_bids(ctx, burst)
+        except Exception as e:
+            # One bad burst (a failed send, a bug) must not stop the auction taking bids
+            print(f"Failed to process {len(burst)} bid(s) in {ctx.key}: {e!r}")
+
+async def settle_bids(ctx, burst):
+    """Checks one burst of queued bids and applies the winner (see process_bids)."""
+    data = ctx.auction.data
+    if data["auction_state"] == "lots":
+        for channel, reason in settle_parallel_bids(ctx, burst):
+            await channel.send(reason, delete_after=10)
         return
-        
+    player = data["on_the_block"]
+    if data["auction_state"] != "bidding" or not player:
+        bot.metrics.inc("auction_bids_total", len(burst), result="stale")
+        return # The lot closed while these were queued
+
+    best_bid, best_bidder, best_message = data["current_bid"], data["current_bidder"], None
+    rejections = []
+    results = {}
+    for message, new_bid, lot_name, received in burst:
+        if lot_name != player["name"]:
+            results[message] = "stale"
+            continue # Meant for a lot that has already closed
+        bidder_key = message.author.display_name.lower()
+        reason = bid_rejection(data, bidder_key, new_bid, best_bid, best_bidder, message.author.mention)
+        if reason:
+            results[message] = "rejected"
+            rejections.append((message.channel, reason))
+        else:
+            results[message] = "outbid" # Unless nothing higher follows in this burst
+            best_bid, best_bidder, best_message = new_bid, bidder_key, message
+
     # --- BID ACCEPTED ---
+    if best_message:
+        # Update the auction state
+        data["current_bid"] = best_bid
+        data["current_bidder"] = best_bidder
+        apply_max_bids(ctx)
+        extend_lot_countdown(ctx, best_message.channel, player["name"])
+        manager_name = data["managers"][data["current_bidder"]]["name"]
+        ctx.auction.commit("bid", f"{manager_name} bids ${data['current_bid']:,} for {player['name']}")
 
-    # NEW: Cancel the *initial* bid timer if it's running
-    if bot.current_initial_bid_task:
-        bot.current_initial_bid_task.cancel()
-        bot.current_initial_bid_task = None
+        refresh_lot_board(ctx)
+        results[best_message] = "accepted"
+
+    for message, _, _, received in burst:
+        bot.metrics.observe("auction_bid_seconds", time.perf_counter() - received)
+        bot.metrics.inc("auction_bids_total", result=results[message])
+
+    for channel, reason in rejections:
+        await channel.send(reason, delete_after=10)
 
-    # Cancel the previous countdown
-    if bot.current_auction_task:
-        bot.current_auction_task.cancel()
-    
-    # Update the auction state
-    data["current_bid"] = new_bid
-    data["current_bidder"] = bidder_key
-    save_data(data, DATA_FILE)
-    
-    # Start the new countdown
-    bot.current_auction_task = bot.loop.create_task(
-        auction_countdown(message.channel, player["name"], new_bid, bidder_key)
-    )
 
 # --- Admin Slash Commands ---
 
 @tree.command(name="reset", description="Resets the auction, clearing all managers and rosters. (Admin Only)")
 @commands.has_permissions(administrator=True)
 async def reset_command(interaction: discord.Interaction):
+    ctx = await require_context(interaction, create=True)
+    if ctx is None:
+        return
     # 1. Load data to check state
-    data = load_data(DATA_FILE)
-
-    # 2. Cancel any running tasks
-    if data["auction_state"] == "bidding":
-        if bot.current_auction_task:
-            bot.current_auction_task.cancel()
-            bot.current_auction_task = None
-        if bot.current_initial_bid_task:
-            bot.current_initial_bid_task.cancel()
-            bot.current_initial_bid_task = None
-    elif data["auction_state"] == "drafting":
-        if bot.current_steal_task:
-            bot.current_steal_task.cancel()
-            bot.current_steal_task = None
+    data = ctx.auction.data
+
+    # 2. Cancel any running countdowns
+    if data["auction_state"] in ["bidding", "lots", "drafting"]:
+        ctx.cancel_timers()
 
     # 3. Get default auction data (this clears managers, state, queue, etc.)
-    new_data = get_default_data()
-    save_data(new_data, DATA_FILE)
+    ctx.auction.replace(get_default_data(), "reset", "Auction reset")
+    ctx.draft_scheduler = None
     
     # 4. Inform the admin.
     await interaction.response.send_message("🚨 **AUCTION RESET!** 🚨\nAll managers, player rosters, and budgets have been cleared.\n"
                                              "The **Player Database** has **NOT** been touched.\n"
                                              "Ready to start a new season. Use `/addmanager` to begin.")
 
-@tree.command(name="undo", description="Undoes the last transaction. (Admin Only)")
+@tree.command(name="undo", description="Undoes the last transaction(s). (Admin Only)")
+@discord.app_commands.describe(count="How many transactions to roll back (default 1)")
 @commands.has_permissions(administrator=True)
-async def undo_command(interaction: discord.Interaction):
-    if os.path.exists(BACKUP_FILE):
-        shutil.copy(BACKUP_FILE, DATA_FILE)
-        await interaction.response.send_message("⏪ **Last transaction undone!** The auction has been rolled back.")
-        await send_status_embed(interaction)
-    else:
-        await interaction.response.send_message("❌ No backup file found to undo.", ephemeral=True)
+async def undo_command(interaction: discord.Interaction, count: int = 1):
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    if count <= 0:
+        await interaction.response.send_message("❌ Count must be a positive number.", ephemeral=True)
+        return
+
+    undone = await ctx.auction.undo(count)
+    if not undone:
+        await interaction.response.send_message("❌ Nothing in the journal to undo.", ephemeral=True)
+        return
+
+    # Put back any players the undone transactions took out of the pool
+    for record in undone:
+        for player_key, entry in record.get("players", {}).items():
+            ctx.player_db.put(player_key, entry)
+
+    # Whatever timer was running belongs to the future we just threw away
+    ctx.cancel_timers()
+    ctx.draft_scheduler = None # Rosters and the draft order may have gone back too
+    ctx.lot_message = None # /resume posts a fresh embed for the restored lot
+
+    data = ctx.auction.data
+    if data["auction_state"] in ["bidding", "lots", "drafting"]:
+        data["auction_state"] = "paused"
+        ctx.auction.commit("state")
+
+    lines = [f"• {r['note'] or r['kind']}" for r in undone if r["kind"] not in INTERNAL_KINDS]
+    message = f"⏪ **{len(lines)} transaction(s) undone!** The auction has been rolled back.\n" + "\n".join(lines)
+    if data["auction_state"] == "paused":
+        message += "\nThe auction is **paused**. Use `/resume` to continue."
+    await interaction.response.send_message(message[:2000])
+    await send_status_embed(ctx, interaction)
 
 @tree.command(name="addmanager", description="Adds a new manager to the auction.")
 @discord.app_commands.describe(name="The manager's name (use quotes for spaces)", budget_in_millions="The starting budget (e.g., 1000)")
 @commands.has_permissions(administrator=True)
 async def addmanager_command(interaction: discord.Interaction, name: str, budget_in_millions: int):
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction, create=True)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     key = name.lower()
     
     if key in data["managers"]:
@@ -467,22 +2921,51 @@ async def addmanager_command(interaction: discord.Interaction, name: str, budget
         return
 
     budget = budget_in_millions * 1_000_000
-    data["managers"][key] = {
-        "name": name,
-        "budget": budget,
-        "spent": 0,
-        "players": [],
-        "retained_player": None
-    }
-    save_data(data, DATA_FILE)
+    data["managers"][key] = new_manager(name, budget)
+    ctx.draft_scheduler = None
+    ctx.auction.commit("manager", f"Added manager {name}")
     await interaction.response.send_message(f"✅ **Manager Added!** Welcome, **{name}**, with a budget of **${budget:,}**.")
-    await send_status_embed(interaction)
+    await send_status_embed(ctx, interaction)
+
+@tree.command(name="addmanagers", description="Adds several managers at once. (Admin Only)")
+@discord.app_commands.describe(managers="Name and budget in millions for each, separated by ; or , (e.g. Jai 500; Sahej 450)")
+@discord.app_commands.default_permissions(administrator=True)
+@discord.app_commands.checks.has_permissions(administrator=True)
+async def addmanagers_command(interaction: discord.Interaction, managers: str):
+    """Adds every manager in the list in one transaction, or none if any entry is wrong."""
+    ctx = await require_context(interaction, create=True)
+    if ctx is None:
+        return
+    data = ctx.auction.data
+    added, errors = {}, []
+    for item in split_batch(managers):
+        name, _, budget = item.rpartition(" ")
+        name = name.strip()
+        if not name or not budget.isdecimal():
+            errors.append(f"`{item}`: expected a name followed by a budget in millions")
+        elif name.lower() in data["managers"] or name.lower() in added:
+            errors.append(f"**{name}** already exists")
+        else:
+            added[name.lower()] = new_manager(name, int(budget) * 1_000_000)
+    if errors or not added:
+        await interaction.response.send_message(batch_rejection(errors or ["No managers given."]), ephemeral=True)
+        return
+
+    data["managers"].update(added)
+    ctx.draft_scheduler = None
+    ctx.auction.commit("manager", f"Added managers {', '.join(m['name'] for m in added.values())}")
+    lines = [f"• **{m['name']}** with **${m['budget']:,}**" for m in added.values()]
+    await interaction.response.send_message((f"✅ **{len(added)} Managers Added!**\n" + "\n".join(lines))[:2000])
+    await send_status_embed(ctx, interaction)
 
 @tree.command(name="removemanager", description="Removes a manager from the auction.")
 @discord.app_commands.describe(name="The name of the manager to remove")
 @commands.has_permissions(administrator=True)
 async def removemanager_command(interaction: discord.Interaction, name: str):
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     key = name.lower()
     
     if key not in data["managers"]:
@@ -490,50 +2973,72 @@ async def removemanager_command(interaction: discord.Interaction, name: str):
         return
         
     removed_manager = data["managers"].pop(key)
-    save_data(data, DATA_FILE)
+    ctx.auction.commit("manager", f"Removed manager {removed_manager['name']}")
     await interaction.response.send_message(f"🗑️ **Manager Removed!** **{removed_manager['name']}** has left the auction.")
-    await send_status_embed(interaction)
+    await send_status_embed(ctx, interaction)
 
 @tree.command(name="setcap", description="Sets the player cap for all teams.")
 @discord.app_commands.describe(cap="The max number of players per team (e.g., 18)")
 @commands.has_permissions(administrator=True)
 async def setcap_command(interaction: discord.Interaction, cap: int):
+    ctx = await require_context(interaction, create=True)
+    if ctx is None:
+        return
     if cap <= 0:
         await interaction.response.send_message("❌ Cap must be a positive number.", ephemeral=True)
         return
-    data = load_data(DATA_FILE)
+    data = ctx.auction.data
     data["player_cap"] = cap
-    save_data(data, DATA_FILE)
+    ctx.draft_scheduler = None # A higher cap can reopen full teams
+    ctx.auction.commit("cap", f"Team cap set to {cap}")
     await interaction.response.send_message(f"🧢 **Team cap set to {cap} players!**")
 
+@tree.command(name="setlots", description="Sets how many lower-tier players go on the block at once. (Admin Only)")
+@discord.app_commands.describe(lots=f"Players of tier {PARALLEL_LOT_TIER} auctioned in parallel (1 = one at a time, max {MAX_PARALLEL_LOTS})")
+@discord.app_commands.default_permissions(administrator=True)
+@discord.app_commands.checks.has_permissions(administrator=True)
+async def setlots_command(interaction: discord.Interaction, lots: int):
+    ctx = await require_context(interaction, create=True)
+    if ctx is None:
+        return
+    if not 1 <= lots <= MAX_PARALLEL_LOTS:
+        await interaction.response.send_message(f"❌ Lots must be between 1 and {MAX_PARALLEL_LOTS}.", ephemeral=True)
+        return
+    data = ctx.auction.data
+    data["parallel_lots"] = lots
+    ctx.auction.commit("lots", f"Parallel lots set to {lots}")
+    if lots == 1:
+        await interaction.response.send_message("🔔 **Parallel lots off:** every player is auctioned one at a time.")
+    else:
+        await interaction.response.send_message(f"🔔 **{lots} parallel lots!** Tier {PARALLEL_LOT_TIER} players go on the block "
+                                                f"{lots} at a time. Bid with `lot:amount`, e.g. `2:45`. Takes effect from the next batch.")
+
 @tree.command(name="pause", description="Pauses the current auction countdown.")
 @commands.has_permissions(administrator=True)
 async def pause_command(interaction: discord.Interaction):
-    data = load_data(DATA_FILE)
-    if data["auction_state"] not in ["bidding", "drafting"]:
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
+    if data["auction_state"] not in ["bidding", "lots", "drafting"]:
         await interaction.response.send_message("❌ No auction or draft is currently active.", ephemeral=True)
         return
 
-    # Cancel the running task(s)
-    if data["auction_state"] == "bidding":
-        if bot.current_auction_task:
-            bot.current_auction_task.cancel()
-            bot.current_auction_task = None
-        if bot.current_initial_bid_task:
-            bot.current_initial_bid_task.cancel()
-            bot.current_initial_bid_task = None
-    elif data["auction_state"] == "drafting" and bot.current_steal_task:
-        bot.current_steal_task.cancel()
-        bot.current_steal_task = None
+    # Stop the running countdown(s)
+    ctx.cancel_timers()
         
     data["auction_state"] = "paused"
-    save_data(data, DATA_FILE)
+    ctx.auction.save()
+    refresh_lot_board(ctx)
     await interaction.response.send_message("⏸️ **Auction Paused!** The countdown has been stopped.\n")
 
 @tree.command(name="resume", description="Resumes a paused auction.")
 @commands.has_permissions(administrator=True)
 async def resume_command(interaction: discord.Interaction):
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     if data["auction_state"] != "paused":
         await interaction.response.send_message("❌ No auction is currently paused.", ephemeral=True)
         return
@@ -541,127 +3046,284 @@ async def resume_command(interaction: discord.Interaction):
     await interaction.response.send_message("▶️ **Auction Resumed!**")
     
     # Check if we are resuming a bid or a steal
-    if data["on_the_block"] and data["current_bidder"]:
+    if data.get("lots"):
+        # Resuming parallel lots: each gets a fresh countdown
+        data["auction_state"] = "lots"
+        for number in data["lots"]:
+            start_parallel_countdown(ctx, interaction.channel, number)
+        ctx.auction.save()
+        await post_lot_board(ctx, interaction.channel)
+    elif data["on_the_block"] and data["current_bidder"]:
         # Resuming a "Going once..." bid
         data["auction_state"] = "bidding"
-        save_data(data, DATA_FILE)
-        bot.current_auction_task = bot.loop.create_task(
-            auction_countdown(interaction.channel, data["on_the_block"]["name"], data["current_bid"], data["current_bidder"])
-        )
+        apply_max_bids(ctx) # Max bids set during the pause
+        start_lot_countdown(ctx, interaction.channel, data["on_the_block"]["name"])
+        ctx.auction.save()
+        await post_lot_board(ctx, interaction.channel)
     elif data["on_the_block"] and not data["current_bidder"]:
         # Resuming an *initial* 5s bid
         data["auction_state"] = "bidding"
-        save_data(data, DATA_FILE)
-        bot.current_initial_bid_task = bot.loop.create_task(
-            initial_bid_countdown(interaction.channel, data["on_the_block"]["name"])
-        )
+        apply_max_bids(ctx) # Max bids set during the pause
+        start_lot_countdown(ctx, interaction.channel, data["on_the_block"]["name"])
+        ctx.auction.save()
+        await post_lot_board(ctx, interaction.channel)
     elif data["on_the_block"] and data["draft_order"]: 
          # Resuming a draft steal
         data["auction_state"] = "drafting"
-        save_data(data, DATA_FILE)
+        ctx.auction.save()
+        countdown = data.get("countdown") or {}
         drafter_key_index = data["draft_pick_index"]
-        if drafter_key_index == 0:
+        if countdown.get("kind") == "steal" and countdown.get("drafter"):
+             drafter_key = countdown["drafter"]
+        elif drafter_key_index == 0:
              drafter_key = data["draft_order"][0]
         else:
              drafter_key = data["draft_order"][data["draft_pick_index"] - 1] 
              
-        bot.current_steal_task = bot.loop.create_task(
-            steal_countdown(interaction.channel, data["on_the_block"]["name"], data["on_the_block"]["base_price"], drafter_key)
-        )
+        await open_steal_window(ctx, interaction.channel, data["on_the_block"], drafter_key)
     else:
         # Just unpausing, go to idle
         data["auction_state"] = "idle"
-        save_data(data, DATA_FILE)
+        ctx.auction.save()
 
 
 @tree.command(name="unsold", description="Marks the player on the block as unsold and calls the next player.")
+@discord.app_commands.describe(lot="With parallel lots: the lot to mark unsold (default: all of them)")
 @commands.has_permissions(administrator=True)
-async def unsold_command(interaction: discord.Interaction):
-    data = load_data(DATA_FILE)
-    if data["auction_state"] not in ["bidding", "paused"]:
+async def unsold_command(interaction: discord.Interaction, lot: int = None):
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
+    if data["auction_state"] not in ["bidding", "lots", "paused"]:
         await interaction.response.send_message("❌ No auction is currently active.", ephemeral=True)
         return
+
+    if data.get("lots"):
+        numbers = list(data["lots"]) if lot is None else [str(lot)]
+        if numbers[0] not in data["lots"]:
+            await interaction.response.send_message(f"❌ Lot {lot} is not open. Open lots: {', '.join(data['lots'])}.", ephemeral=True)
+            return
+        names = ", ".join(data["lots"][number]["player"]["name"] for number in numbers)
+        await interaction.response.send_message(f"🚫 **{names}** marked **UNSOLD** and returned to the player pool.")
+        for number in numbers:
+            await close_parallel_lot(ctx, interaction.channel, number, data["lots"][number]["key"], unsold=True)
+        return
         
-    if bot.current_auction_task:
-        bot.current_auction_task.cancel()
-        bot.current_auction_task = None
-    
-    if bot.current_initial_bid_task: # Corrected
-        bot.current_initial_bid_task.cancel()
-        bot.current_initial_bid_task = None
+    bot.timers.cancel(ctx.lot_timer)
+    ctx.lot_message = None
 
     player_name = data["on_the_block"]["name"]
+    data.get("proxies", {}).pop(block_key(ctx), None)
     data["auction_state"] = "idle" # Set to idle temporarily
     data["on_the_block"] = None
     data["current_bid"] = 0
     data["current_bidder"] = None
-    save_data(data, DATA_FILE)
+    ctx.auction.commit("unsold", f"{player_name} marked unsold")
+    bot.metrics.mark("auction_lots_closed_total", result="unsold")
 
     await interaction.response.send_message(f"🚫 **{player_name}** is **UNSOLD** and returns to the player pool.")
     
     # Automatically call the next player
     await interaction.channel.send("Getting the next player...")
-    await asyncio.sleep(2) # Brief pause
-    await call_next_player(interaction.channel)
+    await bot.clock.sleep(NEXT_PLAYER_PAUSE_SECONDS) # Brief pause
+    await call_next_player(ctx, interaction.channel)
+
+@tree.command(name="metrics", description="Shows the bot's performance numbers. (Admin Only)")
+@discord.app_commands.default_permissions(administrator=True)
+@discord.app_commands.checks.has_permissions(administrator=True)
+async def metrics_command(interaction: discord.Interaction):
+    metrics = bot.metrics
+
+    def ms(name, q, **labels):
+        value = metrics.quantile(name, q, **labels)
+        return "n/a" if value is None else f"{value * 1000:.1f}ms"
+
+    def total(name):
+        return sum(value for (counter, _), value in list(metrics.counters.items()) if counter == name)
+
+    embed = discord.Embed(title="📈 Bot Metrics", color=discord.Color.dark_teal())
+    embed.add_field(name="Bid Handling", inline=False, value=(
+        f"p50 {ms('auction_bid_seconds', 0.5)} | p95 {ms('auction_bid_seconds', 0.95)} | p99 {ms('auction_bid_seconds', 0.99)}\n"
+        f"{total('auction_bids_total')} bids handled"))
+    embed.add_field(name="Disk", inline=False, value=(
+        f"Writes p95 {ms('auction_save_seconds', 0.95, op='write')} | Appends p95 {ms('auction_save_seconds', 0.95, op='append')} | "
+        f"SQLite p95 {ms('auction_save_seconds', 0.95, op='sqlite')}\n"
+        f"{total('auction_save_bytes_total'):,} bytes written"))
+    embed.add_field(name="Countdowns", inline=False, value=(
+        f"Drift p95 {ms('auction_countdown_drift_seconds', 0.95)} | max of last {Metrics.WINDOW}: "
+        f"{ms('auction_countdown_drift_seconds', 1.0)}\n"
+        f"{len(bot.timers)} active, {bot.timers.callbacks_running()} running"))
+    embed.add_field(name="Discord API", inline=False, value=(
+        f"{total('auction_discord_requests_total')} requests | {total('auction_discord_rate_limits_total')} rate limits"))
+    embed.add_field(name="Throughput", inline=False, value=(
+        f"{metrics.per_minute('auction_lots_closed_total'):.1f} lots/min (last 10 min) | "
+        f"{len(asyncio.all_tasks())} asyncio tasks | {len(bot.auctions)} auction(s)"))
+    await interaction.response.send_message(embed=embed, ephemeral=True)
 
 # --- Player Database Commands ---
 
+def backup_player_db(player_file):
+    """Keeps a one-time copy of the player database before the first edit."""
+    backup_file = player_file + ".bak"
+    if not os.path.exists(backup_file) and os.path.exists(player_file):
+        shutil.copy(player_file, backup_file)
+
 @tree.command(name="editplayer", description="Add or edit a player in the player database.")
 @discord.app_commands.describe(name="Player's full name (use quotes)", team="Player's real-life team", ovr="Player OVR (e.g., 88)", base_price="Base price in millions (e.g., 10)")
+@discord.app_commands.autocomplete(name=player_autocomplete)
 @commands.has_permissions(administrator=True)
 async def editplayer_command(interaction: discord.Interaction, name: str, team: str, ovr: int, base_price: int):
-    if not os.path.exists(PLAYER_DB_FILE + ".bak"):
-        shutil.copy(PLAYER_DB_FILE, PLAYER_DB_FILE + ".bak")
+    ctx = await require_context(interaction, create=True)
+    if ctx is None:
+        return
+    await run_io(backup_player_db, ctx.player_db.file)
         
-    player_db = load_data(PLAYER_DB_FILE)
-    key = name.lower()
-    player_db[key] = {
+    key = ctx.player_db.find(name) or name.lower() # "Mbappe" edits the existing "Mbappé"
+    ctx.player_db.put(key, {
         "name": name,
         "team": team,
         "ovr": ovr,
         "base_price": base_price * 1_000_000
-    }
-    save_data(player_db, PLAYER_DB_FILE)
+    })
     await interaction.response.send_message(f"✅ **Player Database Updated!**\n"
                                           f"**{name}** ({ovr} OVR, Team: {team}, Base Price: ${base_price:,}M)")
 
+@tree.command(name="importplayers", description="Adds players from a CSV or JSONL file to the player database. (Admin Only)")
+@discord.app_commands.describe(file="A .csv (with a header row) or .jsonl file of players",
+                               overwrite="Replace players that are already in the database (default: skip them)")
+@discord.app_commands.default_permissions(administrator=True)
+@discord.app_commands.checks.has_permissions(administrator=True)
+async def importplayers_command(interaction: discord.Interaction, file: discord.Attachment, overwrite: bool = False):
+    ctx = await require_context(interaction, create=True)
+    if ctx is None:
+        return
+    fmt = player_file_format(file.filename)
+    if fmt is None:
+        await interaction.response.send_message("❌ Upload a `.csv` or `.jsonl` file.", ephemeral=True)
+        return
+    await interaction.response.defer(thinking=True)
+    try:
+        text = (await file.read()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        await interaction.followup.send("❌ The file isn't UTF-8 text.")
+        return
+    await run_io(backup_player_db, ctx.player_db.file)
+    report = await ctx.player_db.import_players(io.StringIO(text, newline=None), fmt, overwrite)
+    await ctx.player_db.flush() # One write for the whole file
+    await interaction.followup.send(f"📥 **Player import finished:** {report.summary()}"[:2000])
+
+@tree.command(name="exportplayers", description="Downloads the player database as CSV or JSONL. (Admin Only)")
+@discord.app_commands.choices(fmt=[
+    discord.app_commands.Choice(name="CSV", value="csv"),
+    discord.app_commands.Choice(name="JSONL", value="jsonl"),
+])
+@discord.app_commands.default_permissions(administrator=True)
+@discord.app_commands.checks.has_permissions(administrator=True)
+async def exportplayers_command(interaction: discord.Interaction, fmt: str = "csv"):
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    await interaction.response.defer(thinking=True)
+    workdir = await run_io(tempfile.mkdtemp)
+    try:
+        export_file = os.path.join(workdir, f"players.{fmt}")
+        stream = await run_io(open_player_export, export_file)
+        try:
+            count = await ctx.player_db.export_players(stream, fmt)
+        finally:
+            await run_io(stream.close)
+        upload = await run_io(discord.File, export_file)
+        await interaction.followup.send(f"📤 **{count}** players exported.", file=upload)
+    finally:
+        await run_io(shutil.rmtree, workdir, True)
+
+def render_player_page(ctx, filters, page):
+    """One page of /listplayers as (embed, page, page count). Cached until the pool changes."""
+    player_db = ctx.player_db
+    keys = ctx.player_pages.get(player_db.version, ("keys", filters), lambda: player_db.listing.query(*filters))
+    pages = max(1, math.ceil(len(keys) / PLAYERS_PER_PAGE))
+    page = min(max(page, 0), pages - 1)
+
+    def build():
+        embed = discord.Embed(title="Available Players", color=discord.Color.gold())
+        player_list = []
+        for key in keys[page * PLAYERS_PER_PAGE:(page + 1) * PLAYERS_PER_PAGE]:
+            player = player_db.data[key]
+            position = f" [{player['position']}]" if player.get("position") else ""
+            player_list.append(f"• **{player['name']}**{position} ({player['ovr']} OVR) - Team: {player['team']}, Base: ${player['base_price']:,}")
+        embed.description = "\n".join(player_list) or "No players match these filters."
+        embed.set_footer(text=f"Page {page + 1}/{pages} • {len(keys)} players")
+        return embed
+
+    return ctx.player_pages.get(player_db.version, ("page", filters, page), build), page, pages
+
+class PlayerListView(discord.ui.View):
+    """Prev/Next buttons that flip through /listplayers pages."""
+
+    def __init__(self, ctx, filters):
+        super().__init__(timeout=300)
+        self.ctx = ctx
+        self.filters = filters
+        self.page = 0
+
+    def render(self):
+        embed, self.page, pages = render_player_page(self.ctx, self.filters, self.page)
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= pages - 1
+        return embed
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page -= 1
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page += 1
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
 @tree.command(name="listplayers", description="Lists all available players from the database.")
-async def listplayers_command(interaction: discord.Interaction):
-    player_db = load_data(PLAYER_DB_FILE)
-    if not player_db:
+@discord.app_commands.describe(position="Only this position (e.g., ST)", team="Only this real-life team", tier="Only this auction tier")
+@discord.app_commands.choices(tier=[
+    discord.app_commands.Choice(name="Tier 1 (86+ OVR)", value=1),
+    discord.app_commands.Choice(name="Tier 2 (83-85 OVR)", value=2),
+    discord.app_commands.Choice(name="Tier 3 (<=82 OVR)", value=3),
+])
+async def listplayers_command(interaction: discord.Interaction, position: str = None, team: str = None, tier: int = None):
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    if not ctx.player_db.data:
         await interaction.response.send_message("Player database is empty. Use `/editplayer` to add players.", ephemeral=True)
         return
 
-    embed = discord.Embed(title="Available Players", color=discord.Color.gold())
-    
-    player_list = []
-    # Sort by OVR, then by name
-    sorted_players = sorted(player_db.values(), key=lambda p: (-p['ovr'], p['name']))
-    
-    for player in sorted_players:
-        player_list.append(f"• **{player['name']}** ({player['ovr']} OVR) - Team: {player['team']}, Base: ${player['base_price']:,}")
-
-    description = "\n".join(player_list)
-    if len(description) > 4000:
-        description = description[:4000] + "\n...and many more."
-        
-    embed.description = description
-    await interaction.response.send_message(embed=embed, ephemeral=True)
+    view = PlayerListView(ctx, PlayerListing.facet_values(position, team, tier))
+    # Only the caller sees the list, as before paging; their buttons flip only their copy
+    await interaction.response.send_message(embed=view.render(), view=view, ephemeral=True)
 
 @tree.command(name="playerinfo", description="Gets the info for one player.")
 @discord.app_commands.describe(name="Player's name")
+@discord.app_commands.autocomplete(name=player_autocomplete)
 async def playerinfo_command(interaction: discord.Interaction, name: str):
-    player_db = load_data(PLAYER_DB_FILE)
-    key = name.lower()
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    player_db = ctx.player_db.data
+    key = ctx.player_db.find(name)
     
-    if key not in player_db:
-        await interaction.response.send_message(f"❌ Player **{name}** not found in the database.", ephemeral=True)
+    if key is None:
+        await interaction.response.send_message(player_not_found(ctx, name), ephemeral=True)
         return
         
     player = player_db[key]
     embed = discord.Embed(title=f"{player['name']} ({player['ovr']} OVR)", color=discord.Color.blue())
     embed.add_field(name="Real Team", value=player['team'], inline=True)
     embed.add_field(name="Base Price", value=f"${player['base_price']:,}", inline=True)
+    if player.get("position"):
+        embed.add_field(name="Position", value=player["position"], inline=True)
+    for field, text in (await ctx.player_db.read_details(key)).items():
+        embed.add_field(name=field.replace("_", " ").title(), value=str(text)[:1024], inline=False)
     await interaction.response.send_message(embed=embed)
 
 # --- Live Auction Commands ---
@@ -669,8 +3331,11 @@ async def playerinfo_command(interaction: discord.Interaction, name: str):
 @tree.command(name="start", description="STARTS the tiered, automatic auction!")
 @commands.has_permissions(administrator=True)
 async def start_command(interaction: discord.Interaction):
-    data = load_data(DATA_FILE)
-    player_db = load_data(PLAYER_DB_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
+    player_db = ctx.player_db.data
     
     if data["auction_state"] != "idle":
         await interaction.response.send_message("❌ Cannot start! An auction or draft is already in progress.", ephemeral=True)
@@ -687,12 +3352,7 @@ async def start_command(interaction: discord.Interaction):
     await interaction.response.send_message("🚀 **Auction Starting!**\nBuilding player queue...")
 
     # --- Build the Queue ---
-    retained_players = set()
-    for m in data["managers"].values():
-        if m.get("retained_player"):
-            # Retained player is stored as "Name (OVR)"
-            retained_name = m["retained_player"].split(" (")[0].lower()
-            retained_players.add(retained_name)
+    retained_players = {m["retained_player"].key for m in data["managers"].values() if m.get("retained_player")}
     
     tier1 = [] # 86+
     tier2 = [] # 83-85
@@ -702,13 +3362,7 @@ async def start_command(interaction: discord.Interaction):
         if key in retained_players:
             continue # Skip retained player
         
-        ovr = player.get('ovr', 0)
-        if ovr >= 86:
-            tier1.append(key)
-        elif ovr >= 83:
-            tier2.append(key)
-        else:
-            tier3.append(key)
+        (tier1, tier2, tier3)[player_tier(player.get('ovr', 0)) - 1].append(key)
             
     # Shuffle each tier
     random.shuffle(tier1)
@@ -730,16 +3384,77 @@ async def start_command(interaction: discord.Interaction):
                                      f"Total: **{len(data['auction_queue'])}** players on the block.\n\n"
                                      f"Calling the first player...")
     
-    save_data(data, DATA_FILE)
-    await asyncio.sleep(3) # Dramatic pause
-    await call_next_player(interaction.channel)
+    ctx.auction.save()
+    await bot.clock.sleep(START_PAUSE_SECONDS) # Dramatic pause
+    await call_next_player(ctx, interaction.channel)
+
+@tree.command(name="maxbid", description="Sets a private max bid; the bot bids for you up to it.")
+@discord.app_commands.describe(amount_in_millions="The most you'll pay, in millions (0 cancels)",
+                               player="A player still to come; defaults to the one on the block")
+@discord.app_commands.autocomplete(player=player_autocomplete)
+async def maxbid_command(interaction: discord.Interaction, amount_in_millions: int, player: str = None):
+    """Registers a max bid that outbids rivals one step at a time, only as far as needed."""
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
+    bidder_key = interaction.user.display_name.lower()
+    on_the_block = data["on_the_block"] if data["auction_state"] in ("bidding", "paused") else None
+    if player is None and on_the_block is None:
+        await interaction.response.send_message("❌ Nobody is on the block. Name the player your max bid is for.", ephemeral=True)
+        return
+
+    player_key = block_key(ctx) if player is None else ctx.player_db.find(player)
+    if player_key is None:
+        await interaction.response.send_message(player_not_found(ctx, player), ephemeral=True)
+        return
+    live = on_the_block is not None and player_key == block_key(ctx)
+    target = on_the_block if live else ctx.player_db.data[player_key]
+    if not live and data.get("parallel_lots", 1) > 1 and player_tier(target.get("ovr", 0)) >= PARALLEL_LOT_TIER:
+        await interaction.response.send_message(f"❌ **{target['name']}** will be auctioned in parallel lots, "
+                                                f"which take typed `lot:amount` bids only.", ephemeral=True)
+        return
+    max_bid = amount_in_millions * 1_000_000
+    if max_bid > 0:
+        floor = data["current_bid"] if live else target["base_price"]
+        # No high bidder passed: raising your own max bid is fine while you lead
+        reason = bid_rejection(data, bidder_key, max_bid, floor, None, interaction.user.mention)
+        if reason:
+            await interaction.response.send_message(reason, ephemeral=True)
+            return
+
+    max_bids = data.setdefault("proxies", {}).setdefault(player_key, {})
+    max_bids.pop(bidder_key, None) # A changed max bid counts from now for ties
+    if max_bid > 0:
+        max_bids[bidder_key] = max_bid
+    elif not max_bids:
+        del data["proxies"][player_key]
+
+    moved = live and data["auction_state"] == "bidding" and apply_max_bids(ctx)
+    if moved:
+        extend_lot_countdown(ctx, interaction.channel, target["name"])
+    manager_name = data["managers"][bidder_key]["name"] if bidder_key in data["managers"] else interaction.user.display_name
+    verb = "sets" if max_bid > 0 else "cancels"
+    ctx.auction.commit("maxbid", f"{manager_name} {verb} a max bid for {target['name']}")
+    if moved:
+        refresh_lot_board(ctx)
+
+    if max_bid <= 0:
+        await interaction.response.send_message(f"🗑️ Your max bid for **{target['name']}** is cancelled.", ephemeral=True)
+        return
+    message = f"🤖 **Max bid set!** The bot will bid for you on **{target['name']}** up to **${max_bid:,}**."
+    if live and data["current_bidder"] == bidder_key:
+        message += f"\nYou lead at **${data['current_bid']:,}**."
+    elif live and data["auction_state"] == "bidding":
+        message += f"\nSomeone's max bid beats yours: the price is now **${data['current_bid']:,}**."
+    await interaction.response.send_message(message, ephemeral=True)
 
 
 # --- Draft Mode Commands ---
 
-async def check_and_start_draft(channel: discord.TextChannel):
+async def check_and_start_draft(ctx, channel: discord.TextChannel):
     """Checks if draft mode should be triggered and starts it. Returns True if draft started."""
-    data = load_data(DATA_FILE)
+    data = ctx.auction.data
     if data["auction_state"] == "drafting":
         return True # Already in draft mode
         
@@ -749,12 +3464,7 @@ async def check_and_start_draft(channel: discord.TextChannel):
     managers_at_zero = get_managers_with_zero_money(data)
     
     if managers_at_zero >= 3:
-        if bot.current_auction_task: # Cancel any pending sale
-            bot.current_auction_task.cancel()
-            bot.current_auction_task = None
-        if bot.current_initial_bid_task: # Also cancel initial task
-            bot.current_initial_bid_task.cancel()
-            bot.current_initial_bid_task = None
+        bot.timers.cancel(ctx.lot_timer) # Cancel any pending sale
             
         await channel.send(f"🚨 **{managers_at_zero} MANAGERS** have no money! **DRAFT MODE INITIATED!** 🚨")
         
@@ -768,56 +3478,127 @@ async def check_and_start_draft(channel: discord.TextChannel):
         data["auction_state"] = "drafting"
         data["draft_order"] = draft_order
         data["draft_pick_index"] = 0
-        save_data(data, DATA_FILE)
+        ctx.draft_scheduler = None
+        ctx.auction.save()
         
-        await advance_draft(channel)
+        await advance_draft(ctx, channel)
         return True
     return False
 
-async def advance_draft(channel: discord.TextChannel):
-    """Announces the next pick in the draft."""
-    data = load_data(DATA_FILE)
+async def advance_draft(ctx, channel: discord.TextChannel):
+    """Announces the next pick in the draft. The pick itself already moved
+    draft_pick_index past any full teams (see end_draft_turn)."""
+    data = ctx.auction.data
     if data["auction_state"] != "drafting":
         return
-        
+
+    scheduler = draft_scheduler(ctx)
     idx = data["draft_pick_index"]
-    
-    all_full = all(get_player_count(m) >= data["player_cap"] for m in data["managers"].values())
-    if all_full:
-        await channel.send("🎉 **All teams are full! The draft is complete!** 🎉")
-        data["auction_state"] = "idle"
-        save_data(data, DATA_FILE)
-        return
-        
     drafter_key = data["draft_order"][idx]
-    drafter_name = data["managers"][drafter_key]["name"]
-    
-    if get_player_count(data["managers"][drafter_key]) >= data["player_cap"]:
-        await channel.send(f"Skipping **{drafter_name}** (team full).")
-        data["draft_pick_index"] = (idx + 1) % len(data["draft_order"])
-        save_data(data, DATA_FILE)
-        await advance_draft(channel) 
-        return
+    if not scheduler.can_pick(drafter_key):
+        # Only at the start of a draft, or after /undo or /setcap rebuilt the rotation
+        drafter_key = scheduler.first_from(idx)
+        if drafter_key is None:
+            await channel.send("🎉 **All teams are full! The draft is complete!** 🎉")
+            data["auction_state"] = "idle"
+            ctx.auction.save()
+            return
+        idx = data["draft_pick_index"] = scheduler.position[drafter_key]
+        ctx.auction.save()
 
+    drafter_name = data["managers"][drafter_key]["name"]
     await channel.send(f"It is **Pick #{idx + 1}**.\n"
                        f"On the clock: **{drafter_name}**! Use `/draft [Player Name]`")
 
+def end_draft_turn(ctx, drafter_key):
+    """Hands the draft on from `drafter_key` to the next manager who can still
+    pick. Only moves draft_pick_index, so the pick stays one commit for the caller."""
+    following = draft_scheduler(ctx).after(drafter_key)
+    if following is not None:
+        ctx.auction.data["draft_pick_index"] = ctx.draft_scheduler.position[following]
+
+def draft_scheduler(ctx):
+    """The auction's DraftScheduler, built from its data on first use."""
+    if ctx.draft_scheduler is None:
+        ctx.draft_scheduler = DraftScheduler(ctx.auction.data)
+    return ctx.draft_scheduler
+
+class DraftScheduler:
+    """Whose pick is next in the draft, without scanning the league.
+
+    The managers who can still pick form a ring in draft order, so moving
+    on from a pick is one hop and a team that fills up is unlinked in O(1).
+    Drop it (ctx.draft_scheduler = None) after anything that can reopen a
+    team or reorder the draft: a new draft, /undo, /setcap, a new manager.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.order = data["draft_order"]
+        self.position = {key: i for i, key in enumerate(self.order)}
+        eligible = [key for key in self.order if self.can_pick(key)]
+        self._next = {key: eligible[(i + 1) % len(eligible)] for i, key in enumerate(eligible)}
+        self._prev = {key: eligible[i - 1] for i, key in enumerate(eligible)}
+
+    def __len__(self):
+        return len(self._next)
+
+    def can_pick(self, key):
+        manager = self.data["managers"].get(key)
+        return manager is not None and get_player_count(manager) < self.data.get("player_cap", DEFAULT_PLAYER_CAP)
+
+    def remove(self, key):
+        """Takes a manager out of the rotation."""
+        following, before = self._next.pop(key), self._prev.pop(key)
+        if following != key:
+            self._next[before], self._prev[following] = following, before
+
+    def after(self, key):
+        """The manager who picks after `key`, or None once nobody can. `key`
+        leaves the rotation if their team is now full, as does anyone found
+        full on the way (a steal or retention can fill a team between turns)."""
+        if key not in self._next:
+            return self.first_from(self.position.get(key, -1) + 1)
+        following = self._next[key]
+        if not self.can_pick(key):
+            self.remove(key)
+        while self._next and not self.can_pick(following):
+            skipped, following = following, self._next[following]
+            self.remove(skipped)
+        return following if self._next else None
+
+    def first_from(self, index):
+        """The first manager at or after draft_order[index] (wrapping round) who
+        can pick, or None. A scan, for when the current pick isn't in the ring."""
+        for step in range(len(self.order)):
+            key = self.order[(index + step) % len(self.order)]
+            if key in self._next and self.can_pick(key):
+                return key
+        return None
+
 @tree.command(name="startdraft", description="Manually start the draft. (Admin Only)")
 @commands.has_permissions(administrator=True)
 async def startdraft_command(interaction: discord.Interaction):
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     if data["auction_state"] not in ["idle", "paused"]:
         await interaction.response.send_message("❌ Cannot start draft! Auction or another draft is in progress.", ephemeral=True)
         return
         
     await interaction.response.send_message("Manually initiating draft...")
-    await check_and_start_draft(interaction.channel)
+    await check_and_start_draft(ctx, interaction.channel)
 
 
 @tree.command(name="draft", description="Draft a player when it's your turn.")
 @discord.app_commands.describe(name="The name of the player you are drafting")
+@discord.app_commands.autocomplete(name=player_autocomplete)
 async def draft_command(interaction: discord.Interaction, name: str):
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     
     if data["auction_state"] != "drafting":
         await interaction.response.send_message("❌ It is not draft mode.", ephemeral=True)
@@ -832,11 +3613,11 @@ async def draft_command(interaction: discord.Interaction, name: str):
         await interaction.response.send_message(f"❌ It's not your turn! It is **{drafter_name}**'s pick.", ephemeral=True)
         return
         
-    player_db = load_data(PLAYER_DB_FILE)
-    player_key = name.lower()
+    player_db = ctx.player_db.data
+    player_key = ctx.player_db.find(name)
     
-    if player_key not in player_db:
-        await interaction.response.send_message(f"❌ Player **{name}** not in database. Use `/editplayer` or pick another.", ephemeral=True)
+    if player_key is None:
+        await interaction.response.send_message(player_not_found(ctx, name, " Use `/editplayer` or pick another."), ephemeral=True)
         return
         
     player = player_db[player_key]
@@ -851,33 +3632,33 @@ async def draft_command(interaction: discord.Interaction, name: str):
                                        "No managers have enough money to steal. The pick is final!")
         
         manager = data["managers"][drafter_key]
-        manager["players"].append(f"{player['name']} ({player['ovr']} OVR) - Draft")
-        player_db.pop(player_key)
-        save_data(player_db, PLAYER_DB_FILE)
+        manager["players"].append(RosterEntry.from_player(player_key, player, "draft"))
+        removed = {player_key: ctx.player_db.remove(player_key, drafter_key)}
         
-        data["draft_pick_index"] = (data["draft_pick_index"] + 1) % len(data["draft_order"])
-        save_data(data, DATA_FILE)
+        end_draft_turn(ctx, drafter_key)
+        ctx.auction.commit("draft", f"{player['name']} drafted by {drafter_name}", removed)
         
-        await advance_draft(interaction.channel)
+        await advance_draft(ctx, interaction.channel)
         return
 
     # --- Start the Steal Countdown ---
     data["on_the_block"] = player
-    save_data(data, DATA_FILE)
+    ctx.auction.save()
     
-    bot.current_steal_task = bot.loop.create_task(
-        steal_countdown(interaction.channel, player["name"], base_price, drafter_key)
-    )
+    await open_steal_window(ctx, interaction.channel, player, drafter_key)
 
 @tree.command(name="steal", description="Steal the currently drafted player and start an auction!")
 async def steal_command(interaction: discord.Interaction):
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     
     if data["auction_state"] != "drafting" or not data["on_the_block"]:
         await interaction.response.send_message("❌ No player is currently being drafted or stolen.", ephemeral=True)
         return
         
-    if not bot.current_steal_task or bot.current_steal_task.done():
+    if bot.timers.remaining(ctx.steal_timer) is None:
         await interaction.response.send_message("❌ The steal window has closed!", ephemeral=True)
         return
 
@@ -905,33 +3686,46 @@ async def steal_command(interaction: discord.Interaction):
     # --- STEAL ACCEPTED ---
     await interaction.response.send_message(f"**{manager['name']}** is stealing!", ephemeral=True)
 
-    bot.current_steal_task.cancel()
-    bot.current_steal_task = None
+    bot.timers.cancel(ctx.steal_timer)
+    await interaction.channel.send("...Steal initiated! The auction is now live! 💰")
     
     data["auction_state"] = "bidding"
     data["current_bid"] = base_price
     data["current_bidder"] = stealer_key
-    save_data(data, DATA_FILE)
-    
-    bot.current_auction_task = bot.loop.create_task(
-        auction_countdown(interaction.channel, player["name"], base_price, stealer_key)
-    )
+    data["on_the_block"] = dict(player, stolen=True) # A copy: `player` is the player pool's entry
+    apply_max_bids(ctx)
+    start_lot_countdown(ctx, interaction.channel, player["name"])
+    ctx.auction.commit("steal", f"{manager['name']} steals {player['name']} for ${base_price:,}")
+
+    await post_lot_board(ctx, interaction.channel)
 
 # --- Public Slash Commands ---
 
 @tree.command(name="status", description="Displays the current auction board.")
 async def status_command(interaction: discord.Interaction):
-    await send_status_embed(interaction, title_suffix=f"({load_data(DATA_FILE)['auction_state']})")
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    await send_status_embed(ctx, interaction, title_suffix=f"({ctx.auction.data['auction_state']})")
 
 @tree.command(name="team", description="Shows the full squad for one manager.")
 @discord.app_commands.describe(name="The name of the manager")
 async def team_command(interaction: discord.Interaction, name: str):
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     key = name.lower()
     if key not in data["managers"]:
         await interaction.response.send_message(f"❌ **Error:** Manager '{name}' not found.", ephemeral=True)
         return
 
+    embed = ctx.board_renders.get(ctx.auction.version, ("team", key), lambda: build_team_embed(ctx, key))
+    await interaction.response.send_message(embed=embed)
+
+def build_team_embed(ctx, key):
+    """The /team squad report for one manager."""
+    data = ctx.auction.data
     manager = data["managers"][key]
     player_count = get_player_count(manager)
     player_cap = data.get("player_cap", DEFAULT_PLAYER_CAP)
@@ -941,15 +3735,20 @@ async def team_command(interaction: discord.Interaction, name: str):
         color=discord.Color.blue()
     )
     
-    embed.add_field(name="Retained Player", value=f"**{manager['retained_player']}**" if manager['retained_player'] else "None", inline=True)
+    retained = manager["retained_player"]
+    squad = manager["players"] + ([retained] if retained else [])
+    embed.add_field(name="Retained Player", value=f"**{retained.label()}**" if retained else "None", inline=True)
     embed.add_field(name="Remaining Budget", value=f"**${manager['budget']:,}**", inline=True)
     embed.add_field(name="Total Spent", value=f"${manager['spent']:,}", inline=True)
-    
+    if squad:
+        embed.add_field(name="Average OVR", value=f"{sum(entry.ovr for entry in squad) / len(squad):.1f}", inline=True)
+        embed.add_field(name="Drafted", value=str(sum(1 for entry in squad if entry.how == "draft")), inline=True)
+
     player_list = []
-    if manager["retained_player"]:
-        player_list.append(f"• **{manager['retained_player']}** (Retained)")
+    if retained:
+        player_list.append(f"• **{retained.label()}** (Retained)")
     
-    player_list.extend([f"• {player}" for player in manager['players']])
+    player_list.extend([f"• {entry.label()}" for entry in manager['players']])
     
     if not player_list:
         player_list_str = "No players yet."
@@ -959,15 +3758,29 @@ async def team_command(interaction: discord.Interaction, name: str):
              player_list_str = player_list_str[:1020] + "\n..."
 
     embed.add_field(name=f"Full Squad ({player_count} / {player_cap} players)", value=player_list_str, inline=False)
-    
+    return embed
+
+@tree.command(name="analytics", description="Shows price, tier, inflation and manager efficiency stats.")
+async def analytics_command(interaction: discord.Interaction):
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    if np is None:
+        await interaction.response.send_message("❌ Analytics needs NumPy. Install it with `pip install numpy`.", ephemeral=True)
+        return
+    embed = ctx.board_renders.get(ctx.auction.version, ("analytics",), lambda: build_analytics_embed(ctx))
     await interaction.response.send_message(embed=embed)
 
 @tree.command(name="retain", description="Retains one player for your team (Admin).")
 @discord.app_commands.describe(player_name="The name of the player to retain", manager_name="The manager who is retaining")
+@discord.app_commands.autocomplete(player_name=player_autocomplete)
 @commands.has_permissions(administrator=True)
 async def retain_command(interaction: discord.Interaction, player_name: str, manager_name: str):
     """Assigns a retained player to a manager."""
-    data = load_data(DATA_FILE)
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
     key = manager_name.lower()
     if key not in data["managers"]:
         await interaction.response.send_message(f"❌ **Error:** Manager '{manager_name}' not found.", ephemeral=True)
@@ -975,24 +3788,68 @@ async def retain_command(interaction: discord.Interaction, player_name: str, man
     
     manager = data["managers"][key]
     if manager["retained_player"]:
-        await interaction.response.send_message(f"⚠️ **{manager['name']}** has already retained **{manager['retained_player']}**! Use `/undo` to fix.", ephemeral=True)
+        await interaction.response.send_message(f"⚠️ **{manager['name']}** has already retained **{manager['retained_player'].label()}**! Use `/undo` to fix.", ephemeral=True)
         return
         
-    player_db = load_data(PLAYER_DB_FILE)
-    player_key = player_name.lower()
+    player_key = ctx.player_db.find(player_name)
     
-    if player_key not in player_db:
-        await interaction.response.send_message(f"❌ Player **{player_name}** not in database. Cannot retain.", ephemeral=True)
+    if player_key is None:
+        await interaction.response.send_message(player_not_found(ctx, player_name, " Cannot retain."), ephemeral=True)
         return
         
-    player_data = player_db.pop(player_key) # Remove from DB
-    save_data(player_db, PLAYER_DB_FILE)
+    player_data = ctx.player_db.remove(player_key, key) # Remove from DB
     
-    manager["retained_player"] = f"{player_data['name']} ({player_data['ovr']} OVR)"
-    save_data(data, DATA_FILE)
+    manager["retained_player"] = RosterEntry.from_player(player_key, player_data, "retained")
+    ctx.auction.commit("retain", f"{manager['name']} retains {player_data['name']}", {player_key: player_data})
     
     await interaction.response.send_message(f"✅ **{manager['name']}** has retained **{player_data['name']}**!")
-    await send_status_embed(interaction)
+    await send_status_embed(ctx, interaction)
+
+@tree.command(name="retainplayers", description="Assigns several retained players at once. (Admin Only)")
+@discord.app_commands.describe(retentions="Manager: Player pairs separated by ; or , (e.g. Jai: Mbappe; Sahej: Haaland)")
+@discord.app_commands.default_permissions(administrator=True)
+@discord.app_commands.checks.has_permissions(administrator=True)
+async def retainplayers_command(interaction: discord.Interaction, retentions: str):
+    """Assigns every retention in the list in one transaction, or none if any entry is wrong."""
+    ctx = await require_context(interaction)
+    if ctx is None:
+        return
+    data = ctx.auction.data
+    chosen, errors = {}, []
+    for item in split_batch(retentions):
+        manager_name, sep, player_name = item.partition(":")
+        manager_name, player_name = manager_name.strip(), player_name.strip()
+        manager = data["managers"].get(manager_name.lower())
+        player_key = ctx.player_db.find(player_name) if player_name else None
+        if not sep or not manager_name or not player_name:
+            errors.append(f"`{item}`: expected Manager: Player")
+        elif manager is None:
+            errors.append(f"Manager '{manager_name}' not found")
+        elif manager["retained_player"]:
+            errors.append(f"**{manager['name']}** has already retained **{manager['retained_player'].label()}**")
+        elif manager_name.lower() in chosen:
+            errors.append(f"**{manager['name']}** is listed more than once")
+        elif player_key is None:
+            errors.append(player_not_found(ctx, player_name).removeprefix("❌ "))
+        elif player_key in chosen.values():
+            errors.append(f"**{player_name}** is listed more than once")
+        else:
+            chosen[manager_name.lower()] = player_key
+    if errors or not chosen:
+        await interaction.response.send_message(batch_rejection(errors or ["No retentions given."]), ephemeral=True)
+        return
+
+    removed, lines = {}, []
+    for key, player_key in chosen.items():
+        manager = data["managers"][key]
+        player_data = ctx.player_db.remove(player_key, key)
+        manager["retained_player"] = RosterEntry.from_player(player_key, player_data, "retained")
+        removed[player_key] = player_data
+        lines.append(f"• **{manager['name']}** retains **{player_data['name']}**")
+    ctx.auction.commit("retain", f"{len(removed)} retentions", removed)
+
+    await interaction.response.send_message((f"✅ **{len(removed)} Players Retained!**\n" + "\n".join(lines))[:2000])
+    await send_status_embed(ctx, interaction)
 
 # --- Error Handling ---
 async def on_tree_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
@@ -1014,7 +3871,15 @@ async def on_tree_error(interaction: discord.Interaction, error: discord.app_com
 bot.tree.on_error = on_tree_error
 
 # --- Run Bot ---
-if not TOKEN:
-    print("FATAL ERROR: DISCORD_TOKEN not found in .env file.")
-else:
-    bot.run(TOKEN)
+if __name__ == "__main__":
+    if not TOKEN:
+        print("FATAL ERROR: DISCORD_TOKEN not found in .env file.")
+    else:
+        try:
+            bot.run(TOKEN)
+        finally:
+            # Clean shutdown: let queued writes finish, then write whatever is
+            # still in the write-behind buffer
+            STORAGE_EXECUTOR.shutdown(wait=True)
+            for ctx in bot.auctions.values():
+                ctx.flush_sync()
@@ -0,0 +1,68 @@
+"""Bulk import and export of a player database, without running the bot.
+
+Streams CSV (with a header row) or JSONL through the same validation as
+/importplayers and writes the result in one go: one pool file rewrite for
+JSON storage, one transaction for SQLite. Use '-' for stdin/stdout.
+
+    python playerdb.py import season.csv
+    python playerdb.py import season.jsonl --dir auctions/1234 --overwrite
+    python playerdb.py export players.jsonl --dir auctions/1234
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+import bot as auction_bot
+
+def open_pool(data_dir):
+    """The player database of an auction folder, on whichever backend it uses."""
+    sqlite_file = os.path.join(data_dir, auction_bot.SQLITE_FILE)
+    if auction_bot.STORAGE_BACKEND == 'sqlite' or os.path.exists(sqlite_file):
+        return auction_bot.SqlitePlayerDatabase(auction_bot.SqliteStorage(sqlite_file, data_dir))
+    return auction_bot.PlayerDatabase(os.path.join(data_dir, auction_bot.PLAYER_DB_FILE))
+
+async def import_file(args, fmt):
+    pool = open_pool(args.dir)
+    await pool.load()
+    auction_bot.backup_player_db(pool.file)
+    if args.file == "-":
+        report = await pool.import_players(sys.stdin, fmt, args.overwrite)
+    else:
+        with open(args.file, newline='', encoding='utf-8-sig') as stream:
+            report = await pool.import_players(stream, fmt, args.overwrite)
+    await pool.flush()
+    print(report.summary(limit=args.show))
+    return 1 if report.errors else 0
+
+async def export_file(args, fmt):
+    pool = open_pool(args.dir)
+    await pool.load()
+    if args.file == "-":
+        count = await pool.export_players(sys.stdout, fmt)
+    else:
+        with open(args.file, 'w', newline='', encoding='utf-8') as stream:
+            count = await pool.export_players(stream, fmt)
+    print(f"Exported {count} players", file=sys.stderr)
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("action", choices=("import", "export"))
+    parser.add_argument("file", help="A .csv or .jsonl file, or '-' for stdin/stdout")
+    parser.add_argument("--dir", default=".", help="The auction folder holding the player database")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="Override the format implied by the file name")
+    parser.add_argument("--overwrite", action="store_true", help="Replace players already in the database")
+    parser.add_argument("--show", type=int, default=50, help="Conflicts and invalid rows to list")
+    args = parser.parse_args()
+
+    fmt = args.format or auction_bot.player_file_format(args.file)
+    if fmt is None:
+        parser.error("can't tell the format from the file name; pass --format csv or --format jsonl")
+    action = import_file if args.action == "import" else export_file
+    status = asyncio.run(action(args, fmt))
+    auction_bot.STORAGE_EXECUTOR.shutdown(wait=True)
+    sys.exit(status)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""A headless league on a virtual clock, driven through the real commands
+and on_message with bench.py's stand-in Discord objects."""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+from bench import BENCH_CHANNEL_ID, FakeChannel, FakeInteraction, FakeMessage, FakeUser
+
+
+def make_player(name, ovr, base_price=1):
+    """A pool entry; base_price in millions."""
+    return {"name": name, "team": "FC Test", "ovr": ovr, "base_price": base_price * 1_000_000}
+
+
+class League:
+    def __init__(self, clock):
+        self.clock = clock
+        self.channel = FakeChannel(BENCH_CHANNEL_ID)
+        self.ctx = None
+
+    @property
+    def data(self):
+        return self.ctx.auction.data
+
+    def run(self, scenario):
+        """Runs scenario() to completion on the virtual clock."""
+        return asyncio.run(self.clock.run(scenario()))
+
+    async def open(self, managers, players, budget=100):
+        """Creates the auction with `managers` (names) and `players` (pool entries)."""
+        self.ctx = await bot.create_context(BENCH_CHANNEL_ID)
+        await self.ctx.load()
+        for name in managers:
+            self.data["managers"][name.lower()] = bot.new_manager(name, budget * 1_000_000)
+        self.ctx.auction.commit("manager", "Test managers")
+        for player in players:
+            self.ctx.player_db.put(player["name"].lower(), player)
+
+    async def command(self, name, user, *args):
+        await bot.tree.get_command(name).callback(FakeInteraction(self.channel, FakeUser(user)), *args)
+
+    async def bid(self, user, text):
+        """Types a bid (e.g. "12" or "2:12") and lets the bid consumer take it."""
+        await bot.on_message(FakeMessage(self.channel, FakeUser(user), str(text)))
+        await self.wait(0.01)
+
+    async def wait(self, seconds):
+        await self.clock.sleep(seconds)
+
+    async def restart(self, down_for):
+        """Stops the bot with its state on disk, keeps it down for `down_for`
+        seconds, and brings it back up the way on_ready does."""
+        await self.ctx.flush()
+        self.ctx.cancel_timers()
+        bot.bot.timers = bot.TimerService(self.clock) # A new process has no timers
+        bot.bot.auctions.clear()
+        await self.wait(down_for)
+        bot.load_contexts()
+        for ctx in bot.bot.auctions.values():
+            await ctx.load()
+            await bot.resume_countdowns(ctx)
+        self.ctx = bot.bot.auctions[BENCH_CHANNEL_ID]
+
+    def said(self, text):
+        return [m.content for m in self.channel.sent if m.content and text in m.content]
+
+    def roster(self, manager):
+        return [entry.name for entry in self.data["managers"][manager]["players"]]
+
+
+@pytest.fixture
+def league(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bot, "STORAGE_BACKEND", "json")
+    monkeypatch.setattr(bot, "AUCTION_CHANNEL_ID", 0)
+    monkeypatch.setattr(bot, "START_PAUSE_SECONDS", 0)
+    monkeypatch.setattr(bot, "NEXT_PLAYER_PAUSE_SECONDS", 0)
+    monkeypatch.setattr(bot.bot, "auctions", {})
+    clock = bot.VirtualClock()
+    monkeypatch.setattr(bot.bot, "clock", clock)
+    monkeypatch.setattr(bot.bot, "timers", bot.TimerService(clock))
+    league = League(clock)
+    monkeypatch.setattr(bot.bot, "get_channel", lambda channel_id: league.channel)
+    return league
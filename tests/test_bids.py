@@ -0,0 +1,32 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+
+def test_bid_consumer_survives_a_failing_burst(monkeypatch):
+    settled = []
+
+    async def settle_bids(ctx, burst):
+        settled.append(burst)
+        if len(settled) == 1:
+            raise RuntimeError("send failed")
+
+    monkeypatch.setattr(bot, "settle_bids", settle_bids)
+
+    async def main():
+        ctx = SimpleNamespace(key=1, bid_queue=asyncio.Queue())
+        consumer = asyncio.create_task(bot.process_bids(ctx))
+        for bid in ("first", "second"):
+            ctx.bid_queue.put_nowait(bid)
+            await asyncio.sleep(0.01)
+        alive = not consumer.done()
+        consumer.cancel()
+        return alive
+
+    assert asyncio.run(main())
+    assert settled == [["first"], ["second"]]
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+
+def start_in(tmp_path, monkeypatch, channel_id=0, scope='channel'):
+    """A working directory holding a single-league auction from before multi-league support."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bot, "AUCTION_CHANNEL_ID", channel_id)
+    monkeypatch.setattr(bot, "AUCTION_SCOPE", scope)
+    monkeypatch.setattr(bot, "STORAGE_BACKEND", "json")
+    monkeypatch.setattr(bot.bot, "auctions", {})
+    data = bot.get_default_data()
+    data["managers"]["jai"] = bot.new_manager("Jai", 100_000_000)
+    (tmp_path / bot.DATA_FILE).write_text(json.dumps(data))
+    (tmp_path / bot.PLAYER_DB_FILE).write_text(json.dumps({"pedri": {"name": "Pedri", "team": "X", "ovr": 85, "base_price": 1}}))
+
+
+def open_context(key, claim=False):
+    async def scenario():
+        ctx = await bot.create_context(key, claim)
+        await ctx.load()
+        return ctx
+    return asyncio.run(scenario())
+
+
+def test_first_context_takes_over_unclaimed_top_level_auction(tmp_path, monkeypatch):
+    start_in(tmp_path, monkeypatch)
+    assert bot.has_unclaimed_auction()
+
+    ctx = open_context(555, claim=True)
+    assert ctx.data_dir == os.path.join(bot.AUCTIONS_DIR, "555")
+    assert "jai" in ctx.auction.data["managers"]
+    assert "pedri" in ctx.player_db.data
+    assert not os.path.exists(bot.DATA_FILE)
+    assert not bot.has_unclaimed_auction()
+
+    other = open_context(777, claim=True) # Later leagues start fresh
+    assert other.auction.data["managers"] == {}
+
+
+def test_guild_scope_takes_over_top_level_auction(tmp_path, monkeypatch):
+    start_in(tmp_path, monkeypatch, channel_id=1234, scope='guild')
+    ctx = open_context(42, claim=True)
+    assert "jai" in ctx.auction.data["managers"]
+
+
+def test_auction_channel_keeps_top_level_files(tmp_path, monkeypatch):
+    start_in(tmp_path, monkeypatch, channel_id=1234)
+    assert not bot.has_unclaimed_auction()
+    assert bot.context_dir(1234) == '.'
+
+    ctx = open_context(1234)
+    assert "jai" in ctx.auction.data["managers"]
+    assert os.path.exists(bot.DATA_FILE)
+
+
+def interaction(channel_id, administrator=False):
+    replies = []
+    async def send_message(content, **kwargs):
+        replies.append(content)
+    return SimpleNamespace(guild_id=42, channel_id=channel_id, permissions=SimpleNamespace(administrator=administrator),
+                           response=SimpleNamespace(send_message=send_message), replies=replies)
+
+
+def test_lookups_do_not_take_over_top_level_auction(tmp_path, monkeypatch):
+    start_in(tmp_path, monkeypatch)
+    member = interaction(555)
+    assert asyncio.run(bot.require_context(member)) is None
+    admin_read = interaction(555, administrator=True)
+    assert asyncio.run(bot.require_context(admin_read)) is None
+    assert bot.has_unclaimed_auction()
+
+    non_admin_setup = asyncio.run(bot.require_context(interaction(555), create=True))
+    assert non_admin_setup.auction.data["managers"] == {} # A fresh league; the old one stays put
+    assert bot.has_unclaimed_auction()
+
+    ctx = asyncio.run(bot.require_context(interaction(777, administrator=True), create=True))
+    assert "jai" in ctx.auction.data["managers"]
+    assert not bot.has_unclaimed_auction()
+
+
+def test_configured_channel_takes_over_in_guild_scope(tmp_path, monkeypatch):
+    start_in(tmp_path, monkeypatch, channel_id=1234, scope='guild')
+    assert asyncio.run(bot.require_context(interaction(999))) is None
+    ctx = asyncio.run(bot.require_context(interaction(1234)))
+    assert "jai" in ctx.auction.data["managers"]
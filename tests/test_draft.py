@@ -0,0 +1,69 @@
+import bot
+from conftest import make_player
+
+
+def draft_data(order, cap=2, full=()):
+    data = {"player_cap": cap, "draft_order": list(order),
+            "managers": {key: bot.new_manager(key.title(), 0) for key in order}}
+    for key in full:
+        fill(data, key)
+    return data
+
+
+def fill(data, key):
+    manager = data["managers"][key]
+    while bot.get_player_count(manager) < data["player_cap"]:
+        manager["players"].append(bot.RosterEntry(f"p{len(manager['players'])}", "Someone", 80))
+
+
+def test_picks_go_round_the_ring_in_draft_order():
+    scheduler = bot.DraftScheduler(draft_data("abc"))
+    assert [scheduler.after(key) for key in "abc"] == ["b", "c", "a"]
+
+
+def test_full_teams_leave_the_rotation():
+    data = draft_data("abcd", full="c")
+    scheduler = bot.DraftScheduler(data)
+    assert len(scheduler) == 3
+    assert scheduler.after("b") == "d"
+
+    fill(data, "d") # Filled between turns, e.g. by a steal
+    assert scheduler.after("b") == "a"
+    assert len(scheduler) == 2
+
+    fill(data, "a") # The drafter's own pick filled their team
+    assert scheduler.after("a") == "b"
+    assert scheduler.after("b") == "b"
+
+
+def test_nobody_left_to_pick():
+    data = draft_data("ab")
+    scheduler = bot.DraftScheduler(data)
+    fill(data, "a")
+    fill(data, "b")
+    assert scheduler.after("a") is None
+    assert bot.DraftScheduler(data).first_from(0) is None
+
+
+def test_a_pick_outside_the_ring_resumes_from_its_seat():
+    scheduler = bot.DraftScheduler(draft_data("abcd", full="b"))
+    assert scheduler.after("b") == "c"
+    assert scheduler.first_from(1) == "c"
+    assert scheduler.first_from(3) == "d"
+
+
+def test_draft_skips_a_team_that_fills_up(league):
+    async def scenario():
+        players = [make_player(name, 80) for name in ("Gavi", "Olmo", "Pedri", "Torres", "Yamal")]
+        await league.open(["Ana", "Ben", "Cy"], players, budget=0)
+        league.data["player_cap"] = 1
+        league.ctx.auction.commit("setcap", "Cap 1")
+        await league.command("startdraft", "admin")
+        await league.command("draft", "Ana", "Gavi")  # Ana is full now
+        await league.command("draft", "Ben", "Olmo")
+        await league.command("draft", "Ana", "Pedri") # Not her turn any more
+        await league.command("draft", "Cy", "Torres")
+
+    league.run(scenario)
+    assert (league.roster("ana"), league.roster("ben"), league.roster("cy")) == (["Gavi"], ["Olmo"], ["Torres"])
+    assert "pedri" in league.ctx.player_db.data
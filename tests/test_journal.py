@@ -0,0 +1,137 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+
+def new_state(tmp_path):
+    return bot.AuctionState(str(tmp_path / "auction_data.json"), str(tmp_path / "auction_journal.jsonl"))
+
+
+def reload(tmp_path):
+    state = new_state(tmp_path)
+    asyncio.run(state.load())
+    return state.data
+
+
+def test_flush_during_compact_keeps_its_record(tmp_path, monkeypatch):
+    write_file = bot.write_file
+
+    def slow_write(file, text):
+        time.sleep(0.05) # Hold the snapshot write open so a flush can land in between
+        write_file(file, text)
+
+    monkeypatch.setattr(bot, "write_file", slow_write)
+
+    async def main():
+        state = new_state(tmp_path)
+        await state.load()
+        state.data["managers"]["jai"] = bot.new_manager("Jai", 100_000_000)
+        state.commit("addmanager")
+        await state.flush()
+
+        compacting = asyncio.create_task(state.compact())
+        await asyncio.sleep(0) # compact() is now waiting on the snapshot write
+        state.data["managers"]["jai"]["budget"] = 90_000_000
+        state.commit("sale", "Jai buys Pedri")
+        await state.flush()
+        await compacting
+
+    asyncio.run(main())
+    assert reload(tmp_path)["managers"]["jai"]["budget"] == 90_000_000
+
+
+def test_writes_run_on_the_storage_thread(tmp_path, monkeypatch):
+    threads = []
+    for name in ("write_file", "append_file"):
+        original = getattr(bot, name)
+        def record(file, text, original=original):
+            threads.append(threading.current_thread().name)
+            original(file, text)
+        monkeypatch.setattr(bot, name, record)
+
+    async def main():
+        state = new_state(tmp_path)
+        await state.load()
+        state.data["managers"]["jai"] = bot.new_manager("Jai", 100_000_000)
+        state.commit("addmanager")
+        await state.flush()   # An append
+        await state.compact() # A snapshot and journal rewrite
+        await state.undo()    # Another rewrite
+
+    asyncio.run(main())
+    assert threads and all(name.startswith("auction-io") for name in threads)
+    assert not [f for f in os.listdir(tmp_path) if f.endswith(".tmp")] # Every write was renamed into place
+    assert reload(tmp_path)["managers"] == {}
+
+
+def sell(state, budget, note):
+    state.data["managers"]["jai"]["budget"] = budget
+    state.commit("sale", note)
+
+
+def test_journal_replays_and_undo_persists(tmp_path):
+    async def main():
+        state = new_state(tmp_path)
+        await state.load()
+        state.data["managers"]["jai"] = bot.new_manager("Jai", 100_000_000)
+        state.commit("addmanager")
+        sell(state, 90_000_000, "first")
+        sell(state, 70_000_000, "second")
+        state.data["auction_state"] = "bidding"
+        state.save() # Bookkeeping after the last sale
+        await state.flush()
+
+        undone = await state.undo(2)
+        return [record["note"] for record in undone]
+
+    notes = asyncio.run(main())
+    assert notes == ["", "second", "first"] # Newest first, with the bookkeeping after them
+    data = reload(tmp_path)
+    assert data["managers"]["jai"]["budget"] == 100_000_000
+    assert data["auction_state"] == "idle"
+
+
+def test_undo_leaves_trailing_bookkeeping_alone(tmp_path):
+    async def main():
+        state = new_state(tmp_path)
+        await state.load()
+        state.data["auction_state"] = "bidding"
+        state.save()
+        undone = await state.undo()
+        await state.flush()
+        return undone
+
+    assert asyncio.run(main()) == []
+    assert reload(tmp_path)["auction_state"] == "bidding"
+
+
+def test_compaction_keeps_state_and_undo_history(tmp_path, monkeypatch):
+    monkeypatch.setattr(bot, "JOURNAL_COMPACT_RECORDS", 5)
+    monkeypatch.setattr(bot, "UNDO_HISTORY", 2)
+
+    async def main():
+        state = new_state(tmp_path)
+        await state.load()
+        state.data["managers"]["jai"] = bot.new_manager("Jai", 100_000_000)
+        state.commit("addmanager")
+        for budget in range(99, 90, -1):
+            sell(state, budget * 1_000_000, f"sale {budget}")
+        await state.flush() # Over JOURNAL_COMPACT_RECORDS: folds into the snapshot
+        return len(state._records)
+
+    assert asyncio.run(main()) == 2
+    assert reload(tmp_path)["managers"]["jai"]["budget"] == 91_000_000
+
+    async def undo_after_reload():
+        state = new_state(tmp_path)
+        await state.load()
+        return len(await state.undo(5)) # Only UNDO_HISTORY transactions are left to undo
+
+    assert asyncio.run(undo_after_reload()) == 2
+    assert reload(tmp_path)["managers"]["jai"]["budget"] == 93_000_000
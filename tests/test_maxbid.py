@@ -0,0 +1,57 @@
+import bot
+from conftest import make_player
+
+M = 1_000_000
+
+
+def league_data(**budgets):
+    return {"player_cap": 18, "managers": {key: bot.new_manager(key.title(), budget * M) for key, budget in budgets.items()}}
+
+
+def test_highest_max_bid_leads_one_step_over_the_runner_up():
+    data = league_data(ana=100, ben=100)
+    assert bot.resolve_max_bids(data, {"ana": 30 * M, "ben": 20 * M}, 5 * M, None) == (21 * M, "ana")
+    assert bot.resolve_max_bids(data, {"ana": 30 * M}, 5 * M, None) == (6 * M, "ana")
+    assert bot.resolve_max_bids(data, {"ana": 30 * M}, 29_500_000, "ben") == (30 * M, "ana") # Capped at its limit
+
+
+def test_ties_go_to_the_high_bidder_then_the_first_max_bid():
+    data = league_data(ana=100, ben=100, cy=100)
+    assert bot.resolve_max_bids(data, {"ana": 20 * M, "ben": 20 * M}, 5 * M, None) == (20 * M, "ana")
+    assert bot.resolve_max_bids(data, {"ben": 20 * M, "ana": 20 * M}, 5 * M, None) == (20 * M, "ben")
+    assert bot.resolve_max_bids(data, {"ana": 20 * M}, 20 * M, "cy") == (20 * M, "cy")
+
+
+def test_max_bids_never_go_past_budget_or_a_full_team():
+    data = league_data(ana=15, ben=100)
+    assert bot.resolve_max_bids(data, {"ana": 30 * M, "ben": 12 * M}, 5 * M, None) == (13 * M, "ana")
+    data["player_cap"] = 0
+    assert bot.resolve_max_bids(data, {"ana": 30 * M}, 5 * M, None) == (5 * M, None)
+
+
+def test_max_bid_answers_typed_bids_and_wins_the_lot(league):
+    async def scenario():
+        await league.open(["Ana", "Ben"], [make_player("Rodri", 89, 5)])
+        await league.command("start", "admin")
+        await league.command("maxbid", "Ana", 30)
+        assert (league.data["current_bid"], league.data["current_bidder"]) == (6 * M, "ana")
+        await league.bid("Ben", 12)
+        assert (league.data["current_bid"], league.data["current_bidder"]) == (13 * M, "ana")
+        await league.bid("Ben", 25)
+        await league.wait(10)
+
+    league.run(scenario)
+    assert league.roster("ana") == ["Rodri"]
+    assert league.data["managers"]["ana"]["budget"] == 74 * M
+    assert league.data.get("proxies", {}) == {} # Max bids only ever apply to one lot
+
+
+def test_max_bids_on_a_queued_player_open_its_bidding(league):
+    async def scenario():
+        await league.open(["Ana", "Ben"], [make_player("Pedri", 88, 4)])
+        await league.command("maxbid", "Ana", 10, "Pedri")
+        await league.command("maxbid", "Ben", 8, "Pedri")
+        await league.command("start", "admin")
+        return league.data["current_bid"], league.data["current_bidder"]
+
+    assert league.run(scenario) == (9 * M, "ana")
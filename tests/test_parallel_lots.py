@@ -0,0 +1,73 @@
+from conftest import make_player
+
+M = 1_000_000
+TIER_3 = [make_player(name, 80, 2) for name in ("Gavi", "Fermin", "Olmo", "Torres")]
+
+
+async def open_lots(league, budget=100, lots=3):
+    await league.open(["Ana", "Ben"], TIER_3, budget=budget)
+    league.data["parallel_lots"] = lots
+    league.ctx.auction.commit("setlots", f"{lots} parallel lots")
+    await league.command("start", "admin")
+
+
+def lot_names(league):
+    return sorted(lot["player"]["name"] for lot in league.data["lots"].values())
+
+
+def test_lots_settle_independently_and_refill(league):
+    async def scenario():
+        await open_lots(league)
+        assert league.data["auction_state"] == "lots" and len(league.data["lots"]) == 3
+        first = {number: lot["player"]["name"] for number, lot in league.data["lots"].items()}
+        await league.bid("Ana", "1:5")
+        await league.bid("Ben", "2:7")
+        await league.bid("Ana", "2:8")
+        await league.wait(6)
+        return first
+
+    first = league.run(scenario)
+    assert sorted(league.roster("ana")) == sorted([first["1"], first["2"]])
+    assert league.data["managers"]["ana"]["budget"] == 87 * M
+    assert league.roster("ben") == []
+    fourth = {player["name"] for player in TIER_3} - set(first.values())
+    assert lot_names(league) == sorted(fourth) # The fourth player took over a closed lot
+
+
+def test_bids_must_fit_alongside_leading_bids_on_other_lots(league):
+    async def scenario():
+        await open_lots(league, budget=10)
+        await league.bid("Ana", "1:6")
+        await league.bid("Ana", "2:6")
+        return league.data["lots"]["2"]["current_bidder"]
+
+    assert league.run(scenario) is None
+    assert league.said("MONEY OVER")
+    assert league.said("Leading on other lots: **$6,000,000**")
+
+
+def test_a_bare_amount_asks_which_lot(league):
+    async def scenario():
+        await open_lots(league)
+        await league.bid("Ana", "5")
+
+    league.run(scenario)
+    assert league.said("name the lot you're bidding on")
+    assert all(lot["current_bidder"] is None for lot in league.data["lots"].values())
+
+
+def test_lots_resume_after_a_restart(league):
+    async def scenario():
+        await open_lots(league, lots=2)
+        await league.bid("Ben", "1:9")
+        name = league.data["lots"]["1"]["player"]["name"]
+        await league.wait(2)
+        await league.restart(down_for=1)
+        assert league.said("countdowns for the **2** open lots continue")
+        assert league.data["lots"]["1"]["current_bidder"] == "ben"
+        await league.wait(3)
+        return name
+
+    name = league.run(scenario)
+    assert league.roster("ben") == [name]
+    assert league.data["managers"]["ben"]["budget"] == 91 * M
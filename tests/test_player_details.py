@@ -0,0 +1,68 @@
+import asyncio
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+PLAYERS = {
+    "pedri": {"name": "Pedri", "team": "BAR", "ovr": 85, "base_price": 1, "specialities": ["Playmaker"]},
+    "rodri": {"name": "Rodri", "team": "MCI", "ovr": 89, "base_price": 5, "top_stats": "Passing 90"},
+}
+
+
+def master(tmp_path):
+    file = tmp_path / bot.PLAYER_DB_FILE
+    file.write_text(json.dumps(PLAYERS, indent=4))
+    return file
+
+
+def test_loading_leaves_the_pool_file_alone(tmp_path):
+    file = master(tmp_path)
+    before = file.read_bytes()
+
+    async def main():
+        pool = bot.PlayerDatabase(str(file))
+        await pool.load()
+        await pool.export_players(io.StringIO(), "jsonl") # A read-only tool
+        return dict(pool.data), await pool.read_details("pedri")
+
+    hot, details = asyncio.run(main())
+    assert file.read_bytes() == before
+    assert hot["pedri"] == {"name": "Pedri", "team": "BAR", "ovr": 85, "base_price": 1}
+    assert details == {"specialities": ["Playmaker"]}
+    assert json.loads((tmp_path / bot.PLAYER_HOT_FILE).read_text()) == hot
+
+
+def test_pool_writes_keep_the_scouting_text(tmp_path):
+    file = master(tmp_path)
+
+    async def main():
+        pool = bot.PlayerDatabase(str(file))
+        await pool.load()
+        pool.remove("pedri", "jai")
+        await pool.flush()
+
+    asyncio.run(main())
+    assert json.loads(file.read_text()) == {"rodri": PLAYERS["rodri"]}
+
+    reloaded = bot.PlayerDatabase(str(file))
+    asyncio.run(reloaded.load())
+    assert list(reloaded.data) == ["rodri"]
+    assert reloaded.details.get("rodri") == {"top_stats": "Passing 90"}
+
+
+def test_hand_edits_to_the_pool_file_are_picked_up(tmp_path):
+    file = master(tmp_path)
+    asyncio.run(bot.PlayerDatabase(str(file)).load())
+
+    edited = dict(PLAYERS, gavi={"name": "Gavi", "team": "BAR", "ovr": 83, "base_price": 1})
+    file.write_text(json.dumps(edited))
+    os.utime(file, (os.path.getmtime(file) + 5,) * 2)
+
+    pool = bot.PlayerDatabase(str(file))
+    asyncio.run(pool.load())
+    assert "gavi" in pool.data
@@ -0,0 +1,74 @@
+import asyncio
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+
+@pytest.fixture
+def league(tmp_path, monkeypatch):
+    """A one-league working directory whose pool holds Mbappé under a raw,
+    accented key, as older pools do."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bot, "AUCTION_CHANNEL_ID", 1234)
+    monkeypatch.setattr(bot, "AUCTION_SCOPE", "channel")
+    monkeypatch.setattr(bot.bot, "auctions", {})
+    players = {"kylian mbappé": {"name": "Kylian Mbappé", "team": "RMA", "ovr": 91, "base_price": 5},
+               "pedri": {"name": "Pedri", "team": "BAR", "ovr": 85, "base_price": 1}}
+    (tmp_path / bot.PLAYER_DB_FILE).write_text(json.dumps(players))
+
+
+def run(backend, monkeypatch, scenario):
+    monkeypatch.setattr(bot, "STORAGE_BACKEND", backend)
+    async def main():
+        ctx = await bot.create_context(1234)
+        await ctx.load()
+        try:
+            return await scenario(ctx)
+        finally:
+            await ctx.player_db.flush()
+    return asyncio.run(main())
+
+
+CSV = "name,team,ovr,base_price\nKylian Mbappe,RMA,92,6\nLamine Yamal,BAR,88,2\n"
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_import_updates_player_matched_by_normalized_name(league, monkeypatch, backend):
+    async def scenario(ctx):
+        report = await ctx.player_db.import_players(io.StringIO(CSV), "csv", overwrite=True)
+        return report, dict(ctx.player_db.data)
+
+    report, pool = run(backend, monkeypatch, scenario)
+    assert (report.added, report.updated) == (1, 1)
+    assert pool["kylian mbappé"]["ovr"] == 92
+    assert "kylian mbappe" not in pool
+
+
+def test_import_without_overwrite_reports_normalized_conflict(league, monkeypatch):
+    async def scenario(ctx):
+        return await ctx.player_db.import_players(io.StringIO(CSV), "csv")
+
+    report = run("json", monkeypatch, scenario)
+    assert report.added == 1 and len(report.conflicts) == 1
+
+
+def test_sqlite_import_keeps_sold_players_sold(league, monkeypatch):
+    async def scenario(ctx):
+        ctx.player_db.remove("kylian mbappé", "jai")
+        report = await ctx.player_db.import_players(io.StringIO(CSV), "csv", overwrite=True)
+        await ctx.player_db.flush()
+        row = ctx.player_db.storage.conn.execute(
+            "SELECT ovr, owner FROM players WHERE key = ?", ("kylian mbappé",)).fetchone()
+        return report, dict(ctx.player_db.data), row
+
+    report, pool, row = run("sqlite", monkeypatch, scenario)
+    assert report.updated == 1
+    assert "kylian mbappé" not in pool and "kylian mbappe" not in pool
+    assert row == (92, "jai")
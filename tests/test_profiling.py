@@ -0,0 +1,31 @@
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+
+def test_chatter_is_not_profiled(monkeypatch):
+    timed = []
+    monkeypatch.setattr(bot.bot.metrics, "observe", lambda name, value, **labels: timed.append(labels))
+    for content in ("gg", "lol 50", "12:ab"):
+        message = SimpleNamespace(author=SimpleNamespace(bot=False), content=content)
+        asyncio.run(bot.on_message(message))
+    assert timed == []
+
+
+def test_background_tasks_start_outside_the_profile():
+    seen = []
+
+    async def probe():
+        seen.append(bot.current_profile.get())
+
+    @bot.profiled("probe")
+    async def invocation():
+        await bot.start_background_task(probe())
+
+    asyncio.run(invocation())
+    assert seen == [None]
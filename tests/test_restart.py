@@ -0,0 +1,70 @@
+from conftest import make_player
+
+PLAYERS = [make_player("Rodri", 89, 5), make_player("Pedri", 88, 4)]
+
+
+def test_lot_countdown_resumes_with_the_time_it_had_left(league):
+    async def scenario():
+        await league.open(["Ana", "Ben"], PLAYERS[:1])
+        await league.command("start", "admin")
+        await league.bid("Ana", 12)
+        await league.wait(1)
+        await league.restart(down_for=2)
+
+        assert league.said("continues with **2** seconds left")
+        assert league.data["on_the_block"]["name"] == "Rodri"
+        await league.bid("Ben", 15) # Bids still work after the restart
+        await league.wait(10)
+
+    league.run(scenario)
+    assert league.roster("ben") == ["Rodri"]
+    assert league.data["managers"]["ben"]["budget"] == 85_000_000
+    assert league.data["managers"]["ana"]["budget"] == 100_000_000
+
+
+def test_lot_that_ran_out_while_down_settles_on_resume(league):
+    async def scenario():
+        await league.open(["Ana", "Ben"], PLAYERS)
+        await league.command("start", "admin")
+        await league.bid("Ana", 12)
+        await league.restart(down_for=60)
+        await league.wait(0.1)
+
+    league.run(scenario)
+    sold = league.data["managers"]["ana"]["players"]
+    assert len(sold) == 1 and sold[0].price == 12_000_000
+    assert league.data["on_the_block"]["name"] != sold[0].name # The next lot is up
+
+
+def test_sale_is_on_disk_before_a_restart(league):
+    async def scenario():
+        await league.open(["Ana"], PLAYERS)
+        await league.command("start", "admin")
+        await league.bid("Ana", 9)
+        await league.wait(6)
+        sold = league.data["managers"]["ana"]["players"][0].name
+        await league.restart(down_for=1)
+        return sold
+
+    sold = league.run(scenario)
+    assert league.roster("ana") == [sold]
+    assert sold.lower() not in league.ctx.player_db.data
+
+
+def test_steal_window_resumes_after_a_restart(league):
+    async def scenario():
+        await league.open(["Ana", "Ben", "Cy", "Dee"], PLAYERS, budget=0)
+        league.data["managers"]["dee"]["budget"] = 50_000_000 # Someone who could steal
+        league.ctx.auction.commit("manager", "Dee's budget")
+        await league.command("startdraft", "admin")
+        await league.command("draft", "Ana", "Pedri")
+        await league.wait(5)
+        await league.restart(down_for=5)
+
+        assert league.said("continues with **5** seconds left")
+        assert league.roster("ana") == []
+        await league.wait(6)
+
+    league.run(scenario)
+    assert league.roster("ana") == ["Pedri"]
+    assert league.said("**Pedri** officially joins **Ana**")
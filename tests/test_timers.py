@@ -0,0 +1,69 @@
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bot
+
+
+def run_virtual(scenario):
+    """Runs scenario(clock, timers, fired) on a VirtualClock; returns `fired`,
+    the (timer, virtual time) of every callback that ran."""
+    clock = bot.VirtualClock()
+    timers = bot.TimerService(clock)
+    fired = []
+
+    def callback(name):
+        async def fire():
+            fired.append((name, clock.now()))
+        return fire
+
+    async def main():
+        await scenario(clock, timers, callback)
+        await clock.sleep(60) # Let everything still running come due
+    asyncio.run(clock.run(main()))
+    return fired
+
+
+def test_timers_fire_at_their_deadlines_in_order():
+    async def scenario(clock, timers, callback):
+        timers.set("b", 7, callback("b"))
+        timers.set("a", 3, callback("a"))
+        timers.set("c", 12, callback("c"))
+
+    assert run_virtual(scenario) == [("a", 3), ("b", 7), ("c", 12)]
+
+
+def test_extend_moves_the_deadline_in_place():
+    async def scenario(clock, timers, callback):
+        timers.set("lot", 5, callback("lot"))
+        await clock.sleep(3)
+        assert timers.extend("lot", 5)
+        assert timers.remaining("lot") == 5
+        await clock.sleep(4)
+        assert timers.extend("lot", 5)
+
+    assert run_virtual(scenario) == [("lot", 12)]
+
+
+def test_cancel_and_restart():
+    async def scenario(clock, timers, callback):
+        timers.set("lot", 5, callback("old"))
+        timers.set("steal", 5, callback("steal"))
+        timers.cancel("steal")
+        assert timers.remaining("steal") is None
+        assert not timers.extend("steal", 5)
+        await clock.sleep(2)
+        timers.set("lot", 5, callback("new")) # Replaces the first one
+
+    assert run_virtual(scenario) == [("new", 7)]
+
+
+def test_a_callback_can_start_the_next_timer():
+    async def scenario(clock, timers, callback):
+        async def close_lot():
+            timers.set("lot", 5, callback("next lot"))
+        timers.set("lot", 5, close_lot)
+
+    assert run_virtual(scenario) == [("next lot", 10)]